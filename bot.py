@@ -2,6 +2,12 @@
 Uma Musume Pretty Derby Discord Bot
 Main bot file with slash commands support
 """
+from utils.boot_profiler import boot_profiler
+
+# Time every import from here on (discord.py, aiohttp, the managers, ...)
+boot_profiler.start_import_timing()
+boot_profiler.begin('imports')
+
 import discord
 from discord import app_commands
 from discord.ext import commands
@@ -9,6 +15,14 @@ import asyncio
 import logging
 from pathlib import Path
 import config
+from utils.db_reader import configure_reader_pool, shutdown_reader_pool
+from utils.query_stats import query_stats
+from utils.command_sync import sync_command_tree
+from managers.locale_prefs import LocalePreferences
+from managers import GameData
+from managers.reloader import GameDataReloader
+
+boot_profiler.end('imports')
 
 # Setup logging
 logging.basicConfig(
@@ -16,6 +30,8 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger('UmaMusumeBot')
+query_stats.slow_threshold_ms = config.SLOW_QUERY_THRESHOLD_MS
+configure_reader_pool(config.DB_POOL_SIZE)
 
 # Bot intents
 intents = discord.Intents.default()
@@ -33,30 +49,113 @@ class UmaMusumeBot(commands.Bot):
             help_command=None  # Disabled default help
         )
         self.initial_extensions = []
+        self.game_data: GameData = None
+        self.game_data_task: asyncio.Task = None
+        self.reloader: GameDataReloader = None
+        self.first_response_seconds: float = None
+        self.gateway_connected = False
+        self.locale_prefs = LocalePreferences(config.LOCALE_PREFS_PATH)
 
     async def setup_hook(self):
-        """Load cogs and sync slash commands when bot starts."""
+        """Start loading game data, load cogs and sync slash commands when bot starts."""
+        # One shared set of managers for every cog, loaded in the background on
+        # the reader pool; data commands answer "warming up" until it is ready
+        boot_profiler.begin('setup_hook')
+        logger.info("Loading game data in the background...")
+        boot_profiler.begin('game data')
+        self.game_data = GameData(
+            config.DATABASE_PATH, use_snapshot=config.DATA_SNAPSHOT,
+            language=config.DATABASE_LANGUAGE, locale_paths=config.LOCALE_DATABASES
+        )
+        self.game_data_task = asyncio.create_task(self._load_game_data())
+        self.reloader = GameDataReloader(
+            self, config.DATABASE_PATH,
+            use_snapshot=config.DATA_SNAPSHOT,
+            poll_interval=config.DATABASE_WATCH_INTERVAL,
+            language=config.DATABASE_LANGUAGE,
+            locale_paths=config.LOCALE_DATABASES
+        )
+        self.tree.on_error = self.on_app_command_error
+
         logger.info("Loading cogs...")
 
         # Load all cogs from the cogs directory
-        cogs_path = Path('./cogs')
-        if cogs_path.exists():
-            for cog_file in cogs_path.glob('*.py'):
-                if cog_file.name != '__init__.py' and not cog_file.name.endswith('.backup'):
-                    cog_name = f'cogs.{cog_file.stem}'
-                    try:
-                        await self.load_extension(cog_name)
-                        logger.info(f'Loaded cog: {cog_name}')
-                    except Exception as e:
-                        logger.error(f'Failed to load cog {cog_name}: {e}')
-
-        # Sync slash commands with Discord
-        logger.info("Syncing slash commands...")
-        try:
-            synced = await self.tree.sync()
-            logger.info(f"Synced {len(synced)} slash command(s)")
-        except Exception as e:
-            logger.error(f"Failed to sync commands: {e}")
+        with boot_profiler.phase('load cogs'):
+            cogs_path = Path('./cogs')
+            if cogs_path.exists():
+                for cog_file in cogs_path.glob('*.py'):
+                    if cog_file.name != '__init__.py' and not cog_file.name.endswith('.backup'):
+                        cog_name = f'cogs.{cog_file.stem}'
+                        started = boot_profiler.now()
+                        try:
+                            await self.load_extension(cog_name)
+                            boot_profiler.record_extension(cog_name, started)
+                            logger.info(f'Loaded cog: {cog_name}')
+                        except Exception as e:
+                            boot_profiler.record_extension(cog_name, started, error=str(e))
+                            logger.error(f'Failed to load cog {cog_name}: {e}')
+
+        # Sync slash commands with Discord, skipping scopes whose command hash
+        # matches the last successful sync
+        with boot_profiler.phase('command sync'):
+            results = await sync_command_tree(
+                self.tree, config.COMMAND_SYNC_STATE_PATH,
+                mode=config.COMMAND_SYNC,
+                guild_ids=config.COMMAND_SYNC_GUILDS,
+                sync_global=config.COMMAND_SYNC_GLOBAL
+            )
+        saved = 0.0
+        for result in results:
+            if result.error:
+                logger.error(f"Failed to sync commands ({result.scope}): {result.error}")
+            elif result.synced:
+                logger.info(f"Synced {result.commands} slash command(s) ({result.scope}) in {result.seconds:.2f}s")
+            else:
+                saved += result.saved_seconds or 0.0
+                logger.info(f"Slash commands unchanged ({result.scope}, {result.commands} command(s)) - sync skipped")
+        if saved:
+            logger.info(f"Skipped command sync saved ~{saved:.2f}s of start-up")
+
+        boot_profiler.end('setup_hook')
+        boot_profiler.begin('gateway connect')
+
+    async def _load_game_data(self):
+        """Load the shared game data, log when it became ready and start watching for updates."""
+        if await self.game_data.aload():
+            boot_profiler.end('game data')
+            logger.info(f"Game data ready {boot_profiler.now():.2f}s after start")
+        else:
+            boot_profiler.end('game data', error=', '.join(self.game_data.failures) or 'failed')
+            logger.warning("Game data is incomplete - run: python utils/download_masterdb.py")
+        for name, (started, ended) in self.game_data.timings.items():
+            boot_profiler.record(f"game data: {name}", started, ended)
+        self.reloader.start_watching()
+        self._finish_boot()
+
+    def _finish_boot(self):
+        """Log the boot report once the gateway is connected and the game data has loaded."""
+        if boot_profiler.finished_at is not None or not self.gateway_connected:
+            return
+        if self.game_data is None or not (self.game_data.ready or self.game_data.failed):
+            return
+        boot_profiler.finish()
+        boot_profiler.log_report()
+
+    async def on_app_command_completion(self, interaction: discord.Interaction, command):
+        """Log time-to-first-response once after each restart."""
+        if self.first_response_seconds is None:
+            self.first_response_seconds = boot_profiler.now()
+            logger.info(
+                f"Time to first response: {self.first_response_seconds:.2f}s after start "
+                f"(/{command.qualified_name})"
+            )
+
+    async def on_app_command_error(self, interaction: discord.Interaction, error: app_commands.AppCommandError):
+        """Global error handler for slash commands."""
+        if isinstance(error, app_commands.CheckFailure):
+            return  # Already answered (e.g. the warming-up notice)
+        command = interaction.command.qualified_name if interaction.command else 'unknown'
+        logger.error(f'Error in slash command /{command}: {error}', exc_info=error)
 
     async def on_ready(self):
         """Called when bot is ready."""
@@ -64,11 +163,27 @@ class UmaMusumeBot(commands.Bot):
         logger.info(f'Bot is ready! Running discord.py version {discord.__version__}')
         logger.info(f'Connected to {len(self.guilds)} guilds')
 
+        if not self.gateway_connected:
+            self.gateway_connected = True
+            boot_profiler.end('gateway connect')
+            self._finish_boot()
+
         # Set bot presence
         await self.change_presence(
             activity=discord.Game(name="Uma Musume | Use /help")
         )
 
+    async def close(self):
+        """Shut down the bot, the shared game data and the database reader pool."""
+        await super().close()
+        if self.reloader:
+            self.reloader.stop_watching()
+        if self.game_data_task and not self.game_data_task.done():
+            self.game_data_task.cancel()
+        if self.game_data:
+            self.game_data.close()
+        shutdown_reader_pool()
+
     async def on_command_error(self, ctx, error):
         """Global error handler for prefix commands (legacy)."""
         if isinstance(error, commands.CommandNotFound):
@@ -12,7 +12,14 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from managers.character_manager import CharacterManager
 from managers.skill_manager import SkillManager
+from managers.localization import Localizer
+from managers.text_service import CATEGORY_CHARA_NAME
+from utils.readiness import require_game_data
+from managers.locale_prefs import localizer_for
+from utils.autocomplete import suggest_names
+from managers.autocomplete import KIND_CHARACTER
 from models.character import Character, CharacterCard
+from models.skill import Skill
 from constants import (
     EMOJI_SPEED, EMOJI_STAMINA, EMOJI_POWER, EMOJI_GUTS, EMOJI_WIT,
     EMOJI_FRONT_RUNNER, EMOJI_PACE_CHASER, EMOJI_LATE, EMOJI_END_CLOSER
@@ -21,10 +28,11 @@ from constants import (
 class CardSelectorView(discord.ui.View):
     """View for selecting character cards/alts."""
 
-    def __init__(self, character: Character, skill_manager: SkillManager):
+    def __init__(self, character: Character, skill_manager: SkillManager, localizer: Localizer):
         super().__init__(timeout=180)  # 3 minute timeout
         self.character = character
         self.skill_manager = skill_manager
+        self.localizer = localizer
 
         # Add a button for each card (limit to 25 buttons total - Discord limit)
         for idx, card in enumerate(character.cards[:25]):
@@ -49,7 +57,7 @@ class CardSelectorView(discord.ui.View):
         """Create a callback for a specific card button."""
         async def callback(interaction: discord.Interaction):
             # Create a new view with pagination for this card
-            detail_view = CardDetailView(self.character, card, self, self.skill_manager)
+            detail_view = CardDetailView(self.character, card, self, self.skill_manager, self.localizer)
             embed = detail_view.create_stats_embed()
             await interaction.response.edit_message(embed=embed, view=detail_view)
 
@@ -59,12 +67,14 @@ class CardSelectorView(discord.ui.View):
 class CardDetailView(discord.ui.View):
     """View for displaying card details with pagination between stats and skills."""
 
-    def __init__(self, character: Character, card: CharacterCard, parent_view: CardSelectorView, skill_manager: SkillManager):
+    def __init__(self, character: Character, card: CharacterCard, parent_view: CardSelectorView,
+                 skill_manager: SkillManager, localizer: Localizer):
         super().__init__(timeout=180)
         self.character = character
         self.card = card
         self.parent_view = parent_view
         self.skill_manager = skill_manager
+        self.localizer = localizer
         self.current_page = 0  # 0 = stats, 1 = skills
 
         # Add navigation buttons
@@ -187,8 +197,9 @@ class CardDetailView(discord.ui.View):
             await interaction.response.send_message("❌ Skill not found", ephemeral=True)
             return
 
-        # Create skill detail view
-        skill_view = SkillDetailView(selected_skill, self, self.skill_manager)
+        # Hydrate the full skill on the reader pool, then create the detail view
+        details = self.localizer.skill(await self.skill_manager.aget_by_id(selected_skill.skill_id))
+        skill_view = SkillDetailView(details, self)
         embed = skill_view.create_embed()
         await interaction.response.edit_message(embed=embed, view=skill_view)
 
@@ -366,11 +377,10 @@ class CardDetailView(discord.ui.View):
 class SkillDetailView(discord.ui.View):
     """View for displaying skill details with navigation back to card skills."""
 
-    def __init__(self, skill, card_detail_view: 'CardDetailView', skill_manager: SkillManager):
+    def __init__(self, skill: Optional[Skill], card_detail_view: 'CardDetailView'):
         super().__init__(timeout=180)
-        self.skill_obj = skill_manager.get_by_id(skill.skill_id)
+        self.skill_obj = skill  # Hydrated and localized (None if unavailable)
         self.card_detail_view = card_detail_view
-        self.skill_manager = skill_manager
 
         # Back button to return to card skills
         back_button = discord.ui.Button(label="⬅ Back to Skills", style=discord.ButtonStyle.primary)
@@ -447,27 +457,31 @@ class Characters(commands.Cog):
 
     def __init__(self, bot):
         self.bot = bot
-        self.manager = CharacterManager()
-        self.skill_manager = SkillManager()
-        # Load data on initialization
-        if not self.manager.load():
-            print("⚠️  Failed to load character data")
-        if not self.skill_manager.load():
-            print("⚠️  Failed to load skill data")
-
-    def cog_unload(self):
-        """Clean up when cog is unloaded."""
-        self.manager.close()
-        self.skill_manager.close()
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        """Answer with a warming-up notice until the shared game data is loaded."""
+        return await require_game_data(interaction)
+
+    @property
+    def manager(self) -> CharacterManager:
+        """Character manager from the shared game data."""
+        return self.bot.game_data.characters
+
+    @property
+    def skill_manager(self) -> SkillManager:
+        """Skill manager from the shared game data."""
+        return self.bot.game_data.skills
 
     @app_commands.command(name="character", description="Look up information about a character")
     @app_commands.describe(name="Character name (partial match supported)")
     async def character(self, interaction: discord.Interaction, name: str):
         """Look up information about a Uma Musume character."""
         await interaction.response.defer()
+        loc = localizer_for(interaction)
 
-        # Search for character by name
-        char = self.manager.get_by_name(name)
+        # Search for character by name (also in the user's language)
+        char = self.manager.get_by_name(name) or loc.lookup(CATEGORY_CHARA_NAME, name, self.manager.get_by_id)
+        char = loc.character(char)
 
         if not char:
             await interaction.followup.send(f"❌ Character '{name}' not found. Use `/characters` to see all available characters.")
@@ -493,11 +507,16 @@ class Characters(commands.Cog):
         embed.set_footer(text="Uma Musume Pretty Derby • Click a button to view card details")
 
         # Create view with card selection buttons
-        view = CardSelectorView(char, self.skill_manager)
+        view = CardSelectorView(char, self.skill_manager, loc)
 
         # Send with buttons
         await interaction.followup.send(embed=embed, view=view)
 
+    @character.autocomplete('name')
+    async def character_name_autocomplete(self, interaction: discord.Interaction, current: str):
+        """Suggest character names as the user types."""
+        return suggest_names(interaction, KIND_CHARACTER, current)
+
     @app_commands.command(name="characters", description="List all available characters")
     @app_commands.describe(page="Page number (default: 1)")
     async def characters(self, interaction: discord.Interaction, page: Optional[int] = 1):
@@ -531,9 +550,10 @@ class Characters(commands.Cog):
             color=config.EMBED_COLOR
         )
 
+        loc = localizer_for(interaction)
         for char in page_chars:
             embed.add_field(
-                name=f"{char.highest_rarity}★ {char.display_name}",
+                name=f"{char.highest_rarity}★ {loc.character_name(char)}",
                 value=f"ID: {char.chara_id} • {char.card_count} card(s)",
                 inline=True
             )
@@ -544,7 +564,7 @@ class Characters(commands.Cog):
     @app_commands.command(name="randomchar", description="Get a random character")
     async def random_character(self, interaction: discord.Interaction):
         """Get a random Uma Musume character."""
-        char = self.manager.get_random()
+        char = localizer_for(interaction).character(self.manager.get_random())
 
         if not char:
             await interaction.response.send_message("❌ No characters available")
@@ -595,9 +615,10 @@ class Characters(commands.Cog):
             color=0xFFD700  # Gold color
         )
 
+        loc = localizer_for(interaction)
         char_list = []
         for char in ssr_chars[:30]:  # Limit to 30
-            char_list.append(f"★★★ {char.display_name}")
+            char_list.append(f"★★★ {loc.character_name(char)}")
 
         # Split into columns
         mid = len(char_list) // 2
@@ -9,17 +9,21 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from utils.db_reader import MasterDBReader
+from utils.query_stats import query_stats
+from utils.process_stats import format_bytes, peak_rss
+from utils.boot_profiler import boot_profiler
 
 class Database(commands.Cog):
     """Database exploration and information commands."""
 
     def __init__(self, bot):
         self.bot = bot
-        self.db = MasterDBReader()
+        self.db = MasterDBReader(config.DATABASE_PATH)
         self.connected = False
 
-        # Try to connect to database
-        if self.db.connect():
+    async def cog_load(self):
+        """Connect to the database on the reader pool."""
+        if await self.db.aconnect():
             self.connected = True
             print("✅ Connected to master.mdb database")
         else:
@@ -31,6 +35,11 @@ class Database(commands.Cog):
         if self.connected:
             self.db.close()
 
+    async def cog_before_invoke(self, ctx):
+        """Pick up a replaced master.mdb before running a command."""
+        if self.connected:
+            await self.db.run_async(self.db.refresh)
+
     @commands.command(name='dbstatus', aliases=['dbinfo'])
     async def db_status(self, ctx):
         """Check database connection status."""
@@ -40,18 +49,27 @@ class Database(commands.Cog):
         )
 
         if self.connected:
-            tables = self.db.get_tables()
+            catalog = await self.db.run_async(self.db.get_catalog)
             embed.description = "✅ Connected to master.mdb"
-            embed.add_field(name="Tables", value=len(tables), inline=True)
-
-            # Get some stats
-            total_rows = 0
-            for table in tables[:10]:  # Count first 10 tables as sample
-                result = self.db.query(f"SELECT COUNT(*) as count FROM {table}")
-                if result:
-                    total_rows += result[0]['count']
-
-            embed.add_field(name="Sample Row Count", value=f"~{total_rows:,}", inline=True)
+            embed.add_field(name="Tables", value=len(catalog.tables), inline=True)
+            embed.add_field(name="Total Rows", value=f"{catalog.total_rows:,}", inline=True)
+
+            total_size = catalog.total_size
+            if total_size is not None:
+                embed.add_field(name="Size", value=f"{total_size / (1024 * 1024):,.1f} MB", inline=True)
+
+            game_data = self.bot.game_data
+            if game_data:
+                status = game_data.state.capitalize()
+                if game_data.load_seconds is not None:
+                    status += f" in {game_data.load_seconds:.2f}s"
+                if game_data.from_snapshot:
+                    status += " (snapshot)"
+                if game_data.failures:
+                    status += f"\nFailed: {', '.join(game_data.failures)}"
+                embed.add_field(name="Game Data", value=status, inline=True)
+                embed.add_field(name="Data Version", value=f"`{game_data.version or 'none'}`", inline=True)
+                embed.add_field(name="Languages", value=", ".join(game_data.languages), inline=True)
         else:
             embed.description = "❌ Not connected to database"
             embed.add_field(
@@ -69,7 +87,8 @@ class Database(commands.Cog):
             await ctx.send("❌ Database not connected. Run `!dbstatus` for info.")
             return
 
-        tables = self.db.get_tables()
+        catalog = await self.db.run_async(self.db.get_catalog)
+        tables = catalog.table_names
 
         # Filter tables if search term provided
         if search:
@@ -94,8 +113,7 @@ class Database(commands.Cog):
 
         table_list = []
         for table in page_tables:
-            result = self.db.query(f"SELECT COUNT(*) as count FROM {table}")
-            count = result[0]['count'] if result else 0
+            count = catalog.row_count(table)
             table_list.append(f"`{table}` ({count:,} rows)")
 
         embed.add_field(
@@ -127,7 +145,7 @@ class Database(commands.Cog):
             return
 
         try:
-            results = self.db.query(sql)
+            results = await self.db.aquery(sql)
 
             if not results:
                 await ctx.send("✅ Query executed successfully (0 results)")
@@ -162,6 +180,142 @@ class Database(commands.Cog):
         except Exception as e:
             await ctx.send(f"❌ Query failed: {str(e)}")
 
+    @commands.command(name='dbstats', aliases=['querystats'])
+    @commands.is_owner()
+    async def db_stats(self, ctx, action: str = None):
+        """
+        Show aggregated query timings and recent slow queries (Bot owner only).
+
+        Use `!dbstats reset` to clear the collected statistics.
+        """
+        if action == 'reset':
+            query_stats.reset()
+            await ctx.send("✅ Query statistics cleared")
+            return
+
+        summary = query_stats.summary()
+        embed = discord.Embed(
+            title="⏱️ Query Statistics",
+            description=(
+                f"{summary['calls']:,} queries • {summary['rows']:,} rows • "
+                f"{summary['total_ms']:,.1f} ms total • {summary['failures']:,} failed\n"
+                f"Slow threshold: {query_stats.slow_threshold_ms:g} ms"
+            ),
+            color=config.EMBED_COLOR
+        )
+
+        # Top statements by total time
+        top_lines = []
+        for stat in query_stats.top(5):
+            failures = f" • {stat.failures} failed" if stat.failures else ""
+            top_lines.append(
+                f"**{stat.total_ms:,.1f} ms** ({stat.calls}× • avg {stat.avg_ms:.1f} • "
+                f"max {stat.max_ms:.1f} • {stat.rows:,} rows{failures})\n"
+                f"`{stat.call_site}` `{stat.sql[:80]}`"
+            )
+        embed.add_field(
+            name="Top Queries (by total time)",
+            value="\n".join(top_lines)[:1024] or "No queries recorded",
+            inline=False
+        )
+
+        # Most recent slow queries with their plans
+        slow = query_stats.slow_queries()[-3:]
+        for entry in reversed(slow):
+            plan = "\n".join(entry.plan) or "(no plan)"
+            value = f"`{entry.call_site}` • {entry.rows:,} rows\n```\n{plan}\n```"
+            embed.add_field(
+                name=f"🐢 {entry.elapsed_ms:,.1f} ms",
+                value=value[:1024],
+                inline=False
+            )
+
+        await ctx.send(embed=embed)
+
+    @commands.command(name='reloaddata', aliases=['reload'])
+    @commands.is_owner()
+    async def reload_data(self, ctx):
+        """
+        Reload game data from master.mdb without restarting (Bot owner only).
+
+        A new set of managers is built in the background and swapped in once
+        it has loaded; commands keep answering from the old set meanwhile.
+        """
+        reloader = self.bot.reloader
+        if reloader is None:
+            await ctx.send("❌ Hot reload is not available.")
+            return
+        if reloader.reloading:
+            await ctx.send("⏳ A reload is already in progress.")
+            return
+
+        await ctx.send("🔄 Reloading game data...")
+        result = await reloader.reload("manual")
+
+        embed = discord.Embed(
+            title="🔄 Game Data Reload",
+            description="✅ Swapped in the new data" if result.success else f"❌ {result.error}",
+            color=config.SUCCESS_COLOR if result.success else config.ERROR_COLOR
+        )
+        embed.add_field(name="Duration", value=f"{result.seconds:.2f}s", inline=True)
+        embed.add_field(
+            name="Version",
+            value=f"`{result.old_version or 'none'}` → `{result.new_version or 'none'}`",
+            inline=False
+        )
+        if result.success:
+            overlap = result.overlap_bytes
+            embed.add_field(name="RSS Before", value=format_bytes(result.rss_before), inline=True)
+            embed.add_field(name="RSS Overlap", value=format_bytes(result.rss_overlap), inline=True)
+            embed.add_field(name="RSS After", value=format_bytes(result.rss_after), inline=True)
+            if overlap is not None:
+                embed.set_footer(text=f"Both data sets held {overlap / (1024 * 1024):+,.1f} MiB extra during the swap")
+
+        await ctx.send(embed=embed)
+
+    @commands.command(name='bootreport', aliases=['boot'])
+    @commands.is_owner()
+    async def boot_report(self, ctx):
+        """Show how the last start-up split between phases, cogs and imports (Bot owner only)."""
+        total = boot_profiler.finished_at
+        embed = discord.Embed(
+            title="🚀 Boot Report",
+            description=(
+                f"Booted in {total:.2f}s" if total is not None else "Still booting"
+            ) + f" • peak RSS {format_bytes(peak_rss())}",
+            color=config.EMBED_COLOR
+        )
+
+        phase_lines = []
+        for phase in boot_profiler.phases:
+            seconds = f"{phase.seconds:.3f}s" if phase.seconds is not None else "running"
+            memory = f" • {format_bytes(phase.peak_rss)} peak" if phase.peak_rss is not None else ""
+            failed = " ❌" if phase.error else ""
+            phase_lines.append(f"`{phase.name}` {seconds} @ {phase.start:.2f}s{memory}{failed}")
+        embed.add_field(name="Phases", value="\n".join(phase_lines)[:1024] or "None", inline=False)
+
+        extensions = sorted(boot_profiler.extensions.values(), key=lambda e: e.seconds, reverse=True)
+        ext_lines = [
+            f"`{ext.name}` {ext.seconds * 1000:,.0f} ms" + (" ❌" if ext.error else "")
+            for ext in extensions
+        ]
+        embed.add_field(name="Cogs", value="\n".join(ext_lines)[:1024] or "None", inline=False)
+
+        package_lines = [
+            f"`{package}` {seconds * 1000:,.0f} ms"
+            for package, seconds in list(boot_profiler.imports_by_package().items())[:8]
+        ]
+        embed.add_field(name="Imports by Package", value="\n".join(package_lines)[:1024] or "Not recorded", inline=True)
+
+        module_lines = [
+            f"`{entry.module}` {entry.own * 1000:,.0f} ms"
+            for entry in boot_profiler.top_imports(8, by='own')
+        ]
+        embed.add_field(name="Slowest Modules", value="\n".join(module_lines)[:1024] or "Not recorded", inline=True)
+
+        embed.set_footer(text=f"{len(boot_profiler.imports)} modules imported during boot")
+        await ctx.send(embed=embed)
+
     @commands.command(name='dbschema')
     async def db_schema(self, ctx, table_name: str):
         """Show the schema (columns) of a database table."""
@@ -169,7 +323,9 @@ class Database(commands.Cog):
             await ctx.send("❌ Database not connected. Run `!dbstatus` for info.")
             return
 
-        schema = self.db.get_table_schema(table_name)
+        catalog = await self.db.run_async(self.db.get_catalog)
+        table = catalog.get(table_name)
+        schema = table.columns if table else []
 
         if not schema:
             await ctx.send(f"❌ Table '{table_name}' not found or has no schema.")
@@ -177,7 +333,7 @@ class Database(commands.Cog):
 
         embed = discord.Embed(
             title=f"📋 Schema: {table_name}",
-            description=f"{len(schema)} column(s)",
+            description=f"{len(schema)} column(s) • {table.row_count:,} rows",
             color=config.EMBED_COLOR
         )
 
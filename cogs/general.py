@@ -2,8 +2,15 @@
 import discord
 from discord import app_commands
 from discord.ext import commands
+from typing import Optional
 import config
 import time
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from managers.localization import LANGUAGES, LANGUAGE_NAMES
 
 class General(commands.Cog):
     """General bot commands."""
@@ -66,7 +73,7 @@ class General(commands.Cog):
 
         embed.add_field(
             name="📊 General",
-            value="`/ping` - Check bot latency\n`/info` - Bot information\n`/help` - This message",
+            value="`/ping` - Check bot latency\n`/info` - Bot information\n`/language` - Choose the language for names\n`/help` - This message",
             inline=False
         )
 
@@ -78,7 +85,7 @@ class General(commands.Cog):
 
         embed.add_field(
             name="⚡ Skills",
-            value="`/skill` - Look up skill info\n`/skills` - List skills\n`/topskills` - Top skills",
+            value="`/skill` - Look up skill info\n`/skillsearch` - Search skill descriptions\n`/skillfilter` - Filter skills\n`/skills` - List skills\n`/topskills` - Top skills",
             inline=False
         )
 
@@ -90,13 +97,72 @@ class General(commands.Cog):
 
         embed.add_field(
             name="🏁 Races",
-            value="`/race` - Look up race info\n`/races` - List races\n`/g1races` - List G1 races",
+            value="`/race` - Look up race info\n`/races` - Filter races\n`/g1races` - List G1 races",
             inline=False
         )
 
         embed.set_footer(text="💡 Tip: Start typing / and Discord will show you all commands!")
         await interaction.response.send_message(embed=embed)
 
+    @app_commands.command(name="language", description="Choose the language for character, skill and race names")
+    @app_commands.describe(
+        language="Language to show (leave empty to see the current setting)",
+        scope="Apply to just you, or to everyone in this server (needs Manage Server)"
+    )
+    @app_commands.choices(
+        language=[app_commands.Choice(name=LANGUAGE_NAMES[lang], value=lang) for lang in LANGUAGES]
+        + [app_commands.Choice(name="Reset to default", value="reset")],
+        scope=[
+            app_commands.Choice(name="Just me", value="user"),
+            app_commands.Choice(name="This server", value="server"),
+        ]
+    )
+    async def language(self, interaction: discord.Interaction, language: Optional[str] = None, scope: str = "user"):
+        """Show or set the preferred language for game data names."""
+        prefs = self.bot.locale_prefs
+        game_data = self.bot.game_data
+        available = game_data.languages if game_data and game_data.ready else []
+
+        if language is None:
+            user_lang = prefs.get_user(interaction.user.id)
+            guild_lang = prefs.get_guild(interaction.guild_id) if interaction.guild_id else None
+            embed = discord.Embed(title="🌐 Language", color=config.EMBED_COLOR)
+            embed.add_field(name="You", value=LANGUAGE_NAMES.get(user_lang, "Default"), inline=True)
+            if interaction.guild_id:
+                embed.add_field(name="This Server", value=LANGUAGE_NAMES.get(guild_lang, "Default"), inline=True)
+            if available:
+                embed.add_field(
+                    name="Available",
+                    value=", ".join(LANGUAGE_NAMES.get(lang, lang) for lang in available),
+                    inline=False
+                )
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+            return
+
+        if scope == "server":
+            if interaction.guild is None:
+                await interaction.response.send_message("❌ Server languages can only be set in a server.", ephemeral=True)
+                return
+            if not interaction.user.guild_permissions.manage_guild:
+                await interaction.response.send_message("❌ You need the Manage Server permission to set the server language.", ephemeral=True)
+                return
+
+        value = None if language == "reset" else language
+        if scope == "server":
+            await prefs.aset_guild(interaction.guild_id, value)
+            target = "this server"
+        else:
+            await prefs.aset_user(interaction.user.id, value)
+            target = "you"
+
+        if value is None:
+            message = f"✅ Language reset to the default for {target}."
+        else:
+            message = f"✅ Names will be shown in {LANGUAGE_NAMES[value]} for {target}."
+            if available and value not in available:
+                message += f"\n⚠️ {LANGUAGE_NAMES[value]} data is not loaded right now, so names fall back to {LANGUAGE_NAMES.get(available[0], available[0])}."
+        await interaction.response.send_message(message, ephemeral=True)
+
 async def setup(bot):
     """Setup function for cog."""
     await bot.add_cog(General(bot))
@@ -5,24 +5,126 @@ from discord.ext import commands
 import config
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
+import math
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from managers.race_manager import RaceManager
+from managers.text_service import CATEGORY_RACE_NAME
+from utils.readiness import require_game_data
+from managers.locale_prefs import localizer_for
+from utils.autocomplete import suggest_names
+from managers.autocomplete import KIND_RACE
+from managers.localization import Localizer
+from models.race import Race, RaceGrade, Ground
+
+# Distance categories (see Race.distance_category) -> (shortest, longest) in meters
+DISTANCE_CATEGORIES: Dict[str, Tuple[int, Optional[int]]] = {
+    "Sprint": (0, 1399),
+    "Mile": (1400, 1799),
+    "Middle": (1800, 2399),
+    "Long": (2400, None),
+}
+
+class RaceListView(discord.ui.View):
+    """Paginated view for displaying filtered races."""
+
+    def __init__(self, races: List[Race], localizer: Localizer, filters: str,
+                 page: int = 0, per_page: int = 15):
+        super().__init__(timeout=180)
+        self.races = races
+        self.localizer = localizer
+        self.filters = filters
+        self.page = page
+        self.per_page = per_page
+        self.total_pages = math.ceil(len(races) / per_page)
+
+        # Update button states
+        self.update_buttons()
+
+    def update_buttons(self):
+        """Update button states based on current page."""
+        self.clear_items()
+
+        prev_button = discord.ui.Button(
+            label="◀ Previous",
+            style=discord.ButtonStyle.primary,
+            disabled=(self.page == 0)
+        )
+        prev_button.callback = self.previous_page
+        self.add_item(prev_button)
+
+        page_button = discord.ui.Button(
+            label=f"Page {self.page + 1}/{self.total_pages}",
+            style=discord.ButtonStyle.secondary,
+            disabled=True
+        )
+        self.add_item(page_button)
+
+        next_button = discord.ui.Button(
+            label="Next ▶",
+            style=discord.ButtonStyle.primary,
+            disabled=(self.page >= self.total_pages - 1)
+        )
+        next_button.callback = self.next_page
+        self.add_item(next_button)
+
+    async def previous_page(self, interaction: discord.Interaction):
+        """Go to previous page."""
+        if self.page > 0:
+            self.page -= 1
+            self.update_buttons()
+            await interaction.response.edit_message(embed=self.create_embed(), view=self)
+
+    async def next_page(self, interaction: discord.Interaction):
+        """Go to next page."""
+        if self.page < self.total_pages - 1:
+            self.page += 1
+            self.update_buttons()
+            await interaction.response.edit_message(embed=self.create_embed(), view=self)
+
+    def create_embed(self) -> discord.Embed:
+        """Create the race list embed for current page."""
+        embed = discord.Embed(
+            title="🏇 Races",
+            description=f"{self.filters}\n{len(self.races)} race(s) found",
+            color=config.EMBED_COLOR
+        )
+
+        start_idx = self.page * self.per_page
+        page_races = self.races[start_idx:start_idx + self.per_page]
+
+        # Localize only the races on this page
+        lines = [
+            f"{race.grade_emoji} **{race.display_name}** - {race.formatted_distance} "
+            f"{race.ground_emoji} (Track {race.track_id})"
+            for race in map(self.localizer.race, page_races)
+        ]
+        if lines:
+            embed.add_field(
+                name=f"Page {self.page + 1}/{self.total_pages}",
+                value="\n".join(lines),
+                inline=False
+            )
+
+        embed.set_footer(text=f"Uma Musume Pretty Derby • {len(self.races)} races total")
+        return embed
 
 class Races(commands.Cog):
     """Race lookup and information commands."""
 
     def __init__(self, bot):
         self.bot = bot
-        self.manager = RaceManager()
-        if not self.manager.load():
-            print("⚠️  Failed to load race data")
 
-    def cog_unload(self):
-        """Clean up when cog is unloaded."""
-        self.manager.close()
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        """Answer with a warming-up notice until the shared game data is loaded."""
+        return await require_game_data(interaction)
+
+    @property
+    def manager(self) -> RaceManager:
+        """Race manager from the shared game data."""
+        return self.bot.game_data.races
 
     @app_commands.command(name="race", description="Look up information about a race")
     @app_commands.describe(name="Race name (partial match supported)")
@@ -30,7 +132,9 @@ class Races(commands.Cog):
         """Look up information about a race."""
         await interaction.response.defer()
 
-        race = self.manager.get_by_name(name)
+        loc = localizer_for(interaction)
+        race = self.manager.get_by_name(name) or loc.lookup(CATEGORY_RACE_NAME, name, self.manager.get_by_id)
+        race = loc.race(race)
 
         if not race:
             await interaction.followup.send(f"❌ Race '{name}' not found.")
@@ -50,8 +154,20 @@ class Races(commands.Cog):
         embed.set_footer(text="Uma Musume Pretty Derby • Race Database")
         await interaction.followup.send(embed=embed)
 
-    @app_commands.command(name="races", description="List races by grade")
-    @app_commands.describe(grade="Race grade")
+    @race.autocomplete('name')
+    async def race_name_autocomplete(self, interaction: discord.Interaction, current: str):
+        """Suggest race names as the user types."""
+        return suggest_names(interaction, KIND_RACE, current)
+
+    @app_commands.command(name="races", description="List races by grade, ground, distance and track")
+    @app_commands.describe(
+        grade="Race grade",
+        ground="Turf or dirt",
+        distance="Distance category",
+        min_distance="Shortest distance in meters",
+        max_distance="Longest distance in meters",
+        track="Race track ID"
+    )
     @app_commands.choices(grade=[
         app_commands.Choice(name="🥉 Pre-Open", value=1),
         app_commands.Choice(name="🥈 Open", value=2),
@@ -59,42 +175,66 @@ class Races(commands.Cog):
         app_commands.Choice(name="🥈 G2", value=4),
         app_commands.Choice(name="🥇 G1", value=5),
     ])
-    async def races_list(self, interaction: discord.Interaction, grade: Optional[int] = None):
-        """List races, optionally filtered by grade."""
+    @app_commands.choices(ground=[
+        app_commands.Choice(name="🌱 Turf", value=1),
+        app_commands.Choice(name="🏜️ Dirt", value=2),
+    ])
+    @app_commands.choices(distance=[
+        app_commands.Choice(name=name, value=name) for name in DISTANCE_CATEGORIES
+    ])
+    async def races_list(
+        self,
+        interaction: discord.Interaction,
+        grade: Optional[int] = None,
+        ground: Optional[int] = None,
+        distance: Optional[str] = None,
+        min_distance: Optional[app_commands.Range[int, 0, 5000]] = None,
+        max_distance: Optional[app_commands.Range[int, 0, 5000]] = None,
+        track: Optional[int] = None
+    ):
+        """List races matching every chosen filter (G1 races if none is chosen)."""
         await interaction.response.defer()
 
-        if grade is not None:
-            races = self.manager.get_by_grade(grade)
-            race_obj = races[0] if races else None
-            title = f"{race_obj.grade_emoji} {race_obj.grade_name} Races" if race_obj else "Races"
-        else:
-            races = self.manager.get_g1_races()
-            title = "🥇 G1 Races"
+        if distance is not None:
+            # The category bounds narrow any explicit distance range
+            low, high = DISTANCE_CATEGORIES[distance]
+            min_distance = max(low, min_distance or 0)
+            max_distance = min((d for d in (high, max_distance) if d is not None), default=None)
 
-        if not races:
-            await interaction.followup.send("❌ No races found")
-            return
-
-        # Sort by distance
-        races.sort(key=lambda r: r.distance)
+        filters = (grade, ground, min_distance, max_distance, track)
+        if all(value is None for value in filters):
+            grade = 5
 
-        embed = discord.Embed(
-            title=title,
-            description=f"{len(races)} race(s) found",
-            color=config.EMBED_COLOR
+        races = self.manager.filter(
+            grade=grade, ground=ground, track_id=track,
+            min_distance=min_distance, max_distance=max_distance
         )
 
-        for race in races[:25]:  # Limit to 25
-            embed.add_field(
-                name=f"{race.grade_emoji} {race.display_name}",
-                value=f"{race.formatted_distance} • {race.ground_emoji} {race.ground_name}",
-                inline=True
-            )
+        if not races:
+            await interaction.followup.send("❌ No races found matching your filters.")
+            return
 
-        if len(races) > 25:
-            embed.set_footer(text=f"Showing 25 of {len(races)} races")
+        # Describe the filters in the embed
+        labels = []
+        if grade is not None:
+            labels.append(f"{RaceGrade.get_emoji(grade)} {RaceGrade.get_name(grade)}")
+        if ground is not None:
+            labels.append(f"{Ground.get_emoji(ground)} {Ground.get_name(ground)}")
+        if min_distance is not None or max_distance is not None:
+            labels.append(f"{min_distance or 0}–{max_distance if max_distance is not None else '∞'}m")
+        if track is not None:
+            labels.append(f"Track {track}")
 
-        await interaction.followup.send(embed=embed)
+        view = RaceListView(races, localizer_for(interaction), " • ".join(labels))
+        await interaction.followup.send(embed=view.create_embed(), view=view)
+
+    @races_list.autocomplete('track')
+    async def races_track_autocomplete(self, interaction: discord.Interaction, current: str):
+        """Suggest the race track IDs in the catalog."""
+        if not self.bot.game_data.ready:
+            return []
+        track_ids = [t for t in self.manager.get_track_ids() if str(t).startswith(current.strip())]
+        return [app_commands.Choice(name=str(t), value=t) for t in track_ids[:25]]
 
     @app_commands.command(name="g1races", description="List all G1 races")
     async def g1_races(self, interaction: discord.Interaction):
@@ -115,8 +255,9 @@ class Races(commands.Cog):
             color=0xFFD700
         )
 
+        loc = localizer_for(interaction)
         race_list = []
-        for race in races[:30]:  # Limit to 30
+        for race in map(loc.race, races[:30]):  # Limit to 30
             race_list.append(
                 f"🏆 **{race.display_name}** - {race.formatted_distance} {race.ground_emoji}"
             )
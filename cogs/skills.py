@@ -5,18 +5,35 @@ from discord.ext import commands
 import config
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
+import math
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from managers.skill_manager import SkillManager
+from managers.localization import Localizer
+from managers.text_service import CATEGORY_SKILL_NAME
+from utils.readiness import require_game_data
+from managers.locale_prefs import localizer_for
+from utils.autocomplete import suggest_names
+from managers.autocomplete import KIND_SKILL
+from models.skill import SkillSummary
+from constants import SKILL_ABILITY_TYPES
+from utils.skill_conditions import ConditionSyntaxError
+
+# Ability names offered by /skillfilter -> the ability types that share the name
+ABILITY_FILTERS: Dict[str, List[int]] = {}
+for _ability_type, _ability_name in SKILL_ABILITY_TYPES.items():
+    ABILITY_FILTERS.setdefault(_ability_name, []).append(_ability_type)
 
 class SkillSelectorView(discord.ui.View):
     """View for selecting a skill when multiple matches are found."""
 
-    def __init__(self, skills: list, search_query: str = ""):
+    def __init__(self, skills: list, manager: SkillManager, localizer: Localizer, search_query: str = ""):
         super().__init__(timeout=180)
         self.skills = skills
+        self.manager = manager
+        self.localizer = localizer
         self.search_query = search_query
 
         # Add a button for each skill (limit to 25 - Discord limit)
@@ -36,8 +53,12 @@ class SkillSelectorView(discord.ui.View):
     def create_skill_callback(self, skill):
         """Create a callback for a specific skill button."""
         async def callback(interaction: discord.Interaction):
-            # Create detail view with back button
-            detail_view = SkillDetailView(skill, self)
+            # Hydrate the full skill, then create detail view with back button
+            details = self.localizer.skill(await self.manager.aget_by_id(skill.skill_id))
+            if details is None:
+                await interaction.response.send_message("❌ Skill details are unavailable.", ephemeral=True)
+                return
+            detail_view = SkillDetailView(details, self)
             embed = detail_view.create_embed()
             await interaction.response.edit_message(embed=embed, view=detail_view)
 
@@ -70,6 +91,119 @@ class SkillSelectorView(discord.ui.View):
         return embed
 
 
+class SkillSearchView(SkillSelectorView):
+    """Full-text search results with a button to open each skill."""
+
+    def __init__(self, matches: list, manager: SkillManager, localizer: Localizer, search_query: str, full_text: bool):
+        super().__init__([localizer.skill(m.summary) for m in matches], manager, localizer, search_query)
+        self.matches = matches
+        self.full_text = full_text
+
+    def create_selector_embed(self) -> discord.Embed:
+        """Create the embed listing the ranked matches with their highlighted passages."""
+        embed = discord.Embed(
+            title=f"🔎 Skills matching '{self.search_query}'",
+            color=config.EMBED_COLOR
+        )
+
+        lines = []
+        for i, (match, skill) in enumerate(zip(self.matches, self.skills), 1):
+            # Highlighting is in the searched (primary) language
+            name = match.highlighted_name if self.localizer.primary else skill.display_name
+            lines.append(f"{i}. {skill.icon_emoji} {skill.rarity_stars} {name}")
+            if match.snippet:
+                lines.append(f"> {match.snippet}")
+        embed.description = "\n".join(lines)[:4096]
+
+        mode = "Full-text search" if self.full_text else "Basic search"
+        embed.set_footer(text=f"{mode} • Select a skill below")
+        return embed
+
+
+class SkillFilterView(discord.ui.View):
+    """Paginated view for displaying filtered skills."""
+
+    def __init__(self, skills: List[SkillSummary], localizer: Localizer, filters: str,
+                 page: int = 0, per_page: int = 15):
+        super().__init__(timeout=180)
+        self.skills = skills
+        self.localizer = localizer
+        self.filters = filters
+        self.page = page
+        self.per_page = per_page
+        self.total_pages = math.ceil(len(skills) / per_page)
+
+        # Update button states
+        self.update_buttons()
+
+    def update_buttons(self):
+        """Update button states based on current page."""
+        self.clear_items()
+
+        prev_button = discord.ui.Button(
+            label="◀ Previous",
+            style=discord.ButtonStyle.primary,
+            disabled=(self.page == 0)
+        )
+        prev_button.callback = self.previous_page
+        self.add_item(prev_button)
+
+        page_button = discord.ui.Button(
+            label=f"Page {self.page + 1}/{self.total_pages}",
+            style=discord.ButtonStyle.secondary,
+            disabled=True
+        )
+        self.add_item(page_button)
+
+        next_button = discord.ui.Button(
+            label="Next ▶",
+            style=discord.ButtonStyle.primary,
+            disabled=(self.page >= self.total_pages - 1)
+        )
+        next_button.callback = self.next_page
+        self.add_item(next_button)
+
+    async def previous_page(self, interaction: discord.Interaction):
+        """Go to previous page."""
+        if self.page > 0:
+            self.page -= 1
+            self.update_buttons()
+            await interaction.response.edit_message(embed=self.create_embed(), view=self)
+
+    async def next_page(self, interaction: discord.Interaction):
+        """Go to next page."""
+        if self.page < self.total_pages - 1:
+            self.page += 1
+            self.update_buttons()
+            await interaction.response.edit_message(embed=self.create_embed(), view=self)
+
+    def create_embed(self) -> discord.Embed:
+        """Create the skill list embed for current page."""
+        embed = discord.Embed(
+            title="🧮 Skill Filter",
+            description=f"{self.filters}\n{len(self.skills)} skill(s) found",
+            color=config.EMBED_COLOR
+        )
+
+        start_idx = self.page * self.per_page
+        page_skills = self.skills[start_idx:start_idx + self.per_page]
+
+        # Localize only the skills on this page
+        lines = [
+            f"{skill.icon_emoji} {skill.rarity_stars} **{skill.display_name}** ({skill.grade_value})"
+            for skill in map(self.localizer.skill, page_skills)
+        ]
+        if lines:
+            embed.add_field(
+                name=f"Page {self.page + 1}/{self.total_pages}",
+                value="\n".join(lines),
+                inline=False
+            )
+
+        embed.set_footer(text=f"Uma Musume Pretty Derby • {len(self.skills)} skills total")
+        return embed
+
+
 class SkillDetailView(discord.ui.View):
     """View for displaying skill details with back button."""
 
@@ -144,13 +278,15 @@ class Skills(commands.Cog):
 
     def __init__(self, bot):
         self.bot = bot
-        self.manager = SkillManager()
-        if not self.manager.load():
-            print("⚠️  Failed to load skill data")
 
-    def cog_unload(self):
-        """Clean up when cog is unloaded."""
-        self.manager.close()
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        """Answer with a warming-up notice until the shared game data is loaded."""
+        return await require_game_data(interaction)
+
+    @property
+    def manager(self) -> SkillManager:
+        """Skill manager from the shared game data."""
+        return self.bot.game_data.skills
 
     @app_commands.command(name="skill", description="Look up information about a skill")
     @app_commands.describe(name="Skill name (partial match supported)")
@@ -158,8 +294,13 @@ class Skills(commands.Cog):
         """Look up information about a skill."""
         await interaction.response.defer()
 
-        # Search for skills matching the query
+        # Search for skills matching the query (falling back to the user's language)
+        loc = localizer_for(interaction)
         skills = self.manager.search(name)
+        if not skills:
+            skills = [s for s in map(self.manager.get_summary, loc.match_ids(CATEGORY_SKILL_NAME, name)) if s]
+            skills.sort(key=lambda s: (s.rarity, s.grade_value), reverse=True)
+        skills = [loc.skill(s) for s in skills]
 
         if not skills:
             await interaction.followup.send(f"❌ No skills found matching '{name}'.")
@@ -167,13 +308,16 @@ class Skills(commands.Cog):
 
         # If multiple matches, show selector
         if len(skills) > 1:
-            view = SkillSelectorView(skills, name)
+            view = SkillSelectorView(skills, self.manager, loc, name)
             embed = view.create_selector_embed()
             await interaction.followup.send(embed=embed, view=view)
             return
 
         # Single match - show directly (no back button needed)
-        skill = skills[0]
+        skill = loc.skill(await self.manager.aget_by_id(skills[0].skill_id))
+        if skill is None:
+            await interaction.followup.send(f"❌ Details for '{skills[0].display_name}' are unavailable.")
+            return
         embed = discord.Embed(
             title=f"{skill.icon_emoji} {skill.display_name}",
             description=skill.description or "No description available",
@@ -221,6 +365,102 @@ class Skills(commands.Cog):
         embed.set_footer(text="Uma Musume Pretty Derby • Skill Database")
         await interaction.followup.send(embed=embed)
 
+    @skill.autocomplete('name')
+    async def skill_name_autocomplete(self, interaction: discord.Interaction, current: str):
+        """Suggest skill names as the user types."""
+        return suggest_names(interaction, KIND_SKILL, current)
+
+    @app_commands.command(name="skillsearch", description="Search skill names, descriptions and conditions")
+    @app_commands.describe(query="What the skill does, e.g. recover stamina on the final corner")
+    async def skill_search(self, interaction: discord.Interaction, query: str):
+        """Full-text search over skill names, descriptions and activation conditions."""
+        await interaction.response.defer()
+
+        matches = await self.manager.asearch_text(query)
+        if not matches:
+            await interaction.followup.send(f"❌ No skills found for '{query}'.")
+            return
+
+        view = SkillSearchView(matches, self.manager, localizer_for(interaction), query, self.manager.has_fts)
+        embed = view.create_selector_embed()
+        await interaction.followup.send(embed=embed, view=view)
+
+    @app_commands.command(name="skillfilter", description="Filter skills by rarity, ability, activation, SP cost and condition")
+    @app_commands.describe(
+        rarity="Skill rarity",
+        ability="Ability the skill has",
+        activation="Guaranteed or wisdom check",
+        unique="Character unique skills",
+        min_sp="Minimum SP cost",
+        max_sp="Maximum SP cost",
+        condition="Activation condition terms, e.g. phase>=2&corner (& = and, @ = or)"
+    )
+    @app_commands.choices(rarity=[
+        app_commands.Choice(name="⭐ R", value=1),
+        app_commands.Choice(name="⭐⭐ SR", value=2),
+        app_commands.Choice(name="⭐⭐⭐ SSR", value=3),
+    ])
+    @app_commands.choices(ability=[
+        app_commands.Choice(name=name, value=name) for name in ABILITY_FILTERS
+    ])
+    @app_commands.choices(activation=[
+        app_commands.Choice(name="Guaranteed", value=0),
+        app_commands.Choice(name="Wisdom Check", value=1),
+    ])
+    @app_commands.choices(unique=[
+        app_commands.Choice(name="Only unique skills", value=1),
+        app_commands.Choice(name="Exclude unique skills", value=0),
+    ])
+    async def skill_filter(
+        self,
+        interaction: discord.Interaction,
+        rarity: Optional[int] = None,
+        ability: Optional[str] = None,
+        activation: Optional[int] = None,
+        unique: Optional[int] = None,
+        min_sp: Optional[app_commands.Range[int, 0, 1000]] = None,
+        max_sp: Optional[app_commands.Range[int, 0, 1000]] = None,
+        condition: Optional[str] = None
+    ):
+        """List the skills matching every chosen filter."""
+        await interaction.response.defer()
+
+        try:
+            skills = self.manager.filter(
+                rarity=rarity,
+                ability_types=ABILITY_FILTERS[ability] if ability else None,
+                requires_wisdom=None if activation is None else activation == 1,
+                unique=None if unique is None else unique == 1,
+                min_sp=min_sp,
+                max_sp=max_sp,
+                condition=condition
+            )
+        except ConditionSyntaxError as e:
+            await interaction.followup.send(f"❌ {e}. Use terms like `phase>=2`, `corner` or `order<=3`.")
+            return
+
+        if not skills:
+            await interaction.followup.send("❌ No skills found matching your filters.")
+            return
+
+        # Describe the filters in the embed
+        filters = []
+        if rarity is not None:
+            filters.append('★' * rarity)
+        if ability:
+            filters.append(ability)
+        if activation is not None:
+            filters.append("Wisdom Check" if activation == 1 else "Guaranteed")
+        if unique is not None:
+            filters.append("Unique" if unique == 1 else "Not unique")
+        if min_sp is not None or max_sp is not None:
+            filters.append(f"SP {min_sp if min_sp is not None else 0}–{max_sp if max_sp is not None else '∞'}")
+        if condition:
+            filters.append(f"`{condition}`")
+
+        view = SkillFilterView(skills, localizer_for(interaction), " • ".join(filters) or "All skills")
+        await interaction.followup.send(embed=view.create_embed(), view=view)
+
     @app_commands.command(name="skills", description="List skills by rarity")
     @app_commands.describe(rarity="Skill rarity (1=R, 2=SR, 3=SSR)")
     @app_commands.choices(rarity=[
@@ -249,7 +489,8 @@ class Skills(commands.Cog):
             color=config.EMBED_COLOR
         )
 
-        for skill in skills[:25]:  # Limit to 25
+        loc = localizer_for(interaction)
+        for skill in map(loc.skill, skills[:25]):  # Limit to 25
             embed.add_field(
                 name=f"{skill.icon_emoji} {skill.rarity_stars} {skill.display_name}",
                 value=f"Grade: {skill.grade_value}",
@@ -283,8 +524,9 @@ class Skills(commands.Cog):
             color=0xFFD700
         )
 
+        loc = localizer_for(interaction)
         skill_list = []
-        for i, skill in enumerate(skills, 1):
+        for i, skill in enumerate(map(loc.skill, skills), 1):
             skill_list.append(
                 f"{i}. {skill.icon_emoji} {skill.rarity_stars} **{skill.display_name}** ({skill.grade_value})"
             )
@@ -10,6 +10,11 @@ import math
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from managers.support_card_manager import SupportCardManager
+from managers.text_service import CATEGORY_CHARA_NAME
+from utils.readiness import require_game_data
+from managers.locale_prefs import localizer_for
+from utils.autocomplete import suggest_names
+from managers.autocomplete import KIND_SUPPORT
 from models.support_card import SupportCard
 import config
 
@@ -206,13 +211,15 @@ class SupportCards(commands.Cog):
 
     def __init__(self, bot):
         self.bot = bot
-        self.manager = SupportCardManager()
-        if not self.manager.load():
-            print("⚠️  Failed to load support card data")
 
-    def cog_unload(self):
-        """Clean up when cog is unloaded."""
-        self.manager.close()
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        """Answer with a warming-up notice until the shared game data is loaded."""
+        return await require_game_data(interaction)
+
+    @property
+    def manager(self) -> SupportCardManager:
+        """Support card manager from the shared game data."""
+        return self.bot.game_data.support_cards
 
     @app_commands.command(name="support", description="Look up a specific support card")
     @app_commands.describe(name="Character name to search for")
@@ -220,8 +227,13 @@ class SupportCards(commands.Cog):
         """Look up information about a support card."""
         await interaction.response.defer()
 
-        # Search for cards by character name
+        # Search for cards by character name (falling back to the user's language)
+        loc = localizer_for(interaction)
         cards = self.manager.get_by_character_name(name)
+        if not cards:
+            for chara_id in loc.match_ids(CATEGORY_CHARA_NAME, name):
+                cards.extend(self.manager.get_by_character_id(chara_id))
+        cards = [loc.support_card(c) for c in cards]
 
         if not cards:
             await interaction.followup.send(f"❌ No support cards found for '{name}'.")
@@ -257,6 +269,11 @@ class SupportCards(commands.Cog):
         embed = view.create_selector_embed()
         await interaction.followup.send(embed=embed, view=view)
 
+    @support.autocomplete('name')
+    async def support_name_autocomplete(self, interaction: discord.Interaction, current: str):
+        """Suggest names of characters with support cards as the user types."""
+        return suggest_names(interaction, KIND_SUPPORT, current)
+
     @app_commands.command(name="supports", description="List all support cards with pagination")
     @app_commands.describe(
         rarity="Filter by rarity (1=R, 2=SR, 3=SSR)",
@@ -298,7 +315,8 @@ class SupportCards(commands.Cog):
             return
 
         # Create paginated view
-        view = SupportCardListView(cards)
+        loc = localizer_for(interaction)
+        view = SupportCardListView([loc.support_card(c) for c in cards])
         embed = view.create_embed()
         await interaction.followup.send(embed=embed, view=view)
 
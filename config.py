@@ -16,6 +16,23 @@ BOT_VERSION = '2.0.0'
 # Database Configuration
 DATABASE_PATH = os.getenv('DATABASE_PATH', './data/master.mdb')
 DATABASE_LANGUAGE = os.getenv('DATABASE_LANGUAGE', 'auto')  # 'en', 'jp', or 'auto'
+# Extra languages, e.g. "jp=./data/jp/master.mdb" (only their text tables are loaded)
+LOCALE_DATABASES = {
+    lang.strip().lower(): path.strip()
+    for lang, path in (entry.split('=', 1) for entry in os.getenv('LOCALE_DATABASES', '').split(',') if '=' in entry)
+    if lang.strip() and path.strip()
+}
+LOCALE_PREFS_PATH = os.getenv('LOCALE_PREFS_PATH', './data/locale_prefs.json')  # Per-user / per-server language choices
+SLOW_QUERY_THRESHOLD_MS = float(os.getenv('SLOW_QUERY_THRESHOLD_MS', '100'))  # Log + EXPLAIN queries slower than this
+DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', '4'))  # Reader threads (each reader opens at most one connection per thread)
+DATA_SNAPSHOT = os.getenv('DATA_SNAPSHOT', 'true').lower() == 'true'  # Warm-start from a binary snapshot of the loaded data
+DATABASE_WATCH_INTERVAL = float(os.getenv('DATABASE_WATCH_INTERVAL', '30'))  # Seconds between checks for a new master.mdb (0 = off)
+
+# Slash Command Sync
+COMMAND_SYNC = os.getenv('COMMAND_SYNC', 'auto').lower()  # 'auto' (only when commands changed), 'always' or 'off'
+COMMAND_SYNC_GLOBAL = os.getenv('COMMAND_SYNC_GLOBAL', 'true').lower() == 'true'
+COMMAND_SYNC_GUILDS = [int(g) for g in os.getenv('COMMAND_SYNC_GUILDS', '').split(',') if g.strip()]  # Staging guild IDs
+COMMAND_SYNC_STATE_PATH = os.getenv('COMMAND_SYNC_STATE_PATH', './data/command_sync.json')
 
 # Colors for embeds (Uma Musume theme)
 EMBED_COLOR = 0xFF69B4  # Hot pink, matching Uma Musume's vibrant theme
@@ -155,3 +155,91 @@ def get_rarity_emoji(rarity: int) -> str:
     elif rarity == 1:
         return EMOJI_R
     return f"★{rarity}"  # Fallback for unexpected rarities
+
+# Official English names of the characters, keyed by their Japanese names
+# (used for name search keys and by add_english_names.py)
+CHARACTER_NAMES_EN = {
+    "スペシャルウィーク": "Special Week",
+    "サイレンススズカ": "Silence Suzuka",
+    "トウカイテイオー": "Tokai Teio",
+    "マルゼンスキー": "Maruzensky",
+    "フジキセキ": "Fujikiseki",
+    "オグリキャップ": "Oguri Cap",
+    "ゴールドシップ": "Gold Ship",
+    "ウオッカ": "Vodka",
+    "ダイワスカーレット": "Daiwa Scarlet",
+    "タイキシャトル": "Taiki Shuttle",
+    "グラスワンダー": "Grass Wonder",
+    "ヒシアマゾン": "Hishi Amazon",
+    "メジロマックイーン": "Mejiro McQueen",
+    "エルコンドルパサー": "El Condor Pasa",
+    "テイエムオペラオー": "T.M. Opera O",
+    "ナリタブライアン": "Narita Brian",
+    "シンボリルドルフ": "Symboli Rudolf",
+    "エアグルーヴ": "Air Groove",
+    "アグネスデジタル": "Agnes Digital",
+    "セイウンスカイ": "Seiun Sky",
+    "タマモクロス": "Tamamo Cross",
+    "ファインモーション": "Fine Motion",
+    "ビワハヤヒデ": "Biwa Hayahide",
+    "マチカネタンホイザ": "Matikane Tannhauser",
+    "マヤノトップガン": "Mayano Top Gun",
+    "マンハッタンカフェ": "Manhattan Cafe",
+    "ミホノブルボン": "Mihono Bourbon",
+    "メジロライアン": "Mejiro Ryan",
+    "ヒシアケボノ": "Hishi Akebono",
+    "ユキノビジン": "Yukino Bijin",
+    "ライスシャワー": "Rice Shower",
+    "アイネスフウジン": "Ines Fujin",
+    "アグネスタキオン": "Agnes Tachyon",
+    "アドマイヤベガ": "Admire Vega",
+    "イナリワン": "Inari One",
+    "ウイニングチケット": "Winning Ticket",
+    "エアシャカール": "Air Shakur",
+    "エイシンフラッシュ": "Eishin Flash",
+    "カレンチャン": "Kare Chan",
+    "カワカミプリンセス": "Kawakami Princess",
+    "ゴールドシチー": "Gold City",
+    "サクラバクシンオー": "Sakura Bakushin O",
+    "シンコウウインディ": "Shinko Windy",
+    "スイープトウショウ": "Sweep Tosho",
+    "スーパークリーク": "Super Creek",
+    "スマートファルコン": "Smart Falcon",
+    "ゼンノロブロイ": "Zenno Rob Roy",
+    "トーセンジョーダン": "Tosen Jordan",
+    "ナリタタイシン": "Narita Taishin",
+    "ナカヤマフェスタ": "Nakayama Festa",
+    "ハッピーミーク": "Happy Meek",
+    "バンブーメモリー": "Bamboo Memory",
+    "ハルウララ": "Haru Urara",
+    "ハクノイエロ": "Hakuno D'Or",
+    "ビコーペガサス": "Biko Pegasus",
+    "マーベラスサンデー": "Marvelous Sunday",
+    "メジロパーマー": "Mejiro Palmer",
+    "メジロドーベル": "Mejiro Dober",
+    "ヤマニンゼファー": "Yamanin Zephyr",
+    "ヤエノムテキ": "Yaeno Muteki",
+    "ライクリー": "Like Lily",
+    "ワンダーアキュート": "Wonder Acute",
+    "ニシノフラワー": "Nishino Flower",
+    "ツインターボ": "Twin Turbo",
+    "ツルマルツヨシ": "Tsurumaru Tsuyoshi",
+    "ナイスネイチャ": "Nice Nature",
+    "キングヘイロー": "King Halo",
+    "マチカネフクキタル": "Matikane Fukukitaru",
+    "ミスターシービー": "Mr. C.B.",
+    "アストンマーチャン": "Aston Machan",
+    "メジロブライト": "Mejiro Bright",
+    "メジロアルダン": "Mejiro Ardan",
+    "サクラチヨノオー": "Sakura Chiyono O",
+    "イクノディクタス": "Ikuno Dictus",
+    "ゴッドアフェクシオン": "God Affection",
+    "レベッカ": "Rebecca",
+    "ドゥラメンテ": "Duramente",
+    "キタサンブラック": "Kitasan Black",
+    "サトノダイヤモンド": "Satono Diamond",
+    "シリウスシンボリ": "Sirius Symboli",
+    "ナリタトップロード": "Narita Top Road",
+    "メジロラモーヌ": "Mejiro Ramonu",
+    "ケイエスミラクル": "K.S. Miracle",
+}
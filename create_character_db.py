@@ -28,13 +28,11 @@ LEFT JOIN text_data t ON t.category = 6 AND t.[index] = c.chara_id
 ORDER BY c.chara_id, c.default_rarity DESC
 """
 
-characters = db.query(query)
-
-print(f"Found {len(characters)} character cards\n")
-
-# Group by character
+# Group by character (rows are streamed in batches)
 char_dict = {}
-for char in characters:
+card_count = 0
+for char in db.iter_query(query):
+    card_count += 1
     chara_id = char['chara_id']
     if chara_id not in char_dict:
         char_dict[chara_id] = {
@@ -52,6 +50,8 @@ for char in characters:
         'running_style': char['running_style']
     })
 
+print(f"Found {card_count} character cards\n")
+
 # Convert to list
 characters_list = list(char_dict.values())
 
@@ -3,10 +3,15 @@ from .character_manager import CharacterManager
 from .skill_manager import SkillManager
 from .support_card_manager import SupportCardManager
 from .race_manager import RaceManager
+from .text_service import TextService, get_text_service
+from .game_data import GameData
 
 __all__ = [
     'CharacterManager',
     'SkillManager',
     'SupportCardManager',
     'RaceManager',
+    'TextService',
+    'get_text_service',
+    'GameData',
 ]
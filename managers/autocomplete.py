@@ -0,0 +1,140 @@
+"""
+Name suggestions for the lookup commands' autocomplete.
+
+Autocomplete fires on every keystroke, so it is answered from PrefixIndex
+objects (utils/prefix_index.py) built once per kind and language from the
+managers' name indexes instead of scanning the names each time. Each name
+is indexed under its search keys (utils/name_keys.py), so kana, romaji and
+curated English/Japanese character names all complete. Suggested values
+are the names themselves, which the commands then match exactly.
+"""
+import threading
+import sys
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Tuple
+import logging
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from managers.localization import Localizer
+from managers.text_service import CATEGORY_CHARA_NAME
+from utils.name_keys import character_aliases, name_keys
+from utils.prefix_index import PrefixIndex
+
+logger = logging.getLogger('UmaMusumeBot.Autocomplete')
+
+KIND_CHARACTER = 'character'
+KIND_SKILL = 'skill'
+KIND_RACE = 'race'
+KIND_SUPPORT = 'support'
+
+# Discord shows at most 25 choices
+MAX_SUGGESTIONS = 25
+
+Entries = Iterator[Tuple[str, str, float]]
+
+def _character_entries(game_data, loc: Localizer) -> Entries:
+    """Characters, more cards first."""
+    manager = game_data.characters
+    for chara_id in manager.name_index.values():
+        char = manager.characters[chara_id]
+        name = loc.character_name(char)
+        yield name, name, len(char.cards)
+
+def _skill_entries(game_data, loc: Localizer) -> Entries:
+    """One entry per skill name (its best version), rarer and higher grade first."""
+    manager = game_data.skills
+    best: Dict[str, Tuple[str, str, float]] = {}
+    for skill_ids in manager.name_index.values():
+        for skill_id in skill_ids:
+            summary = manager.skills[skill_id]
+            name = loc.skill_name(summary)
+            weight = summary.rarity * 1_000_000 + summary.grade_value
+            key = name.casefold()
+            if key not in best or weight > best[key][2]:
+                best[key] = (name, name, weight)
+    yield from best.values()
+
+def _race_entries(game_data, loc: Localizer) -> Entries:
+    """Races, higher grades first."""
+    manager = game_data.races
+    for race_id in manager.name_index.values():
+        race = manager.races[race_id]
+        name = loc.race_name(race)
+        yield name, name, race.grade
+
+def _support_entries(game_data, loc: Localizer) -> Entries:
+    """Characters that have support cards, more cards first."""
+    manager = game_data.support_cards
+    for card_ids in manager.character_index.values():
+        card = manager.cards[card_ids[0]]
+        name = loc.text(CATEGORY_CHARA_NAME, card.chara_id, card.character_name)
+        yield name, name, len(card_ids)
+
+def _character_keys(name: str) -> List[str]:
+    """Search keys of a character name, including its curated counterpart."""
+    return name_keys(name, character_aliases(name))
+
+BUILDERS: Dict[str, Callable[..., Entries]] = {
+    KIND_CHARACTER: _character_entries,
+    KIND_SKILL: _skill_entries,
+    KIND_RACE: _race_entries,
+    KIND_SUPPORT: _support_entries,
+}
+
+# Search keys of each kind's names
+KEYS: Dict[str, Callable[[str], List[str]]] = {
+    KIND_CHARACTER: _character_keys,
+    KIND_SKILL: name_keys,
+    KIND_RACE: name_keys,
+    KIND_SUPPORT: _character_keys,
+}
+
+class NameCompleter:
+    """Prefix indexes over a GameData's names, one per kind and language."""
+
+    def __init__(self, game_data):
+        """
+        Initialize the completer (indexes are built by warm() or on first use).
+
+        Args:
+            game_data: Loaded GameData
+        """
+        self.game_data = game_data
+        self._indexes: Dict[Tuple[str, str], PrefixIndex] = {}
+        self._lock = threading.Lock()
+
+    def index(self, kind: str, loc: Localizer) -> PrefixIndex:
+        """Get (building it the first time) the index for a kind in a language."""
+        key = (kind, loc.language)
+        index = self._indexes.get(key)
+        if index is None:
+            with self._lock:
+                index = self._indexes.get(key)
+                if index is None:
+                    index = PrefixIndex(BUILDERS[kind](self.game_data, loc), keys=KEYS[kind])
+                    self._indexes[key] = index
+        return index
+
+    def warm(self):
+        """Build every index for every loaded language."""
+        for language in self.game_data.languages:
+            loc = self.game_data.localizer(language)
+            for kind in BUILDERS:
+                self.index(kind, loc)
+        logger.info(f"Built {len(self._indexes)} autocomplete indexes")
+
+    def complete(self, kind: str, query: str, loc: Localizer, limit: int = MAX_SUGGESTIONS) -> List[str]:
+        """
+        Suggest names for what has been typed so far.
+
+        Args:
+            kind: KIND_CHARACTER, KIND_SKILL, KIND_RACE or KIND_SUPPORT
+            query: Text typed so far
+            loc: Localizer for the user's language
+            limit: Maximum number of suggestions
+
+        Returns:
+            Names, best match first
+        """
+        return [value for _, value in self.index(kind, loc).complete(query, limit)]
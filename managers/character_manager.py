@@ -8,6 +8,9 @@ import logging
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from utils.db_reader import MasterDBReader
+from utils.fuzzy_index import FuzzyIndex
+from utils.name_keys import NameKeyIndex, character_aliases
+from managers.text_service import TextService, get_text_service
 from models.character import Character, CharacterCard, CardSkill
 
 logger = logging.getLogger('UmaMusumeBot.CharacterManager')
@@ -15,17 +18,25 @@ logger = logging.getLogger('UmaMusumeBot.CharacterManager')
 class CharacterManager:
     """Manages character data from the database."""
 
-    def __init__(self, db_path: str = "./data/master.mdb"):
+    # Loaded state captured by managers/snapshot.py
+    SNAPSHOT_FIELDS = ('characters', 'name_index', 'card_index')
+
+    def __init__(self, db_path: str = "./data/master.mdb", text_service: Optional[TextService] = None):
         """
         Initialize the character manager.
 
         Args:
             db_path: Path to the master.mdb file (English version)
+            text_service: Shared text lookups (defaults to the shared service for db_path)
         """
         self.db_path = db_path
-        self.db = MasterDBReader(db_path)
+        self.db = MasterDBReader(db_path, attach_sidecar=True)
+        self.texts = text_service or get_text_service(db_path)
         self.characters: Dict[int, Character] = {}
         self.name_index: Dict[str, int] = {}  # name -> chara_id
+        self.card_index: Dict[int, CharacterCard] = {}  # card_id -> card
+        self._keys: Optional[NameKeyIndex] = None
+        self._fuzzy: Optional[FuzzyIndex] = None
         self._loaded = False
 
     def load(self) -> bool:
@@ -38,70 +49,18 @@ class CharacterManager:
         if self._loaded:
             return True
 
-        if not self.db.connect():
+        if not self.db.connect() or not self.texts.load():
             logger.error("Failed to connect to database")
             return False
 
         try:
-            # Query for all characters with their cards and base stats
-            query = """
-            SELECT
-                c.id as card_id,
-                c.chara_id,
-                c.default_rarity,
-                c.running_style,
-                c.talent_speed,
-                c.talent_stamina,
-                c.talent_pow,
-                c.talent_guts,
-                c.talent_wiz,
-                cd.birth_year,
-                cd.birth_month,
-                cd.birth_day,
-                cd.image_color_main,
-                cd.image_color_sub,
-                cd.height,
-                cr_default.speed as base_speed,
-                cr_default.stamina as base_stamina,
-                cr_default.pow as base_pow,
-                cr_default.guts as base_guts,
-                cr_default.wiz as base_wiz,
-                cr_max.speed as max_base_speed,
-                cr_max.stamina as max_base_stamina,
-                cr_max.pow as max_base_pow,
-                cr_max.guts as max_base_guts,
-                cr_max.wiz as max_base_wiz,
-                cr_default.proper_distance_short as apt_distance_short,
-                cr_default.proper_distance_mile as apt_distance_mile,
-                cr_default.proper_distance_middle as apt_distance_middle,
-                cr_default.proper_distance_long as apt_distance_long,
-                cr_default.proper_running_style_nige as apt_style_front_runner,
-                cr_default.proper_running_style_senko as apt_style_pace_chaser,
-                cr_default.proper_running_style_sashi as apt_style_late,
-                cr_default.proper_running_style_oikomi as apt_style_end_closer,
-                cr_default.proper_ground_turf as apt_ground_turf,
-                cr_default.proper_ground_dirt as apt_ground_dirt,
-                t_card.text as card_title,
-                t_name.text as chara_name
-            FROM card_data c
-            JOIN chara_data cd ON c.chara_id = cd.id
-            LEFT JOIN card_rarity_data cr_default ON c.id = cr_default.card_id AND cr_default.rarity = c.default_rarity
-            LEFT JOIN card_rarity_data cr_max ON c.id = cr_max.card_id AND cr_max.rarity = 5
-            LEFT JOIN text_data t_card ON t_card.category = 5 AND t_card.[index] = c.id
-            LEFT JOIN text_data t_name ON t_name.category = 6 AND t_name.[index] = c.chara_id
-            WHERE c.default_rarity > 0
-            ORDER BY c.chara_id, c.default_rarity DESC
-            """
-
-            results = self.db.query(query)
-
-            # Group by character
-            for row in results:
-                chara_id = row['chara_id']
+            # Group by character (rows are streamed in batches)
+            for row in self.db.iter_named('characters.cards'):
+                chara_id = row.chara_id
 
                 # Create character if doesn't exist
                 if chara_id not in self.characters:
-                    chara_name = row.get('chara_name')
+                    chara_name = self.texts.chara_name(chara_id)
                     if not chara_name:
                         # Skip characters without names
                         logger.warning(f"Character {chara_id} has no name, skipping")
@@ -111,12 +70,12 @@ class CharacterManager:
                         chara_id=chara_id,
                         name=chara_name,
                         name_en=chara_name,
-                        birth_year=row['birth_year'],
-                        birth_month=row['birth_month'],
-                        birth_day=row['birth_day'],
-                        color_main=row['image_color_main'],
-                        color_sub=row['image_color_sub'],
-                        height=row['height'],
+                        birth_year=row.birth_year,
+                        birth_month=row.birth_month,
+                        birth_day=row.birth_day,
+                        color_main=row.image_color_main,
+                        color_sub=row.image_color_sub,
+                        height=row.height,
                         cards=[]
                     )
                     self.characters[chara_id] = char
@@ -126,42 +85,43 @@ class CharacterManager:
 
                 # Add card with base stats and aptitudes
                 # Strip brackets from card title (category 5 has format [Title])
-                card_title_raw = row.get('card_title')
+                card_title_raw = self.texts.card_title(row.card_id)
                 card_title = card_title_raw.strip('[]') if card_title_raw else None
 
                 card = CharacterCard(
-                    card_id=row['card_id'],
+                    card_id=row.card_id,
                     chara_id=chara_id,
-                    rarity=row['default_rarity'],
-                    running_style=row['running_style'],
-                    talent_speed=row['talent_speed'],
-                    talent_stamina=row['talent_stamina'],
-                    talent_power=row['talent_pow'],
-                    talent_guts=row['talent_guts'],
-                    talent_wit=row['talent_wiz'],
+                    rarity=row.default_rarity,
+                    running_style=row.running_style,
+                    talent_speed=row.talent_speed,
+                    talent_stamina=row.talent_stamina,
+                    talent_power=row.talent_pow,
+                    talent_guts=row.talent_guts,
+                    talent_wit=row.talent_wiz,
                     card_title=card_title,
-                    base_speed=row.get('base_speed'),
-                    base_stamina=row.get('base_stamina'),
-                    base_power=row.get('base_pow'),
-                    base_guts=row.get('base_guts'),
-                    base_wit=row.get('base_wiz'),
-                    max_base_speed=row.get('max_base_speed'),
-                    max_base_stamina=row.get('max_base_stamina'),
-                    max_base_power=row.get('max_base_pow'),
-                    max_base_guts=row.get('max_base_guts'),
-                    max_base_wit=row.get('max_base_wiz'),
-                    apt_distance_short=row.get('apt_distance_short'),
-                    apt_distance_mile=row.get('apt_distance_mile'),
-                    apt_distance_middle=row.get('apt_distance_middle'),
-                    apt_distance_long=row.get('apt_distance_long'),
-                    apt_style_front_runner=row.get('apt_style_front_runner'),
-                    apt_style_pace_chaser=row.get('apt_style_pace_chaser'),
-                    apt_style_late=row.get('apt_style_late'),
-                    apt_style_end_closer=row.get('apt_style_end_closer'),
-                    apt_ground_turf=row.get('apt_ground_turf'),
-                    apt_ground_dirt=row.get('apt_ground_dirt')
+                    base_speed=row.base_speed,
+                    base_stamina=row.base_stamina,
+                    base_power=row.base_pow,
+                    base_guts=row.base_guts,
+                    base_wit=row.base_wiz,
+                    max_base_speed=row.max_base_speed,
+                    max_base_stamina=row.max_base_stamina,
+                    max_base_power=row.max_base_pow,
+                    max_base_guts=row.max_base_guts,
+                    max_base_wit=row.max_base_wiz,
+                    apt_distance_short=row.apt_distance_short,
+                    apt_distance_mile=row.apt_distance_mile,
+                    apt_distance_middle=row.apt_distance_middle,
+                    apt_distance_long=row.apt_distance_long,
+                    apt_style_front_runner=row.apt_style_front_runner,
+                    apt_style_pace_chaser=row.apt_style_pace_chaser,
+                    apt_style_late=row.apt_style_late,
+                    apt_style_end_closer=row.apt_style_end_closer,
+                    apt_ground_turf=row.apt_ground_turf,
+                    apt_ground_dirt=row.apt_ground_dirt
                 )
                 self.characters[chara_id].cards.append(card)
+                self.card_index[card.card_id] = card
 
             # Load skills for all cards
             self._load_skills()
@@ -177,52 +137,19 @@ class CharacterManager:
     def _load_skills(self):
         """Load skills for all character cards."""
         try:
-            # Build a mapping of card_id -> available_skill_set_id
-            card_skill_sets = {}
-            for char in self.characters.values():
-                for card in char.cards:
-                    card_skill_sets[card.card_id] = card.card_id  # available_skill_set_id = card_id
-
-            # Load all skills for these cards
-            if card_skill_sets:
-                card_ids = list(card_skill_sets.keys())
-                placeholders = ','.join('?' * len(card_ids))
-
-                query = f"""
-                SELECT
-                    a.available_skill_set_id,
-                    a.skill_id,
-                    a.need_rank,
-                    t.text as skill_name,
-                    s.icon_id
-                FROM available_skill_set a
-                LEFT JOIN text_data t ON t.category = 47 AND t.[index] = a.skill_id
-                LEFT JOIN skill_data s ON s.id = a.skill_id
-                WHERE a.available_skill_set_id IN ({placeholders})
-                ORDER BY a.available_skill_set_id, a.need_rank
-                """
-
-                # Use parameterized query
-                skills = self.db.query(query, tuple(card_ids))
-
-                # Group skills by card_id
-                for skill_row in skills:
-                    card_id = skill_row['available_skill_set_id']
-
-                    # Find the card and add the skill
-                    for char in self.characters.values():
-                        for card in char.cards:
-                            if card.card_id == card_id:
-                                skill = CardSkill(
-                                    skill_id=skill_row['skill_id'],
-                                    skill_name=skill_row['skill_name'] or f"Skill {skill_row['skill_id']}",
-                                    need_rank=skill_row['need_rank'],
-                                    icon_id=skill_row.get('icon_id', 0)
-                                )
-                                card.skills.append(skill)
-                                break
-
-                logger.info(f"Loaded skills for cards")
+            # available_skill_set_id = card_id, joined against card_data in the query
+            for skill_row in self.db.iter_named('characters.card_skills'):
+                card = self.card_index.get(skill_row.card_id)
+                if card is None:
+                    continue  # Card of a skipped (unnamed) character
+                card.skills.append(CardSkill(
+                    skill_id=skill_row.skill_id,
+                    skill_name=self.texts.skill_name(skill_row.skill_id) or f"Skill {skill_row.skill_id}",
+                    need_rank=skill_row.need_rank,
+                    icon_id=skill_row.icon_id
+                ))
+
+            logger.info(f"Loaded skills for cards")
 
             # Load unique skills from skill_set via card_rarity_data
             # Unique skills are unlocked at rarity 3+
@@ -234,58 +161,41 @@ class CharacterManager:
     def _load_unique_skills(self):
         """Load unique skills for character cards from skill_set table."""
         try:
-            if not self.characters:
-                return
-
-            card_ids = []
-            for char in self.characters.values():
-                for card in char.cards:
-                    card_ids.append(card.card_id)
-
-            if not card_ids:
-                return
-
-            placeholders = ','.join('?' * len(card_ids))
-
-            # Query for unique skills from skill_set via card_rarity_data
-            # We'll get the skill_set for rarity 3 (where unique skills unlock)
-            query = f"""
-            SELECT
-                cr.card_id,
-                ss.skill_id1 as unique_skill_id,
-                t.text as skill_name,
-                s.icon_id
-            FROM card_rarity_data cr
-            JOIN skill_set ss ON cr.skill_set = ss.id
-            LEFT JOIN text_data t ON t.category = 47 AND t.[index] = ss.skill_id1
-            LEFT JOIN skill_data s ON s.id = ss.skill_id1
-            WHERE cr.card_id IN ({placeholders})
-              AND cr.rarity = 3
-              AND ss.skill_id1 > 0
-            """
-
-            unique_skills = self.db.query(query, tuple(card_ids))
-
-            # Add unique skills to cards
-            for skill_row in unique_skills:
-                card_id = skill_row['card_id']
-
-                # Find the card and set the unique skill
-                for char in self.characters.values():
-                    for card in char.cards:
-                        if card.card_id == card_id:
-                            card.unique_skill = CardSkill(
-                                skill_id=skill_row['unique_skill_id'],
-                                skill_name=skill_row['skill_name'] or f"Skill {skill_row['unique_skill_id']}",
-                                need_rank=0,  # Unique skills unlock at rarity 3, not bond level
-                                icon_id=skill_row.get('icon_id', 0)
-                            )
-                            break
+            for skill_row in self.db.iter_named('characters.card_unique_skills'):
+                card = self.card_index.get(skill_row.card_id)
+                if card is None:
+                    continue
+                card.unique_skill = CardSkill(
+                    skill_id=skill_row.unique_skill_id,
+                    skill_name=self.texts.skill_name(skill_row.unique_skill_id) or f"Skill {skill_row.unique_skill_id}",
+                    need_rank=0,  # Unique skills unlock at rarity 3, not bond level
+                    icon_id=skill_row.icon_id
+                )
 
             logger.info(f"Loaded unique skills for cards")
         except Exception as e:
             logger.warning(f"Failed to load unique skills: {e}")
 
+    async def aload(self) -> bool:
+        """Load character data on the reader thread pool without blocking the event loop."""
+        return await self.db.run_async(self.load)
+
+    @property
+    def keys(self) -> NameKeyIndex:
+        """Kana, romaji and English/Japanese search keys of the character names (built on first use)."""
+        if self._keys is None:
+            if not self._loaded:
+                self.load()
+            self._keys = NameKeyIndex(self.name_index.items(), aliases=character_aliases)
+        return self._keys
+
+    @property
+    def fuzzy(self) -> FuzzyIndex:
+        """Fuzzy matcher over every search key of the character names (built on first use)."""
+        if self._fuzzy is None:
+            self._fuzzy = FuzzyIndex(self.keys.items())
+        return self._fuzzy
+
     def get_by_id(self, chara_id: int) -> Optional[Character]:
         """Get character by ID."""
         if not self._loaded:
@@ -297,23 +207,22 @@ class CharacterManager:
         Get character by name (case-insensitive).
 
         Args:
-            name: Character name (partial match supported)
+            name: Character name in any width, kana, romaji or its English/Japanese
+                counterpart (partial matches and typos supported)
         """
         if not self._loaded:
             self.load()
 
-        name_lower = name.lower()
-
         # Exact match
+        name_lower = name.lower()
         if name_lower in self.name_index:
             return self.characters[self.name_index[name_lower]]
 
-        # Partial match
-        for indexed_name, chara_id in self.name_index.items():
-            if name_lower in indexed_name:
-                return self.characters[chara_id]
-
-        return None
+        # Exact match under another form of the name, then best partial or fuzzy match
+        chara_id = self.keys.get(name)
+        if chara_id is None:
+            chara_id = self.fuzzy.best(name)
+        return self.characters[chara_id] if chara_id is not None else None
 
     def get_all(self) -> List[Character]:
         """Get all characters."""
@@ -329,19 +238,9 @@ class CharacterManager:
             query: Search query
 
         Returns:
-            List of matching characters
+            List of matching characters, best match first
         """
-        if not self._loaded:
-            self.load()
-
-        query_lower = query.lower()
-        results = []
-
-        for name, chara_id in self.name_index.items():
-            if query_lower in name:
-                results.append(self.characters[chara_id])
-
-        return results
+        return [self.characters[chara_id] for chara_id in self.fuzzy.matches(query)]
 
     def get_random(self) -> Optional[Character]:
         """Get a random character."""
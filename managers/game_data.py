@@ -0,0 +1,282 @@
+"""Process-wide registry owning one instance of each game data manager."""
+import asyncio
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import logging
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.db_reader import get_reader_pool
+from utils.sidecar import database_fingerprint
+from managers.snapshot import load_snapshot, save_snapshot
+from managers.text_service import TextService
+from managers.localization import Localizer, detect_language, LANGUAGE_AUTO, LANGUAGES
+from managers.autocomplete import NameCompleter
+from managers.character_manager import CharacterManager
+from managers.skill_manager import SkillManager
+from managers.support_card_manager import SupportCardManager
+from managers.race_manager import RaceManager
+
+logger = logging.getLogger('UmaMusumeBot.GameData')
+
+# Readiness states
+STATE_PENDING = 'pending'
+STATE_LOADING = 'loading'
+STATE_READY = 'ready'
+STATE_FAILED = 'failed'
+
+class GameData:
+    """
+    Owns the shared TextService and one instance of every manager.
+
+    Created once in UmaMusumeBot.setup_hook and reached by the cogs through
+    bot.game_data, so each table is loaded and held once no matter how many
+    cogs use it.
+    """
+
+    def __init__(self, db_path: str = "./data/master.mdb", use_snapshot: bool = True,
+                 language: str = LANGUAGE_AUTO, locale_paths: Optional[Dict[str, str]] = None):
+        """
+        Initialize the registry (nothing is loaded until aload()).
+
+        Args:
+            db_path: Path to the master.mdb file every manager loads from
+            use_snapshot: Restore from / write the binary snapshot next to
+                master.mdb (see managers/snapshot.py)
+            language: Language of db_path ('en', 'jp' or 'auto' to detect it)
+            locale_paths: Extra language -> master.mdb paths; only their
+                text tables are loaded (see managers/localization.py)
+        """
+        self.db_path = db_path
+        self.use_snapshot = use_snapshot
+        self.language = language
+        self.locale_paths = {}
+        for lang, path in (locale_paths or {}).items():
+            if lang in LANGUAGES:
+                self.locale_paths[lang] = path
+            else:
+                logger.warning(f"Ignoring locale database for unknown language '{lang}' ({path})")
+        self.texts = TextService(db_path)
+        self.locale_texts: Dict[str, TextService] = {
+            lang: TextService(path) for lang, path in self.locale_paths.items()
+        }
+        self._localizers: Dict[str, Localizer] = {}
+        self.completer = NameCompleter(self)
+        self.characters = CharacterManager(db_path, text_service=self.texts)
+        self.skills = SkillManager(db_path, text_service=self.texts)
+        self.support_cards = SupportCardManager(db_path, text_service=self.texts)
+        self.races = RaceManager(db_path, text_service=self.texts)
+
+        self.state = STATE_PENDING
+        self.version: Optional[str] = None  # database_fingerprint() of the loaded file
+        self.load_seconds: Optional[float] = None
+        self.from_snapshot = False
+        self.failures: List[str] = []
+        # time.perf_counter() (start, end) of each step of the last load
+        self.timings: Dict[str, Tuple[float, float]] = {}
+        self._ready = asyncio.Event()
+
+    @property
+    def managers(self) -> Dict[str, object]:
+        """Get the managers by registry name."""
+        return {
+            'characters': self.characters,
+            'skills': self.skills,
+            'support_cards': self.support_cards,
+            'races': self.races,
+        }
+
+    @property
+    def components(self) -> Dict[str, object]:
+        """Get everything the snapshot captures (texts plus managers)."""
+        return {'texts': self.texts, **self.managers}
+
+    @property
+    def languages(self) -> List[str]:
+        """Get the languages names can be shown in (primary first)."""
+        return [self.language] + [lang for lang in self.locale_texts if lang != self.language]
+
+    def localizer(self, language: Optional[str] = None) -> Localizer:
+        """
+        Get the localizer for a language.
+
+        Args:
+            language: Language code (None or unavailable -> primary language)
+
+        Returns:
+            Localizer rendering the shared models in that language
+        """
+        if language not in self.locale_texts or language == self.language:
+            language = self.language
+        localizer = self._localizers.get(language)
+        if localizer is None:
+            if language == self.language:
+                localizer = Localizer(language, self.texts, primary=True)
+            else:
+                localizer = Localizer(language, self.locale_texts[language])
+            self._localizers[language] = localizer
+        return localizer
+
+    @property
+    def ready(self) -> bool:
+        """Whether every manager finished loading."""
+        return self.state == STATE_READY
+
+    @property
+    def failed(self) -> bool:
+        """Whether loading finished with failures."""
+        return self.state == STATE_FAILED
+
+    async def aload(self) -> bool:
+        """
+        Restore from the snapshot if it matches master.mdb, otherwise load the
+        texts and then every manager concurrently on the reader pool.
+
+        Returns:
+            bool: True if everything loaded
+        """
+        self.state = STATE_LOADING
+        self.failures = []
+        self.timings = {}
+        start = time.perf_counter()
+
+        try:
+            version = database_fingerprint(self.db_path)
+        except OSError as e:
+            logger.error(f"Database not available: {e}")
+            self.state = STATE_FAILED
+            self._ready.set()
+            return False
+
+        loop = asyncio.get_running_loop()
+        if self.use_snapshot:
+            restored = await loop.run_in_executor(
+                get_reader_pool(), load_snapshot, self.db_path, self.components
+            )
+            self.timings['snapshot'] = (start, time.perf_counter())
+            if restored is not None:
+                self._pin(restored)
+                await self._load_locales()
+                await self._build_indexes()
+                self.load_seconds = time.perf_counter() - start
+                self.version = restored
+                self.from_snapshot = True
+                self.state = STATE_READY
+                self._ready.set()
+                logger.info(f"Game data restored from snapshot in {self.load_seconds * 1000:.0f} ms (version {self.version})")
+                return True
+
+        self._pin(version)
+        if not await self._timed('texts', self.texts):
+            self.failures.append('texts')
+        else:
+            names = list(self.managers)
+            results = await asyncio.gather(
+                *(self._timed(name, manager) for name, manager in self.managers.items())
+            )
+            self.failures = [name for name, ok in zip(names, results) if not ok]
+            if not self.failures:
+                await self._load_locales()
+                await self._build_indexes()
+
+        self.load_seconds = time.perf_counter() - start
+        self.version = version
+        self.state = STATE_FAILED if self.failures else STATE_READY
+        self._ready.set()
+
+        if self.failures:
+            logger.error(f"Game data loaded with failures: {', '.join(self.failures)}")
+        else:
+            logger.info(f"Game data ready in {self.load_seconds:.2f}s (version {self.version})")
+            if self.use_snapshot:
+                await loop.run_in_executor(
+                    get_reader_pool(), save_snapshot, self.db_path, version, self.components
+                )
+        return not self.failures
+
+    def _pin(self, version: str):
+        """Pin every reader to the loaded file version, so lazily opened connections never read a newer file."""
+        for component in self.components.values():
+            component.db.pin(version)
+
+    async def _load_locales(self):
+        """Resolve the primary language and load the extra languages' texts."""
+        if self.language == LANGUAGE_AUTO:
+            self.language = detect_language(self.texts)
+            logger.info(f"Detected database language: {self.language}")
+        duplicate = self.locale_texts.pop(self.language, None)  # Same language as the primary file
+        if duplicate is not None:
+            duplicate.close()
+        self._localizers.clear()
+        if not self.locale_texts:
+            return
+
+        names = list(self.locale_texts)
+        results = await asyncio.gather(
+            *(self._timed(f"texts:{lang}", self.locale_texts[lang]) for lang in names)
+        )
+        for lang, ok in zip(names, results):
+            if ok:
+                loaded = sum(len(entries) for entries in self.locale_texts[lang].texts.values())
+                logger.info(f"Loaded {lang} texts ({loaded:,} entries)")
+            else:
+                # An unavailable extra language is not fatal; names fall back to the primary
+                logger.warning(f"Failed to load {lang} texts from {self.locale_paths[lang]}")
+                self.locale_texts.pop(lang).close()
+
+    async def _build_indexes(self):
+        """Build the name lookup, autocomplete and filter indexes before the first request needs them."""
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        await loop.run_in_executor(get_reader_pool(), self._warm_fuzzy)
+        self.timings['fuzzy'] = (started, time.perf_counter())
+        started = time.perf_counter()
+        await loop.run_in_executor(get_reader_pool(), self.completer.warm)
+        self.timings['autocomplete'] = (started, time.perf_counter())
+        started = time.perf_counter()
+        await loop.run_in_executor(get_reader_pool(), self._warm_filters)
+        self.timings['filters'] = (started, time.perf_counter())
+
+    def _warm_fuzzy(self):
+        """Build every manager's name keys and fuzzy name matcher."""
+        for manager in self.managers.values():
+            manager.fuzzy
+
+    def _warm_filters(self):
+        """Build the skill facet index and the race catalog."""
+        self.skills.facets
+        self.races.catalog
+
+    async def _timed(self, name: str, component) -> bool:
+        """Load one component, recording its start and end in self.timings."""
+        started = time.perf_counter()
+        try:
+            return await component.aload()
+        finally:
+            self.timings[name] = (started, time.perf_counter())
+
+    async def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until loading has finished (successfully or not).
+
+        Args:
+            timeout: Seconds to wait (None waits forever)
+
+        Returns:
+            bool: True if the data is ready
+        """
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return self.ready
+
+    def close(self):
+        """Close every manager's database connections."""
+        for manager in self.managers.values():
+            manager.close()
+        self.texts.close()
+        for texts in self.locale_texts.values():
+            texts.close()
@@ -0,0 +1,118 @@
+"""Per-user and per-server language preferences for game data names."""
+import asyncio
+import json
+import os
+import sys
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+import logging
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from managers.localization import Localizer, DISCORD_LOCALES
+
+logger = logging.getLogger('UmaMusumeBot.LocalePrefs')
+
+DEFAULT_PREFS_PATH = './data/locale_prefs.json'
+
+class LocalePreferences:
+    """Language choices keyed by user and guild id, persisted as JSON."""
+
+    def __init__(self, path=DEFAULT_PREFS_PATH):
+        """
+        Initialize the preferences, reading the file if it exists.
+
+        Args:
+            path: JSON file holding the preferences
+        """
+        self.path = Path(path)
+        self.users: Dict[str, str] = {}
+        self.guilds: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.users = dict(data.get('users', {}))
+            self.guilds = dict(data.get('guilds', {}))
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    def get_user(self, user_id: int) -> Optional[str]:
+        """Get a user's language, if they picked one."""
+        return self.users.get(str(user_id))
+
+    def get_guild(self, guild_id: int) -> Optional[str]:
+        """Get a server's language, if it picked one."""
+        return self.guilds.get(str(guild_id))
+
+    def set_user(self, user_id: int, language: Optional[str]):
+        """Set (or with None, clear) a user's language and save."""
+        self._set(self.users, user_id, language)
+
+    def set_guild(self, guild_id: int, language: Optional[str]):
+        """Set (or with None, clear) a server's language and save."""
+        self._set(self.guilds, guild_id, language)
+
+    async def aset_user(self, user_id: int, language: Optional[str]):
+        """Set or clear a user's language, saving off the event loop."""
+        await asyncio.to_thread(self.set_user, user_id, language)
+
+    async def aset_guild(self, guild_id: int, language: Optional[str]):
+        """Set or clear a server's language, saving off the event loop."""
+        await asyncio.to_thread(self.set_guild, guild_id, language)
+
+    def _set(self, table: Dict[str, str], key: int, language: Optional[str]):
+        with self._lock:
+            if language is None:
+                table.pop(str(key), None)
+            else:
+                table[str(key)] = language
+            self._save()
+
+    def _save(self):
+        """Write the preferences atomically."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(self.path.name + '.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'users': self.users, 'guilds': self.guilds}, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Failed to save language preferences: {e}")
+
+    def resolve(self, user_id: int, guild_id: Optional[int], client_locale: Optional[str] = None) -> Optional[str]:
+        """
+        Pick the language for a request: the user's choice, then the server's,
+        then the language of the user's Discord client.
+
+        Returns:
+            Language code, or None for the bot's primary language
+        """
+        language = self.get_user(user_id)
+        if language is None and guild_id is not None:
+            language = self.get_guild(guild_id)
+        if language is None and client_locale is not None:
+            language = DISCORD_LOCALES.get(client_locale)
+        return language
+
+def localizer_for(interaction) -> Localizer:
+    """
+    Get the localizer for an interaction's user and server.
+
+    Args:
+        interaction: discord.Interaction (its client must own game_data)
+
+    Returns:
+        Localizer for the preferred language (primary if it is not loaded)
+    """
+    bot = interaction.client
+    prefs: Optional[LocalePreferences] = getattr(bot, 'locale_prefs', None)
+    language = None
+    if prefs is not None:
+        language = prefs.resolve(
+            interaction.user.id,
+            interaction.guild_id,
+            str(interaction.locale) if interaction.locale else None
+        )
+    return bot.game_data.localizer(language)
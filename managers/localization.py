@@ -0,0 +1,214 @@
+"""
+Per-language text overlays for the shared game data.
+
+The managers build their models once, from the primary master.mdb, with
+names in its language. Numbers (stats, aptitudes, abilities, race
+geometry) are the same in every client's database, so a second language
+only needs its own TextService: a Localizer swaps the text fields of the
+models being displayed for that language's entries, keyed by the same ids.
+"""
+import dataclasses
+import sys
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, TypeVar
+import logging
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from managers.text_service import (
+    TextService, CATEGORY_CHARA_NAME, CATEGORY_RACE_NAME,
+    CATEGORY_SKILL_NAME, CATEGORY_SKILL_DESCRIPTION
+)
+from utils.fuzzy_index import FuzzyIndex
+from utils.name_keys import character_aliases, name_keys
+from models.character import Character, CharacterCard, CardSkill
+from models.skill import SkillSummary
+from models.race import Race
+from models.support_card import SupportCard
+
+logger = logging.getLogger('UmaMusumeBot.Localization')
+
+LANGUAGE_EN = 'en'
+LANGUAGE_JP = 'jp'
+LANGUAGE_AUTO = 'auto'
+LANGUAGES = (LANGUAGE_EN, LANGUAGE_JP)
+LANGUAGE_NAMES = {
+    LANGUAGE_EN: "English",
+    LANGUAGE_JP: "日本語",
+}
+
+# Discord client locales (interaction.locale) that map onto a database language
+DISCORD_LOCALES = {
+    'ja': LANGUAGE_JP,
+    'en-US': LANGUAGE_EN,
+    'en-GB': LANGUAGE_EN,
+}
+
+T = TypeVar('T')
+
+def _is_japanese(text: str) -> bool:
+    """Check whether a string contains kana or CJK ideographs."""
+    return any('\u3040' <= ch <= '\u30ff' or '\u4e00' <= ch <= '\u9fff' for ch in text)
+
+def detect_language(texts: TextService, sample_size: int = 50) -> str:
+    """
+    Guess the language of a loaded TextService from its character names.
+
+    Args:
+        texts: Loaded text service
+        sample_size: Number of names to inspect
+
+    Returns:
+        LANGUAGE_JP if most names are Japanese, otherwise LANGUAGE_EN
+    """
+    names = [n for n in texts.texts.get(CATEGORY_CHARA_NAME, {}).values() if n][:sample_size]
+    japanese = sum(1 for name in names if _is_japanese(name))
+    return LANGUAGE_JP if names and japanese * 2 > len(names) else LANGUAGE_EN
+
+class Localizer:
+    """
+    Renders shared models in one language.
+
+    The primary language's localizer returns models unchanged; others return
+    shallow copies with the text fields replaced, falling back to the
+    primary text where their database has no entry.
+    """
+
+    def __init__(self, language: str, texts: TextService, primary: bool = False):
+        """
+        Initialize the localizer.
+
+        Args:
+            language: Language code (LANGUAGE_EN / LANGUAGE_JP)
+            texts: Loaded text service for that language
+            primary: Whether the models were built in this language
+        """
+        self.language = language
+        self.texts = texts
+        self.primary = primary
+        self._fuzzy: Dict[int, FuzzyIndex] = {}
+
+    def text(self, category: int, index: int, fallback: Optional[str]) -> Optional[str]:
+        """Get a text entry in this language, or the fallback."""
+        if self.primary:
+            return fallback
+        return self.texts.get(category, index) or fallback
+
+    # Names only (cheap, for lists)
+
+    def character_name(self, char: Character) -> str:
+        """Get a character's display name."""
+        return self.text(CATEGORY_CHARA_NAME, char.chara_id, char.display_name)
+
+    def skill_name(self, skill) -> str:
+        """Get a skill's display name (Skill, SkillSummary or CardSkill)."""
+        if isinstance(skill, CardSkill):
+            return self.text(CATEGORY_SKILL_NAME, skill.skill_id, skill.skill_name)
+        return self.text(CATEGORY_SKILL_NAME, skill.skill_id, skill.display_name)
+
+    def race_name(self, race: Race) -> str:
+        """Get a race's display name."""
+        return self.text(CATEGORY_RACE_NAME, race.race_id, race.display_name)
+
+    # Whole models (for detail views)
+
+    def character(self, char: Optional[Character]) -> Optional[Character]:
+        """Get a character with its cards and their skills in this language."""
+        if char is None or self.primary:
+            return char
+        name = self.character_name(char)
+        return dataclasses.replace(char, name=name, name_en=name, cards=[self.card(c) for c in char.cards])
+
+    def card(self, card: CharacterCard) -> CharacterCard:
+        """Get a character card with its title and skills in this language."""
+        if self.primary:
+            return card
+        title = self.texts.card_title(card.card_id)
+        return dataclasses.replace(
+            card,
+            card_title=title.strip('[]') if title else card.card_title,
+            skills=[self.card_skill(s) for s in card.skills],
+            unique_skill=self.card_skill(card.unique_skill) if card.unique_skill else None
+        )
+
+    def card_skill(self, skill: CardSkill) -> CardSkill:
+        """Get a card skill entry in this language."""
+        if self.primary:
+            return skill
+        return dataclasses.replace(skill, skill_name=self.skill_name(skill))
+
+    def skill(self, skill: Optional[T]) -> Optional[T]:
+        """Get a Skill or SkillSummary in this language."""
+        if skill is None or self.primary:
+            return skill
+        name = self.skill_name(skill)
+        if isinstance(skill, SkillSummary):
+            return skill._replace(name=name)
+        return dataclasses.replace(
+            skill, name=name, name_en=name, name_jp=name,
+            description=self.text(CATEGORY_SKILL_DESCRIPTION, skill.skill_id, skill.description)
+        )
+
+    def race(self, race: Optional[Race]) -> Optional[Race]:
+        """Get a race in this language."""
+        if race is None or self.primary:
+            return race
+        name = self.race_name(race)
+        return dataclasses.replace(race, name=name, name_en=name, name_jp=name)
+
+    def support_card(self, card: Optional[SupportCard]) -> Optional[SupportCard]:
+        """Get a support card in this language."""
+        if card is None or self.primary:
+            return card
+        return dataclasses.replace(
+            card, character_name=self.text(CATEGORY_CHARA_NAME, card.chara_id, card.character_name)
+        )
+
+    # Reverse lookups (names typed in this language)
+
+    def match_ids(self, category: int, query: str, limit: Optional[int] = None) -> List[int]:
+        """
+        Find ids whose text in this language matches a query.
+
+        The managers already search the primary language, so the primary
+        localizer returns nothing.
+
+        Args:
+            category: text_data category (e.g. CATEGORY_CHARA_NAME)
+            query: Search text (case-insensitive)
+            limit: Maximum number of ids
+
+        Returns:
+            Exact matches first, then partial matches (or, if there are
+            none, the closest typo matches)
+        """
+        if self.primary or not query:
+            return []
+        return self.fuzzy(category).matches(query, limit)
+
+    def fuzzy(self, category: int) -> FuzzyIndex:
+        """
+        Get (building it the first time) the fuzzy matcher over a text
+        category, keyed by every search form of each text (kana, romaji and,
+        for character names, the curated counterpart name).
+        """
+        index = self._fuzzy.get(category)
+        if index is None:
+            self.texts.load((category,))
+            entries = self.texts.texts.get(category, {}).items()
+            aliases = character_aliases if category == CATEGORY_CHARA_NAME else (lambda text: ())
+            index = FuzzyIndex(
+                (key, text_id)
+                for text_id, text in entries if text
+                for key in name_keys(text, aliases(text))
+            )
+            self._fuzzy[category] = index
+        return index
+
+    def lookup(self, category: int, query: str, getter: Callable[[int], Optional[T]]) -> Optional[T]:
+        """Get the first entity whose name in this language matches a query."""
+        for index in self.match_ids(category, query):
+            entity = getter(index)
+            if entity is not None:
+                return entity
+        return None
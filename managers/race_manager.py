@@ -7,19 +7,38 @@ import logging
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from utils.db_reader import MasterDBReader
+from utils.fuzzy_index import FuzzyIndex
+from utils.range_index import RangeIndex
+from utils.name_keys import NameKeyIndex
+from managers.text_service import TextService, get_text_service
 from models.race import Race
 
 logger = logging.getLogger('UmaMusumeBot.RaceManager')
 
+# Equality columns of the race catalog, in RangeIndex row order
+CATALOG_COLUMNS = ('grade', 'ground', 'track_id')
+
 class RaceManager:
-    """Manages race data from the database."""
+    """
+    Manages race data from the database.
+
+    Filters run on a column store (see catalog) sorted by distance, with
+    posting lists per grade, ground and track.
+    """
+
+    # Loaded state captured by managers/snapshot.py
+    SNAPSHOT_FIELDS = ('races', 'name_index')
 
-    def __init__(self, db_path: str = "./data/master.mdb"):
+    def __init__(self, db_path: str = "./data/master.mdb", text_service: Optional[TextService] = None):
         """Initialize the race manager."""
         self.db_path = db_path
-        self.db = MasterDBReader(db_path)
+        self.db = MasterDBReader(db_path, attach_sidecar=True)
+        self.texts = text_service or get_text_service(db_path)
         self.races: Dict[int, Race] = {}
         self.name_index: Dict[str, int] = {}
+        self._keys: Optional[NameKeyIndex] = None
+        self._fuzzy: Optional[FuzzyIndex] = None
+        self._catalog: Optional[RangeIndex] = None
         self._loaded = False
 
     def load(self) -> bool:
@@ -27,45 +46,28 @@ class RaceManager:
         if self._loaded:
             return True
 
-        if not self.db.connect():
+        if not self.db.connect() or not self.texts.load():
             logger.error("Failed to connect to database")
             return False
 
         try:
-            query = """
-            SELECT
-                r.id,
-                r.grade,
-                rcs.distance,
-                rcs.ground,
-                rcs.race_track_id as track_id,
-                t.text as name
-            FROM race r
-            LEFT JOIN race_course_set rcs ON r.course_set = rcs.id
-            LEFT JOIN text_data t ON t.category = 30 AND t.[index] = r.id
-            WHERE r.grade > 0 AND rcs.distance IS NOT NULL
-            ORDER BY r.grade DESC, rcs.distance
-            LIMIT 500
-            """
-
-            results = self.db.query(query)
-
-            for row in results:
+            for row in self.db.iter_named('races.all'):
+                name = self.texts.race_name(row.id)
                 race = Race(
-                    race_id=row['id'],
-                    name=row['name'] or f"Race {row['id']}",
-                    grade=row['grade'] or 0,
-                    distance=row['distance'],
-                    ground=row['ground'],
-                    track_id=row['track_id'],
-                    name_en=row['name'],
-                    name_jp=row['name']
+                    race_id=row.id,
+                    name=name or f"Race {row.id}",
+                    grade=row.grade or 0,
+                    distance=row.distance,
+                    ground=row.ground,
+                    track_id=row.track_id,
+                    name_en=name,
+                    name_jp=name
                 )
                 self.races[race.race_id] = race
 
-                # Index by name
-                if row['name']:
-                    self.name_index[row['name'].lower()] = race.race_id
+                # Index by name (rows come best grade first, so a repeated name keeps its top race)
+                if name:
+                    self.name_index.setdefault(name.lower(), race.race_id)
 
             self._loaded = True
             logger.info(f"Loaded {len(self.races)} races")
@@ -75,6 +77,61 @@ class RaceManager:
             logger.error(f"Failed to load races: {e}")
             return False
 
+    async def aload(self) -> bool:
+        """Load race data on the reader thread pool without blocking the event loop."""
+        return await self.db.run_async(self.load)
+
+    @property
+    def keys(self) -> NameKeyIndex:
+        """Width-folded, kana and romaji search keys of the race names (built on first use)."""
+        if self._keys is None:
+            if not self._loaded:
+                self.load()
+            self._keys = NameKeyIndex(self.name_index.items())
+        return self._keys
+
+    @property
+    def fuzzy(self) -> FuzzyIndex:
+        """Fuzzy matcher over every search key of the race names (built on first use)."""
+        if self._fuzzy is None:
+            self._fuzzy = FuzzyIndex(self.keys.items())
+        return self._fuzzy
+
+    @property
+    def catalog(self) -> RangeIndex:
+        """Column store of every race, sorted by distance (built on first use)."""
+        if self._catalog is None:
+            if not self._loaded:
+                self.load()
+            self._catalog = RangeIndex(
+                ((race.race_id, race.distance or 0, (race.grade, race.ground or 0, race.track_id or 0))
+                 for race in self.races.values()),
+                CATALOG_COLUMNS
+            )
+        return self._catalog
+
+    def filter(self, grade: Optional[int] = None, ground: Optional[int] = None, track_id: Optional[int] = None,
+               min_distance: Optional[int] = None, max_distance: Optional[int] = None) -> List[Race]:
+        """
+        Get the races matching every given condition (None means any).
+
+        Args:
+            grade: Race grade
+            ground: Ground type (1=Turf, 2=Dirt)
+            track_id: Race track
+            min_distance: Shortest distance in meters
+            max_distance: Longest distance in meters
+
+        Returns:
+            Matching races, shortest first (then best grade)
+        """
+        ids = self.catalog.query(min_distance, max_distance, grade=grade, ground=ground, track_id=track_id)
+        return [self.races[race_id] for race_id in ids]
+
+    def get_track_ids(self) -> List[int]:
+        """Get the ids of every race track in the catalog."""
+        return [track_id for track_id in self.catalog.values('track_id') if track_id]
+
     def get_by_id(self, race_id: int) -> Optional[Race]:
         """Get race by ID."""
         if not self._loaded:
@@ -82,22 +139,20 @@ class RaceManager:
         return self.races.get(race_id)
 
     def get_by_name(self, name: str) -> Optional[Race]:
-        """Get race by name (partial match)."""
+        """Get race by name (partial matches and typos supported)."""
         if not self._loaded:
             self.load()
 
-        name_lower = name.lower()
-
         # Exact match
+        name_lower = name.lower()
         if name_lower in self.name_index:
             return self.races[self.name_index[name_lower]]
 
-        # Partial match
-        for indexed_name, race_id in self.name_index.items():
-            if name_lower in indexed_name:
-                return self.races[race_id]
-
-        return None
+        # Exact match under another form of the name, then best partial or fuzzy match
+        race_id = self.keys.get(name)
+        if race_id is None:
+            race_id = self.fuzzy.best(name)
+        return self.races[race_id] if race_id is not None else None
 
     def get_all(self) -> List[Race]:
         """Get all races."""
@@ -107,39 +162,23 @@ class RaceManager:
 
     def get_by_grade(self, grade: int) -> List[Race]:
         """Get races by grade."""
-        if not self._loaded:
-            self.load()
-        return [r for r in self.races.values() if r.grade == grade]
+        return self.filter(grade=grade)
 
     def get_by_distance(self, min_dist: int, max_dist: int) -> List[Race]:
         """Get races within distance range."""
-        if not self._loaded:
-            self.load()
-        return [r for r in self.races.values() if min_dist <= r.distance <= max_dist]
+        return self.filter(min_distance=min_dist, max_distance=max_dist)
 
     def get_by_ground(self, ground: int) -> List[Race]:
         """Get races by ground type."""
-        if not self._loaded:
-            self.load()
-        return [r for r in self.races.values() if r.ground == ground]
+        return self.filter(ground=ground)
 
     def get_g1_races(self) -> List[Race]:
         """Get all G1 races."""
         return self.get_by_grade(5)
 
     def search(self, query: str) -> List[Race]:
-        """Search races by name."""
-        if not self._loaded:
-            self.load()
-
-        query_lower = query.lower()
-        results = []
-
-        for name, race_id in self.name_index.items():
-            if query_lower in name:
-                results.append(self.races[race_id])
-
-        return results
+        """Search races by name, best match first."""
+        return [self.races[race_id] for race_id in self.fuzzy.matches(query)]
 
     def close(self):
         """Close database connection."""
@@ -0,0 +1,185 @@
+"""Hot reload of the shared game data when master.mdb is replaced."""
+import asyncio
+import gc
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional
+import logging
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.process_stats import current_rss
+from utils.sidecar import database_fingerprint
+from managers.game_data import GameData
+
+logger = logging.getLogger('UmaMusumeBot.Reloader')
+
+# Seconds the previous GameData keeps its connections after a swap, so
+# commands and views that already hold it can finish their reads; longer
+# than the views' 180 s timeout. Its readers refuse to reconnect once closed.
+RELOAD_GRACE_SECONDS = 240.0
+
+@dataclass
+class ReloadResult:
+    """Outcome of one reload."""
+    reason: str
+    success: bool
+    old_version: Optional[str]
+    new_version: Optional[str]
+    seconds: float
+    rss_before: Optional[int] = None  # Before building the new set
+    rss_overlap: Optional[int] = None  # Both sets alive, right before the swap
+    rss_after: Optional[int] = None  # After the swap and a GC pass
+    error: Optional[str] = None
+
+    @property
+    def overlap_bytes(self) -> Optional[int]:
+        """Extra memory held while the old and new sets were both alive."""
+        if self.rss_before is None or self.rss_overlap is None:
+            return None
+        return self.rss_overlap - self.rss_before
+
+class GameDataReloader:
+    """
+    Builds a fresh GameData from master.mdb in the background and swaps it
+    onto its owner (the bot) in one assignment.
+
+    The downloader replaces master.mdb with os.replace(), and every reader
+    is pinned to the version its GameData loaded (MasterDBReader.pin). The
+    old GameData's open connections keep reading the old file; a connection
+    it would open after the swap, or a connect() on a reader it never used,
+    is refused instead of reading the new file, so views on the old set
+    report missing details rather than mixing data from both files.
+    """
+
+    def __init__(self, owner, db_path: str, use_snapshot: bool = True,
+                 poll_interval: float = 30.0, grace_seconds: float = RELOAD_GRACE_SECONDS,
+                 language: str = 'auto', locale_paths: Optional[Dict[str, str]] = None):
+        """
+        Initialize the reloader.
+
+        Args:
+            owner: Object whose `game_data` attribute is swapped (the bot)
+            db_path: Path to master.mdb to watch
+            use_snapshot: Passed through to each new GameData
+            poll_interval: Seconds between file checks (0 disables watching)
+            grace_seconds: Delay before the replaced GameData is closed
+            language: Passed through to each new GameData
+            locale_paths: Passed through to each new GameData
+        """
+        self.owner = owner
+        self.db_path = db_path
+        self.use_snapshot = use_snapshot
+        self.poll_interval = poll_interval
+        self.grace_seconds = grace_seconds
+        self.language = language
+        self.locale_paths = dict(locale_paths or {})
+        self.last_result: Optional[ReloadResult] = None
+        self._lock = asyncio.Lock()
+        self._watch_task: Optional[asyncio.Task] = None
+
+    @property
+    def reloading(self) -> bool:
+        """Whether a reload is in progress."""
+        return self._lock.locked()
+
+    async def reload(self, reason: str = "manual") -> ReloadResult:
+        """
+        Load a complete new GameData and swap it in if it loaded cleanly.
+
+        Args:
+            reason: Shown in logs and reports (e.g. "manual", "file changed")
+
+        Returns:
+            ReloadResult describing the reload
+        """
+        async with self._lock:
+            old = self.owner.game_data
+            old_version = old.version if old else None
+            start = time.perf_counter()
+            rss_before = current_rss()
+            logger.info(f"Reloading game data ({reason})...")
+
+            new = GameData(
+                self.db_path, use_snapshot=self.use_snapshot,
+                language=self.language, locale_paths=self.locale_paths
+            )
+            try:
+                loaded = await new.aload()
+            except Exception as e:
+                loaded = False
+                new.failures.append(str(e))
+
+            if not loaded:
+                new.close()
+                result = ReloadResult(
+                    reason=reason, success=False, old_version=old_version,
+                    new_version=new.version, seconds=time.perf_counter() - start,
+                    rss_before=rss_before,
+                    error=f"Failed: {', '.join(new.failures) or 'unknown error'}"
+                )
+                logger.error(f"Reload failed, keeping version {old_version}: {result.error}")
+                self.last_result = result
+                return result
+
+            rss_overlap = current_rss()
+            # Single attribute assignment on the event loop: every later
+            # command sees the new set, commands in flight keep the old one
+            self.owner.game_data = new
+            if old is not None:
+                asyncio.get_running_loop().call_later(self.grace_seconds, old.close)
+            del old
+            gc.collect()
+
+            result = ReloadResult(
+                reason=reason, success=True, old_version=old_version,
+                new_version=new.version, seconds=time.perf_counter() - start,
+                rss_before=rss_before, rss_overlap=rss_overlap, rss_after=current_rss()
+            )
+            overlap = result.overlap_bytes
+            overlap_text = f"{overlap / (1024 * 1024):+,.1f} MiB" if overlap is not None else "n/a"
+            logger.info(
+                f"Reloaded game data {old_version} -> {new.version} in {result.seconds:.2f}s "
+                f"(memory overlap {overlap_text})"
+            )
+            self.last_result = result
+            return result
+
+    def start_watching(self):
+        """Start polling master.mdb for replacements."""
+        if self.poll_interval <= 0 or self._watch_task is not None:
+            return
+        self._watch_task = asyncio.create_task(self._watch())
+        logger.info(f"Watching {self.db_path} every {self.poll_interval:g}s")
+
+    def stop_watching(self):
+        """Stop polling master.mdb."""
+        if self._watch_task is not None:
+            self._watch_task.cancel()
+            self._watch_task = None
+
+    async def _watch(self):
+        """Reload once the file fingerprint changes and holds still for one poll."""
+        pending: Optional[str] = None
+        failed: Optional[str] = None
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                fingerprint = database_fingerprint(self.db_path)
+            except OSError:
+                continue  # Mid-replace or missing; try again next poll
+
+            current = self.owner.game_data.version if self.owner.game_data else None
+            if fingerprint == current or fingerprint == failed or self.reloading:
+                pending = None
+                continue
+            if fingerprint != pending:
+                # Wait one more poll in case the file is still being written
+                pending = fingerprint
+                continue
+
+            pending = None
+            result = await self.reload("file changed")
+            failed = None if result.success else fingerprint
@@ -1,54 +1,129 @@
 """Skill manager for loading and querying skill data."""
+import heapq
+import re
+import sqlite3
 import sys
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import Iterable, List, Optional, Dict, Tuple
 import logging
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from utils.db_reader import MasterDBReader
-from models.skill import Skill
+from utils.facet_index import FacetIndex
+from utils.fuzzy_index import FuzzyIndex
+from utils.name_keys import NameKeyIndex
+from utils.skill_conditions import Condition, ConditionSyntaxError, parse_condition, parse_query, satisfies, variables
+from managers.text_service import TextService, get_text_service
+from utils.sidecar import FTS_TABLE
+from models.skill import Skill, SkillAbility, SkillSummary, SkillTextMatch
 
 logger = logging.getLogger('UmaMusumeBot.SkillManager')
 
+# Fully hydrated skills kept in memory (least recently viewed are dropped)
+DETAIL_CACHE_SIZE = 256
+
+# Full-text search: results per query, terms per query, and words that carry
+# no meaning in questions like "which skills recover stamina on the corner"
+SEARCH_LIMIT = 10
+MAX_SEARCH_TERMS = 8
+SEARCH_STOPWORDS = frozenset({
+    'a', 'an', 'the', 'and', 'or', 'of', 'on', 'in', 'at', 'to', 'for', 'with', 'by', 'from',
+    'that', 'which', 'what', 'when', 'who', 'is', 'are', 'do', 'does', 'it', 'its', 'my',
+    'i', 'me', 'any', 'all', 'skill', 'skills',
+})
+_SEARCH_TERM = re.compile(r'\w+')
+# Kana and CJK ideographs (the FTS tokenizer keeps whole runs as one token)
+_CJK = re.compile('[\u3040-\u30ff\u4e00-\u9fff]')
+# Description excerpt length for LIKE fallback results
+EXCERPT_LENGTH = 120
+
+# Facets of the skill filter index (see SkillManager.filter)
+FACET_RARITY = 'rarity'
+FACET_CATEGORY = 'category'
+FACET_ABILITY = 'ability'
+FACET_WISDOM = 'wisdom'
+FACET_UNIQUE = 'unique'
+FACET_SP = 'sp'
+FACET_CONDITION = 'condition'  # Variables the activation conditions mention
+# SP costs are bucketed in steps of this size
+SP_BUCKET_WIDTH = 50
+
+def search_terms(query: str) -> List[str]:
+    """Split a search query into distinct terms, dropping stopwords unless nothing else is left."""
+    words = list(dict.fromkeys(_SEARCH_TERM.findall(query.casefold())))
+    kept = [word for word in words if word not in SEARCH_STOPWORDS]
+    return (kept or words)[:MAX_SEARCH_TERMS]
+
+def _highlight(text: str, terms: List[str]) -> str:
+    """Bold every occurrence of the terms in text."""
+    pattern = re.compile("|".join(re.escape(term) for term in terms), re.IGNORECASE)
+    return pattern.sub(lambda m: f"**{m.group(0)}**", text)
+
+def _excerpt(text: str, terms: List[str], length: int = EXCERPT_LENGTH) -> str:
+    """Cut text down to a window around the first term it contains."""
+    if len(text) <= length:
+        return text
+    lowered = text.casefold()
+    first = min((pos for pos in (lowered.find(term) for term in terms) if pos >= 0), default=0)
+    start = max(0, min(first - length // 4, len(text) - length))
+    excerpt = text[start:start + length]
+    return f"{'…' if start else ''}{excerpt}{'…' if start + length < len(text) else ''}"
+
 class SkillManager:
-    """Manages skill data from the database."""
+    """
+    Manages skill data from the database.
+
+    load() only builds the compact SkillSummary index used by lists and
+    searches. Abilities, conditions, SP cost and description are read when a
+    skill is first viewed (get_by_id) and kept in a bounded LRU cache.
+    """
 
-    def __init__(self, db_path: str = "./data/master.mdb"):
+    # Loaded state captured by managers/snapshot.py
+    SNAPSHOT_FIELDS = ('skills', 'name_index')
+
+    def __init__(self, db_path: str = "./data/master.mdb", text_service: Optional[TextService] = None,
+                 detail_cache_size: int = DETAIL_CACHE_SIZE):
         """Initialize the skill manager."""
         self.db_path = db_path
-        self.db = MasterDBReader(db_path)
-        self.skills: Dict[int, Skill] = {}
+        self.db = MasterDBReader(db_path, attach_sidecar=True)
+        self.texts = text_service or get_text_service(db_path)
+        self.skills: Dict[int, SkillSummary] = {}
         self.name_index: Dict[str, List[int]] = {}  # Changed to List[int] to support duplicates
+        self._keys: Optional[NameKeyIndex] = None
+        self._fuzzy: Optional[FuzzyIndex] = None
+        self._facets: Optional[FacetIndex] = None
+        self._facet_ids: List[int] = []  # Facet position -> skill_id
+        self._facet_positions: Dict[int, int] = {}  # skill_id -> facet position
+        self._conditions: List[Tuple[Condition, ...]] = []  # Facet position -> compiled conditions
+        self._condition_masks: Dict[Condition, int] = {}  # Distinct compiled condition -> skills having it
+        self._has_fts: Optional[bool] = None
+        self.detail_cache_size = detail_cache_size
+        self._details: "OrderedDict[int, Skill]" = OrderedDict()
+        self._details_lock = threading.Lock()
+        self.detail_hits = 0
+        self.detail_misses = 0
         self._loaded = False
 
     def load(self) -> bool:
-        """Load skill data from database."""
+        """Load the skill index from the database."""
         if self._loaded:
             return True
 
-        if not self.db.connect():
+        if not self.db.connect() or not self.texts.load():
             logger.error("Failed to connect to database")
             return False
 
         try:
             # First, get all character unique skill IDs with character names and card titles
-            unique_skill_query = """
-            SELECT DISTINCT ss.skill_id1, cd.chara_id, t1.text as char_name, t2.text as card_title
-            FROM card_rarity_data cr
-            JOIN skill_set ss ON cr.skill_set = ss.id
-            JOIN card_data cd ON cr.card_id = cd.id
-            LEFT JOIN text_data t1 ON t1.category = 6 AND t1.[index] = cd.chara_id
-            LEFT JOIN text_data t2 ON t2.category = 5 AND t2.[index] = cr.card_id
-            WHERE cr.rarity = 3 AND ss.skill_id1 > 0
-            """
-            unique_results = self.db.query(unique_skill_query)
             # Map skill_id -> character display (title + name)
             skill_to_character = {}
-            for row in unique_results:
-                skill_id = row['skill_id1']
-                char_name = row.get('char_name', 'Unknown')
-                card_title = row.get('card_title')
+            for row in self.db.iter_named('skills.unique_owners'):
+                skill_id = row.skill_id1
+                char_name = self.texts.chara_name(row.chara_id)
+                card_title = self.texts.card_title(row.card_id)
                 # Format as "[Title] Name" if title exists, otherwise just name
                 if card_title:
                     display = f"{card_title} {char_name}"
@@ -59,116 +134,23 @@ class SkillManager:
                     skill_to_character[skill_id] = display
             character_unique_ids = set(skill_to_character.keys())
 
-            # Load SP costs for skills
-            sp_cost_query = """
-            SELECT id, need_skill_point
-            FROM single_mode_skill_need_point
-            """
-            sp_cost_results = self.db.query(sp_cost_query)
-            skill_sp_costs = {row['id']: row['need_skill_point'] for row in sp_cost_results}
-
-            # Load all skills with ability data
-            query = """
-            SELECT
-                s.id,
-                s.rarity,
-                s.grade_value,
-                s.skill_category,
-                s.condition_1,
-                s.condition_2,
-                s.icon_id,
-                s.activate_lot,
-                s.float_ability_time_1,
-                s.float_cooldown_time_1,
-                s.ability_type_1_1,
-                s.ability_type_1_2,
-                s.ability_type_1_3,
-                s.float_ability_value_1_1,
-                s.float_ability_value_1_2,
-                s.float_ability_value_1_3,
-                s.float_ability_time_2,
-                s.float_cooldown_time_2,
-                s.ability_type_2_1,
-                s.ability_type_2_2,
-                s.ability_type_2_3,
-                s.float_ability_value_2_1,
-                s.float_ability_value_2_2,
-                s.float_ability_value_2_3,
-                t1.text as name,
-                t2.text as description
-            FROM skill_data s
-            LEFT JOIN text_data t1 ON t1.category = 47 AND t1.[index] = s.id
-            LEFT JOIN text_data t2 ON t2.category = 48 AND t2.[index] = s.id
-            WHERE s.rarity > 0
-            ORDER BY s.rarity DESC, s.grade_value DESC
-            """
-
-            results = self.db.query(query)
-
-            for row in results:
-                # Parse ability 1
-                ability_1 = None
-                if row.get('ability_type_1_1', 0) > 0:
-                    from models.skill import SkillAbility
-                    ability_1 = SkillAbility(
-                        ability_types=[
-                            row.get('ability_type_1_1', 0),
-                            row.get('ability_type_1_2', 0),
-                            row.get('ability_type_1_3', 0)
-                        ],
-                        ability_values=[
-                            (row.get('float_ability_value_1_1', 0) or 0) / 10000.0,
-                            (row.get('float_ability_value_1_2', 0) or 0) / 10000.0,
-                            (row.get('float_ability_value_1_3', 0) or 0) / 10000.0
-                        ],
-                        duration=(row.get('float_ability_time_1', 0) or 0) / 10000.0,
-                        cooldown=(row.get('float_cooldown_time_1', 0) or 0) / 10000.0,
-                        condition=row.get('condition_1')
-                    )
-
-                # Parse ability 2
-                ability_2 = None
-                if row.get('ability_type_2_1', 0) > 0:
-                    from models.skill import SkillAbility
-                    ability_2 = SkillAbility(
-                        ability_types=[
-                            row.get('ability_type_2_1', 0),
-                            row.get('ability_type_2_2', 0),
-                            row.get('ability_type_2_3', 0)
-                        ],
-                        ability_values=[
-                            (row.get('float_ability_value_2_1', 0) or 0) / 10000.0,
-                            (row.get('float_ability_value_2_2', 0) or 0) / 10000.0,
-                            (row.get('float_ability_value_2_3', 0) or 0) / 10000.0
-                        ],
-                        duration=(row.get('float_ability_time_2', 0) or 0) / 10000.0,
-                        cooldown=(row.get('float_cooldown_time_2', 0) or 0) / 10000.0,
-                        condition=row.get('condition_2')
-                    )
-
-                skill = Skill(
-                    skill_id=row['id'],
-                    name=row['name'] or f"Skill {row['id']}",
-                    name_en=row['name'],
-                    name_jp=row['name'],
-                    rarity=row['rarity'],
-                    grade_value=row['grade_value'],
-                    skill_category=row['skill_category'] or 0,
-                    description=row['description'],
-                    condition=row.get('condition_1'),  # Keep for single-ability skills
-                    icon_id=row.get('icon_id', 0),
-                    is_character_unique=row['id'] in character_unique_ids,
-                    unique_character_name=skill_to_character.get(row['id']),
-                    requires_wisdom=row.get('activate_lot', 0) == 1,
-                    sp_cost=skill_sp_costs.get(row['id']),
-                    ability_1=ability_1,
-                    ability_2=ability_2
+            for row in self.db.iter_named('skills.index'):
+                name = self.texts.skill_name(row.id)
+                skill = SkillSummary(
+                    skill_id=row.id,
+                    name=name or f"Skill {row.id}",
+                    rarity=row.rarity,
+                    grade_value=row.grade_value,
+                    skill_category=row.skill_category or 0,
+                    icon_id=row.icon_id,
+                    is_character_unique=row.id in character_unique_ids,
+                    unique_character_name=skill_to_character.get(row.id)
                 )
                 self.skills[skill.skill_id] = skill
 
                 # Index by name (support multiple skills with same name)
-                if row['name']:
-                    name_lower = row['name'].lower()
+                if name:
+                    name_lower = name.lower()
                     if name_lower not in self.name_index:
                         self.name_index[name_lower] = []
                     self.name_index[name_lower].append(skill.skill_id)
@@ -181,85 +163,328 @@ class SkillManager:
             logger.error(f"Failed to load skills: {e}")
             return False
 
-    def get_by_id(self, skill_id: int) -> Optional[Skill]:
-        """Get skill by ID."""
+    def _hydrate(self, summary: SkillSummary) -> Optional[Skill]:
+        """Read the full details of one skill from the database."""
+        if not self.db.connect():
+            return None
+        row = next(self.db.iter_named('skills.detail', (summary.skill_id,)), None)
+        if row is None:
+            return None
+
+        return Skill(
+            skill_id=summary.skill_id,
+            name=summary.name,
+            name_en=summary.name,
+            name_jp=summary.name,
+            rarity=summary.rarity,
+            grade_value=summary.grade_value,
+            skill_category=summary.skill_category,
+            description=self.texts.skill_description(summary.skill_id),
+            condition=row.condition_1,  # Keep for single-ability skills
+            icon_id=summary.icon_id,
+            is_character_unique=summary.is_character_unique,
+            unique_character_name=summary.unique_character_name,
+            requires_wisdom=row.activate_lot == 1,
+            sp_cost=row.need_skill_point,
+            ability_1=self._ability(row, 1),
+            ability_2=self._ability(row, 2)
+        )
+
+    @staticmethod
+    def _ability(row, slot: int) -> Optional[SkillAbility]:
+        """Build ability block 1 or 2 from a skills.detail row (None if unused)."""
+        types = [getattr(row, f'ability_type_{slot}_{i}') for i in (1, 2, 3)]
+        if (types[0] or 0) <= 0:
+            return None
+        return SkillAbility(
+            ability_types=types,
+            ability_values=[
+                (getattr(row, f'float_ability_value_{slot}_{i}') or 0) / 10000.0
+                for i in (1, 2, 3)
+            ],
+            duration=(getattr(row, f'float_ability_time_{slot}') or 0) / 10000.0,
+            cooldown=(getattr(row, f'float_cooldown_time_{slot}') or 0) / 10000.0,
+            condition=getattr(row, f'condition_{slot}')
+        )
+
+    async def aload(self) -> bool:
+        """Load skill data on the reader thread pool without blocking the event loop."""
+        return await self.db.run_async(self.load)
+
+    @property
+    def keys(self) -> NameKeyIndex:
+        """Width-folded, kana and romaji search keys of the skill names (built on first use)."""
+        if self._keys is None:
+            if not self._loaded:
+                self.load()
+            self._keys = NameKeyIndex(self.name_index.items())
+        return self._keys
+
+    @property
+    def fuzzy(self) -> FuzzyIndex:
+        """Fuzzy matcher over every search key of the skill names (built on first use)."""
+        if self._fuzzy is None:
+            self._fuzzy = FuzzyIndex(self.keys.items())
+        return self._fuzzy
+
+    @property
+    def facets(self) -> Optional[FacetIndex]:
+        """Bitset facet index over every skill (built on first use; None while the database cannot be read)."""
+        self._ensure_facets()
+        return self._facets
+
+    def _ensure_facets(self) -> bool:
+        """
+        Build the facet index unless it is already built.
+
+        Positions follow the index order (rarity, then grade, best first);
+        ability types, activation, SP cost and the compiled activation
+        conditions come from one extra query. Nothing is cached when the
+        skills cannot be read, so a later call tries again.
+
+        Returns:
+            bool: True if the index is available
+        """
+        if self._facets is not None:
+            return True
+        if not self.load() or not self.db.connect():
+            logger.error("Skill facet index unavailable: failed to read the skills")
+            return False
+
+        skill_ids = list(self.skills)
+        positions = {skill_id: position for position, skill_id in enumerate(skill_ids)}
+        facets = FacetIndex(len(skill_ids), {FACET_SP: SP_BUCKET_WIDTH})
+        conditions: List[Tuple[Condition, ...]] = [()] * len(skill_ids)
+        condition_masks: Dict[Condition, int] = {}
+        invalid = 0
+        for position, skill_id in enumerate(skill_ids):
+            summary = self.skills[skill_id]
+            facets.add(FACET_RARITY, summary.rarity, position)
+            facets.add(FACET_CATEGORY, summary.skill_category, position)
+            facets.add(FACET_UNIQUE, summary.is_character_unique, position)
+
+        try:
+            for row in self.db.iter_named('skills.facets', strict=True):
+                position = positions.get(row.id)
+                if position is None:
+                    continue
+                facets.add(FACET_WISDOM, row.activate_lot == 1, position)
+                facets.add_number(FACET_SP, row.need_skill_point, position)
+                for slot in ('1_1', '1_2', '1_3', '2_1', '2_2', '2_3'):
+                    ability_type = getattr(row, f'ability_type_{slot}') or 0
+                    if ability_type > 0:
+                        facets.add(FACET_ABILITY, ability_type, position)
+
+                compiled = []
+                for slot, text in ((1, row.condition_1), (2, row.condition_2)):
+                    if (getattr(row, f'ability_type_{slot}_1') or 0) <= 0:
+                        continue  # Unused ability block
+                    try:
+                        condition = parse_condition(text or "")
+                    except ConditionSyntaxError as e:
+                        logger.debug(f"Skill {row.id}: {e}")
+                        invalid += 1
+                        continue
+                    compiled.append(condition)
+                    condition_masks[condition] = condition_masks.get(condition, 0) | (1 << position)
+                    for variable in variables(condition):
+                        facets.add(FACET_CONDITION, variable, position)
+                conditions[position] = tuple(compiled)
+        except sqlite3.Error as e:
+            logger.error(f"Failed to build the skill facet index: {e}")
+            return False
+
+        if invalid:
+            logger.warning(f"Skipped {invalid} unparseable skill conditions")
+        self._facet_ids = skill_ids
+        self._facet_positions = positions
+        self._conditions = conditions
+        self._condition_masks = condition_masks
+        self._facets = facets
+        logger.info(f"Built skill facet index ({len(skill_ids)} skills)")
+        return True
+
+    def filter(self, rarity: Optional[int] = None, category: Optional[int] = None,
+               ability_types: Optional[Iterable[int]] = None, requires_wisdom: Optional[bool] = None,
+               unique: Optional[bool] = None, min_sp: Optional[int] = None,
+               max_sp: Optional[int] = None, condition: Optional[str] = None) -> List[SkillSummary]:
+        """
+        Get the skills matching every given condition (None means any).
+
+        Args:
+            rarity: Skill rarity
+            category: skill_category
+            ability_types: Ability types, any of which the skill must have
+            requires_wisdom: True for wisdom-check skills, False for guaranteed ones
+            unique: True for character unique skills only, False to exclude them
+            min_sp: Smallest SP cost (skills without a cost never match an SP bound)
+            max_sp: Largest SP cost
+            condition: Condition query, e.g. "phase>=2&corner" (see
+                condition_query)
+
+        Returns:
+            Matching skills, highest rarity and grade first (empty if the
+            facet index cannot be built)
+
+        Raises:
+            ConditionSyntaxError: If the condition query cannot be parsed
+        """
+        if not self._ensure_facets():
+            return []
+        facets = self._facets
+        mask = facets.everything
+        if rarity is not None:
+            mask &= facets.bits(FACET_RARITY, rarity)
+        if category is not None:
+            mask &= facets.bits(FACET_CATEGORY, category)
+        if ability_types is not None:
+            mask &= facets.any_of(FACET_ABILITY, ability_types)
+        if requires_wisdom is not None:
+            mask &= facets.bits(FACET_WISDOM, requires_wisdom)
+        if unique is not None:
+            mask &= facets.bits(FACET_UNIQUE, unique)
+        if mask and (min_sp is not None or max_sp is not None):
+            mask &= facets.range(FACET_SP, min_sp, max_sp)
+        if mask and condition:
+            mask &= self.condition_query(condition)
+        return [self.skills[self._facet_ids[position]] for position in facets.positions(mask)]
+
+    def condition_query(self, query: str) -> int:
+        """
+        Get the facet mask of skills whose activation conditions require a query.
+
+        The query uses the condition syntax ('&' and, '@' or), and a bare
+        variable matches any comparison on it. A skill matches a group of
+        terms when one alternative of one of its conditions implies them
+        all: "phase>=2" matches "phase==2" and "phase>=3" but not "phase>=1".
+        The per-variable bitsets narrow the candidates, and each distinct
+        compiled condition among them is checked once for all its skills.
+
+        Returns:
+            Facet mask (0 if the facet index cannot be built)
+
+        Raises:
+            ConditionSyntaxError: If the query cannot be parsed
+        """
+        groups = parse_query(query)
+        if not self._ensure_facets():
+            return 0
+        facets = self._facets
+        mask = 0
+        for group in groups:
+            candidates = facets.everything
+            for variable in {term.variable for term in group}:
+                candidates &= facets.bits(FACET_CONDITION, variable)
+            if not candidates:
+                continue
+            for condition, skills in self._condition_masks.items():
+                if skills & candidates and satisfies(condition, group):
+                    mask |= skills
+        return mask
+
+    def get_conditions(self, skill_id: int) -> Tuple[Condition, ...]:
+        """Get the compiled activation conditions of a skill (one per ability block that has one)."""
+        if not self._ensure_facets():
+            return ()
+        position = self._facet_positions.get(skill_id)
+        return self._conditions[position] if position is not None else ()
+
+    def get_summary(self, skill_id: int) -> Optional[SkillSummary]:
+        """Get the index entry of a skill by ID."""
         if not self._loaded:
             self.load()
         return self.skills.get(skill_id)
 
+    def get_by_id(self, skill_id: int) -> Optional[Skill]:
+        """Get a fully hydrated skill by ID (cached after the first view)."""
+        summary = self.get_summary(skill_id)
+        if summary is None:
+            return None
+
+        with self._details_lock:
+            skill = self._details.get(skill_id)
+            if skill is not None:
+                self._details.move_to_end(skill_id)
+                self.detail_hits += 1
+                return skill
+            self.detail_misses += 1
+
+        skill = self._hydrate(summary)
+        if skill is None:
+            return None
+        with self._details_lock:
+            self._details[skill_id] = skill
+            self._details.move_to_end(skill_id)
+            while len(self._details) > self.detail_cache_size:
+                self._details.popitem(last=False)
+        return skill
+
+    async def aget_by_id(self, skill_id: int) -> Optional[Skill]:
+        """Get a fully hydrated skill by ID, reading it on the reader pool on a cache miss."""
+        with self._details_lock:
+            cached = self._details.get(skill_id)
+        if cached is not None:
+            return self.get_by_id(skill_id)
+        return await self.db.run_async(self.get_by_id, skill_id)
+
+    def cache_info(self) -> Dict[str, int]:
+        """Get detail cache statistics."""
+        with self._details_lock:
+            return {
+                'size': len(self._details),
+                'max_size': self.detail_cache_size,
+                'hits': self.detail_hits,
+                'misses': self.detail_misses,
+            }
+
     def get_by_name(self, name: str) -> Optional[Skill]:
-        """Get skill by name (partial match). Returns first match."""
+        """Get skill by name (partial matches and typos supported). Returns the best match, hydrated."""
         if not self._loaded:
             self.load()
 
-        name_lower = name.lower()
-
-        # Exact match - return highest rarity/grade
-        if name_lower in self.name_index:
-            skill_ids = self.name_index[name_lower]
-            # Return the highest quality version (by rarity, then grade)
-            skills = [self.skills[sid] for sid in skill_ids]
-            best = max(skills, key=lambda s: (s.rarity, s.grade_value))
-            return best
+        # Exact match (under any form of the name), else the best partial or fuzzy match
+        skill_ids = self.name_index.get(name.lower()) or self.keys.get(name) or self.fuzzy.best(name)
+        if not skill_ids:
+            return None
 
-        # Partial match - return first highest quality match
-        for indexed_name, skill_ids in self.name_index.items():
-            if name_lower in indexed_name:
-                skills = [self.skills[sid] for sid in skill_ids]
-                best = max(skills, key=lambda s: (s.rarity, s.grade_value))
-                return best
+        # Return the highest quality version (by rarity, then grade)
+        skills = [self.skills[sid] for sid in skill_ids]
+        best = max(skills, key=lambda s: (s.rarity, s.grade_value))
+        return self.get_by_id(best.skill_id)
 
-        return None
-
-    def get_all(self) -> List[Skill]:
+    def get_all(self) -> List[SkillSummary]:
         """Get all skills."""
         if not self._loaded:
             self.load()
         return list(self.skills.values())
 
-    def get_by_rarity(self, rarity: int) -> List[Skill]:
+    def get_by_rarity(self, rarity: int) -> List[SkillSummary]:
         """Get skills by rarity."""
-        if not self._loaded:
-            self.load()
-        return [s for s in self.skills.values() if s.rarity == rarity]
+        return self.filter(rarity=rarity)
 
-    def get_by_category(self, category: int) -> List[Skill]:
+    def get_by_category(self, category: int) -> List[SkillSummary]:
         """Get skills by category."""
-        if not self._loaded:
-            self.load()
-        return [s for s in self.skills.values() if s.skill_category == category]
-
-    def search(self, query: str) -> List[Skill]:
-        """Search skills by name. Returns highest rarity version for each unique name."""
-        if not self._loaded:
-            self.load()
+        return self.filter(category=category)
 
-        query_lower = query.lower()
-        best_by_name = {}  # Track best skill for each unique display name
+    def search(self, query: str) -> List[SkillSummary]:
+        """
+        Search skills by name (partial matches and typos supported).
+        Returns the highest rarity version of each unique name, best match first.
+        """
+        best_by_name = {}  # Track best skill for each unique display name, in match order
 
-        for name, skill_ids in self.name_index.items():
-            if query_lower in name:
-                # Get all skills with this indexed name
-                skills_with_name = [self.skills[sid] for sid in skill_ids]
+        for skill_ids in self.fuzzy.matches(query):
+            # For each skill, keep only the best version per display name
+            for skill in (self.skills[sid] for sid in skill_ids):
+                skill_name = skill.display_name.lower()
 
-                # For each skill, keep only the best version per display name
-                for skill in skills_with_name:
-                    skill_name = skill.display_name.lower()
+                existing = best_by_name.get(skill_name)
+                if existing is None or (skill.rarity, skill.grade_value) > (existing.rarity, existing.grade_value):
+                    best_by_name[skill_name] = skill
 
-                    if skill_name not in best_by_name:
-                        best_by_name[skill_name] = skill
-                    else:
-                        # Compare with existing and keep the better one
-                        existing = best_by_name[skill_name]
-                        if (skill.rarity, skill.grade_value) > (existing.rarity, existing.grade_value):
-                            best_by_name[skill_name] = skill
+        return list(best_by_name.values())
 
-        # Convert to list and sort by quality (highest first)
-        results = list(best_by_name.values())
-        results.sort(key=lambda s: (s.rarity, s.grade_value), reverse=True)
-        return results
-
-    def get_top(self, limit: int = 10) -> List[Skill]:
+    def get_top(self, limit: int = 10) -> List[SkillSummary]:
         """Get top skills by grade value."""
         if not self._loaded:
             self.load()
@@ -271,6 +496,83 @@ class SkillManager:
         )
         return sorted_skills[:limit]
 
+    @property
+    def has_fts(self) -> bool:
+        """Whether the sidecar has the full-text skill index (see utils/sidecar.py)."""
+        if self._has_fts is None:
+            if not self.db.connect():
+                return False  # Not cached: ask again once the reader can connect
+            rows = self.db.query(
+                "SELECT name FROM idx.sqlite_master WHERE type = 'table' AND name = ?", (FTS_TABLE,)
+            )
+            self._has_fts = bool(rows)
+        return self._has_fts
+
+    def search_text(self, query: str, limit: int = SEARCH_LIMIT) -> List[SkillTextMatch]:
+        """
+        Search skill names, descriptions and activation conditions.
+
+        Ranked with BM25 over the sidecar's FTS5 index; falls back to LIKE
+        matching (ranked by where the terms were found) without FTS5 or for
+        Japanese queries, which the FTS tokenizer does not segment.
+
+        Args:
+            query: Free text, e.g. "recover stamina on the final corner"
+            limit: Maximum number of results
+
+        Returns:
+            Matches, best first
+        """
+        if not self._loaded:
+            self.load()
+        terms = search_terms(query)
+        if not terms:
+            return []
+        if self.has_fts and not _CJK.search(query):
+            return self._search_fts(terms, limit)
+        return self._search_like(terms, limit)
+
+    async def asearch_text(self, query: str, limit: int = SEARCH_LIMIT) -> List[SkillTextMatch]:
+        """Run search_text on the reader thread pool."""
+        return await self.db.run_async(self.search_text, query, limit)
+
+    def _search_fts(self, terms: List[str], limit: int) -> List[SkillTextMatch]:
+        """Rank with the FTS5 index: any term may match (as a prefix), BM25 decides the order."""
+        expression = " OR ".join(f'"{term}"*' for term in terms)
+        matches = []
+        for row in self.db.iter_named('skills.fts', (expression, limit)):
+            summary = self.skills.get(row.id)
+            if summary is None:
+                continue
+            # Show the description unless only the conditions matched
+            snippet = row.description or ""
+            if '**' not in snippet and '**' in (row.conditions or ""):
+                snippet = row.conditions
+            # bm25() is lower-is-better
+            matches.append(SkillTextMatch(summary, row.name or summary.display_name, snippet, -row.score))
+        return matches
+
+    def _search_like(self, terms: List[str], limit: int) -> List[SkillTextMatch]:
+        """Rank with one LIKE pass per term: name hits count most, then description, then conditions."""
+        scores: Dict[int, float] = {}
+        texts = {}
+        for term in terms:
+            for row in self.db.iter_named('skills.text_like', (f"%{term}%",)):
+                score = 10.0 * row.in_name + row.in_description + 0.5 * row.in_conditions
+                scores[row.id] = scores.get(row.id, 0.0) + score
+                texts[row.id] = (row.name, row.description or "")
+
+        matches = []
+        for skill_id, score in heapq.nlargest(limit, scores.items(), key=lambda item: item[1]):
+            summary = self.skills.get(skill_id)
+            if summary is None:
+                continue
+            name, description = texts[skill_id]
+            matches.append(SkillTextMatch(
+                summary, _highlight(name, terms), _highlight(_excerpt(description, terms), terms), score
+            ))
+        return matches
+
     def close(self):
         """Close database connection."""
         if self.db:
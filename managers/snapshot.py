@@ -0,0 +1,130 @@
+"""
+Binary snapshot of the loaded game data.
+
+A full load re-runs every manager query and rebuilds every model. The
+snapshot pickles the finished model graph next to master.mdb, stamped
+with the database fingerprint, so the next start can restore it in one
+read and only falls back to a full load when master.mdb (or the snapshot
+format) changed.
+"""
+import os
+import pickle
+import struct
+import sys
+from pathlib import Path
+from typing import Any, Dict, Optional
+import logging
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.sidecar import database_fingerprint
+
+logger = logging.getLogger('UmaMusumeBot.Snapshot')
+
+# Bump whenever a model dataclass, a manager's SNAPSHOT_FIELDS or what its
+# load() keeps change, so snapshots written by older code are rebuilt
+# instead of restored
+SNAPSHOT_FORMAT_VERSION = 3
+
+_MAGIC = b'UMASNAP\x00'
+_HEADER = struct.Struct('<8sIH')  # magic, format version, fingerprint length
+
+def snapshot_path_for(db_path) -> Path:
+    """Get the snapshot path for a database (master.mdb -> master.snapshot)."""
+    db_path = Path(db_path)
+    return db_path.with_name(f"{db_path.stem}.snapshot")
+
+def capture(components: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """
+    Collect the SNAPSHOT_FIELDS of every loaded component.
+
+    Args:
+        components: Name -> manager (or TextService)
+
+    Returns:
+        Name -> {field: value}
+    """
+    return {
+        name: {field: getattr(component, field) for field in component.SNAPSHOT_FIELDS}
+        for name, component in components.items()
+    }
+
+def restore(components: Dict[str, Any], state: Dict[str, Dict[str, Any]]):
+    """
+    Put captured fields back onto fresh components and mark them loaded.
+
+    Args:
+        components: Name -> manager (or TextService)
+        state: capture() output
+    """
+    for name, component in components.items():
+        for field, value in state[name].items():
+            setattr(component, field, value)
+        if hasattr(component, '_loaded'):
+            component._loaded = True
+
+def save_snapshot(db_path, version: str, components: Dict[str, Any]) -> Optional[Path]:
+    """
+    Write a snapshot of loaded components.
+
+    Args:
+        db_path: Path to master.mdb the components were loaded from
+        version: database_fingerprint() taken before loading
+        components: Name -> loaded manager (or TextService)
+
+    Returns:
+        Path to the snapshot, or None if it could not be written
+    """
+    path = snapshot_path_for(db_path)
+    tmp_path = path.with_name(path.name + '.tmp')
+    try:
+        payload = pickle.dumps(capture(components), protocol=pickle.HIGHEST_PROTOCOL)
+        fingerprint = version.encode('utf-8')
+        with open(tmp_path, 'wb') as f:
+            f.write(_HEADER.pack(_MAGIC, SNAPSHOT_FORMAT_VERSION, len(fingerprint)))
+            f.write(fingerprint)
+            f.write(payload)
+        os.replace(tmp_path, path)
+        logger.info(f"Wrote snapshot {path} ({len(payload) / 1024:,.0f} KiB)")
+        return path
+    except (OSError, pickle.PicklingError) as e:
+        logger.warning(f"Failed to write snapshot: {e}")
+        return None
+
+def load_snapshot(db_path, components: Dict[str, Any]) -> Optional[str]:
+    """
+    Restore components from the snapshot if it matches the current database.
+
+    Args:
+        db_path: Path to master.mdb
+        components: Name -> fresh manager (or TextService)
+
+    Returns:
+        The data version restored, or None if the snapshot is missing or stale
+    """
+    path = snapshot_path_for(db_path)
+    try:
+        current = database_fingerprint(db_path)
+        with open(path, 'rb') as f:
+            magic, format_version, length = _HEADER.unpack(f.read(_HEADER.size))
+            if magic != _MAGIC or format_version != SNAPSHOT_FORMAT_VERSION:
+                logger.info("Snapshot format changed, rebuilding")
+                return None
+            # The stamp sits before the payload, so stale snapshots are never unpickled
+            if f.read(length).decode('utf-8') != current:
+                logger.info("master.mdb changed since the snapshot, rebuilding")
+                return None
+            state = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, struct.error, UnicodeDecodeError, pickle.UnpicklingError,
+            EOFError, AttributeError, ImportError, TypeError) as e:
+        logger.warning(f"Ignoring unreadable snapshot: {e}")
+        return None
+
+    if set(state) != set(components):
+        logger.info("Snapshot components differ, rebuilding")
+        return None
+
+    restore(components, state)
+    return current
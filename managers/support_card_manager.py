@@ -7,6 +7,9 @@ import logging
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from utils.db_reader import MasterDBReader
+from utils.fuzzy_index import FuzzyIndex
+from utils.name_keys import NameKeyIndex, character_aliases
+from managers.text_service import TextService, get_text_service
 from models.support_card import SupportCard
 
 logger = logging.getLogger('UmaMusumeBot.SupportCardManager')
@@ -14,12 +17,18 @@ logger = logging.getLogger('UmaMusumeBot.SupportCardManager')
 class SupportCardManager:
     """Manages support card data from the database."""
 
-    def __init__(self, db_path: str = "./data/master.mdb"):
+    # Loaded state captured by managers/snapshot.py
+    SNAPSHOT_FIELDS = ('cards', 'character_index')
+
+    def __init__(self, db_path: str = "./data/master.mdb", text_service: Optional[TextService] = None):
         """Initialize the support card manager."""
         self.db_path = db_path
-        self.db = MasterDBReader(db_path)
+        self.db = MasterDBReader(db_path, attach_sidecar=True)
+        self.texts = text_service or get_text_service(db_path)
         self.cards: Dict[int, SupportCard] = {}
         self.character_index: Dict[str, List[int]] = {}  # character_name -> list of card_ids
+        self._keys: Optional[NameKeyIndex] = None
+        self._fuzzy: Optional[FuzzyIndex] = None
         self._loaded = False
 
     def load(self) -> bool:
@@ -27,46 +36,29 @@ class SupportCardManager:
         if self._loaded:
             return True
 
-        if not self.db.connect():
+        if not self.db.connect() or not self.texts.load():
             logger.error("Failed to connect to database")
             return False
 
         try:
-            query = """
-            SELECT
-                sc.id,
-                sc.chara_id,
-                sc.rarity,
-                sc.command_id,
-                sc.support_card_type,
-                sc.skill_set_id,
-                sc.effect_table_id,
-                sc.unique_effect_id,
-                t.text as chara_name
-            FROM support_card_data sc
-            LEFT JOIN text_data t ON t.category = 6 AND t.[index] = sc.chara_id
-            ORDER BY sc.rarity DESC, sc.command_id, sc.id
-            """
-
-            results = self.db.query(query)
-
-            for row in results:
+            for row in self.db.iter_named('support_cards.all'):
+                chara_name = self.texts.chara_name(row.chara_id)
                 card = SupportCard(
-                    card_id=row['id'],
-                    chara_id=row['chara_id'],
-                    character_name=row['chara_name'] or "Unknown",
-                    rarity=row['rarity'],
-                    command_id=row.get('command_id', 0),
-                    support_card_type=row['support_card_type'],
-                    skill_set_id=row.get('skill_set_id'),
-                    effect_table_id=row.get('effect_table_id'),
-                    unique_effect_id=row.get('unique_effect_id')
+                    card_id=row.id,
+                    chara_id=row.chara_id,
+                    character_name=chara_name or "Unknown",
+                    rarity=row.rarity,
+                    command_id=row.command_id,
+                    support_card_type=row.support_card_type,
+                    skill_set_id=row.skill_set_id,
+                    effect_table_id=row.effect_table_id,
+                    unique_effect_id=row.unique_effect_id
                 )
                 self.cards[card.card_id] = card
 
                 # Index by character name
-                if row['chara_name']:
-                    char_name_lower = row['chara_name'].lower()
+                if chara_name:
+                    char_name_lower = chara_name.lower()
                     if char_name_lower not in self.character_index:
                         self.character_index[char_name_lower] = []
                     self.character_index[char_name_lower].append(card.card_id)
@@ -79,6 +71,26 @@ class SupportCardManager:
             logger.error(f"Failed to load support cards: {e}")
             return False
 
+    async def aload(self) -> bool:
+        """Load support card data on the reader thread pool without blocking the event loop."""
+        return await self.db.run_async(self.load)
+
+    @property
+    def keys(self) -> NameKeyIndex:
+        """Kana, romaji and English/Japanese search keys of the character names (built on first use)."""
+        if self._keys is None:
+            if not self._loaded:
+                self.load()
+            self._keys = NameKeyIndex(self.character_index.items(), aliases=character_aliases)
+        return self._keys
+
+    @property
+    def fuzzy(self) -> FuzzyIndex:
+        """Fuzzy matcher over every search key of the character names (built on first use)."""
+        if self._fuzzy is None:
+            self._fuzzy = FuzzyIndex(self.keys.items())
+        return self._fuzzy
+
     def get_by_id(self, card_id: int) -> Optional[SupportCard]:
         """Get support card by ID."""
         if not self._loaded:
@@ -86,19 +98,14 @@ class SupportCardManager:
         return self.cards.get(card_id)
 
     def get_by_character_name(self, name: str) -> List[SupportCard]:
-        """Get support cards by character name (partial match)."""
-        if not self._loaded:
-            self.load()
+        """Get support cards by character name (partial matches and typos supported)."""
+        card_ids = self.keys.get(name)
+        if card_ids is not None:
+            return [self.cards[card_id] for card_id in card_ids]
 
-        name_lower = name.lower()
         matching_cards = []
-
-        # Search for partial matches
-        for indexed_name, card_ids in self.character_index.items():
-            if name_lower in indexed_name:
-                for card_id in card_ids:
-                    matching_cards.append(self.cards[card_id])
-
+        for card_ids in self.fuzzy.matches(name):
+            matching_cards.extend(self.cards[card_id] for card_id in card_ids)
         return matching_cards
 
     def get_all(self) -> List[SupportCard]:
@@ -0,0 +1,166 @@
+"""Shared localized text lookups from text_data."""
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Set
+import logging
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.db_reader import MasterDBReader, SHAPE_TUPLE
+from utils.sidecar import TEXT_CATEGORIES
+
+logger = logging.getLogger('UmaMusumeBot.TextService')
+
+# text_data categories
+CATEGORY_CARD_TITLE = 5
+CATEGORY_CHARA_NAME = 6
+CATEGORY_RACE_NAME = 30
+CATEGORY_SKILL_NAME = 47
+CATEGORY_SKILL_DESCRIPTION = 48
+
+DEFAULT_CATEGORIES = (
+    CATEGORY_CARD_TITLE,
+    CATEGORY_CHARA_NAME,
+    CATEGORY_RACE_NAME,
+    CATEGORY_SKILL_NAME,
+    CATEGORY_SKILL_DESCRIPTION,
+)
+
+class TextService:
+    """Bulk-loads text_data categories once into (category, index) -> text maps."""
+
+    # Loaded state captured by managers/snapshot.py
+    SNAPSHOT_FIELDS = ('texts',)
+
+    def __init__(self, db_path: str = "./data/master.mdb"):
+        """
+        Initialize the text service.
+
+        Args:
+            db_path: Path to the master.mdb file
+        """
+        self.db_path = db_path
+        self.db = MasterDBReader(db_path, attach_sidecar=True)
+        self.texts: Dict[int, Dict[int, str]] = {}  # category -> {index: text}
+        self._failed: Set[int] = set()  # Categories whose last load failed; get() does not retry them
+        self._lock = threading.Lock()
+
+    def load(self, categories: Iterable[int] = DEFAULT_CATEGORIES) -> bool:
+        """
+        Load text categories that are not loaded yet.
+
+        Categories are stored only once their query has read every row, so
+        a failed load leaves nothing half-filled; it is remembered, and
+        only an explicit load() (e.g. on the next reload) retries it.
+
+        Args:
+            categories: text_data categories to load
+
+        Returns:
+            bool: True if successful
+        """
+        with self._lock:
+            missing = sorted(set(categories) - set(self.texts))
+            if not missing:
+                return True
+
+            if not self.db.connect():
+                logger.error("Failed to connect to database")
+                self._failed.update(missing)
+                return False
+
+            loaded: Dict[int, Dict[int, str]] = {category: {} for category in missing}
+            try:
+                # Overlay categories come from the sidecar, anything else from master.mdb
+                overlay = [c for c in missing if c in TEXT_CATEGORIES]
+                other = [c for c in missing if c not in TEXT_CATEGORIES]
+                for table, group in (('idx.text_data', overlay), ('text_data', other)):
+                    if not group:
+                        continue
+                    placeholders = ','.join('?' * len(group))
+                    query = f"""
+                    SELECT category, [index], text
+                    FROM {table}
+                    WHERE category IN ({placeholders})
+                    """
+                    for category, index, text in self.db.iter_query(query, tuple(group), shape=SHAPE_TUPLE,
+                                                                    strict=True):
+                        loaded[category][index] = text
+
+            except sqlite3.Error as e:
+                self._failed.update(missing)
+                logger.error(f"Failed to load texts for categories {missing}: {e}")
+                return False
+
+            self.texts.update(loaded)
+            self._failed.difference_update(missing)
+            total = sum(len(texts) for texts in loaded.values())
+            logger.info(f"Loaded {total} texts for categories {missing}")
+            return True
+
+    async def aload(self, categories: Iterable[int] = DEFAULT_CATEGORIES) -> bool:
+        """Load text categories on the reader thread pool."""
+        return await self.db.run_async(self.load, categories)
+
+    def get(self, category: int, index: int, default: Optional[str] = None) -> Optional[str]:
+        """
+        Get a text entry, loading its category on first use (a category
+        that failed to load is not retried here).
+
+        Args:
+            category: text_data category
+            index: text_data index (usually the entity ID)
+            default: Value returned when the entry is missing
+
+        Returns:
+            The text, or default
+        """
+        if category not in self.texts and category not in self._failed:
+            self.load((category,))
+        return self.texts.get(category, {}).get(index, default)
+
+    def card_title(self, card_id: int) -> Optional[str]:
+        """Get a character card title (including its [brackets])."""
+        return self.get(CATEGORY_CARD_TITLE, card_id)
+
+    def chara_name(self, chara_id: int) -> Optional[str]:
+        """Get a character name."""
+        return self.get(CATEGORY_CHARA_NAME, chara_id)
+
+    def race_name(self, race_id: int) -> Optional[str]:
+        """Get a race name."""
+        return self.get(CATEGORY_RACE_NAME, race_id)
+
+    def skill_name(self, skill_id: int) -> Optional[str]:
+        """Get a skill name."""
+        return self.get(CATEGORY_SKILL_NAME, skill_id)
+
+    def skill_description(self, skill_id: int) -> Optional[str]:
+        """Get a skill description."""
+        return self.get(CATEGORY_SKILL_DESCRIPTION, skill_id)
+
+    def close(self):
+        """Close database connection."""
+        if self.db:
+            self.db.close()
+
+_services: Dict[str, TextService] = {}
+_services_lock = threading.Lock()
+
+def get_text_service(db_path: str = "./data/master.mdb") -> TextService:
+    """
+    Get the shared TextService for a database, creating it on first use.
+
+    Args:
+        db_path: Path to the master.mdb file
+
+    Returns:
+        The process-wide TextService for that file
+    """
+    key = str(Path(db_path).resolve())
+    with _services_lock:
+        if key not in _services:
+            _services[key] = TextService(db_path)
+        return _services[key]
@@ -1,6 +1,6 @@
 """Skill data models."""
 from dataclasses import dataclass
-from typing import Optional, List
+from typing import Optional, List, NamedTuple
 import sys
 from pathlib import Path
 
@@ -83,3 +83,43 @@ class Skill:
     def icon_emoji(self) -> str:
         """Get skill icon Discord emoji."""
         return get_skill_icon_emoji(self.icon_id)
+
+class SkillSummary(NamedTuple):
+    """
+    Compact, always-resident index entry for a skill.
+
+    Lists, searches and selectors only need these fields; the full Skill
+    (abilities, conditions, description) is hydrated by SkillManager.get_by_id.
+    """
+    skill_id: int
+    name: str
+    rarity: int = 0
+    grade_value: int = 0
+    skill_category: int = 0
+    icon_id: int = 0
+    is_character_unique: bool = False
+    unique_character_name: Optional[str] = None
+
+    @property
+    def display_name(self) -> str:
+        """Get display name."""
+        return self.name or f"Skill {self.skill_id}"
+
+    @property
+    def rarity_stars(self) -> str:
+        """Get star representation of rarity."""
+        if self.rarity == 0:
+            return "N"
+        return "★" * self.rarity
+
+    @property
+    def icon_emoji(self) -> str:
+        """Get skill icon Discord emoji."""
+        return get_skill_icon_emoji(self.icon_id)
+
+class SkillTextMatch(NamedTuple):
+    """One full-text search hit (see SkillManager.search_text)."""
+    summary: SkillSummary
+    highlighted_name: str  # Name with matched terms in **bold**
+    snippet: str  # Best matching passage with matched terms in **bold**
+    score: float  # Higher is better
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Benchmark name autocomplete under concurrent keystroke load.
+
+Simulated users type random names one character at a time, all on one
+event loop the way the bot answers autocomplete interactions. "Service"
+is the time spent inside the completer for one keystroke; "response" also
+includes waiting behind other users' keystrokes. A substring scan over the
+manager name index (what the lookups do) is timed on the same keystrokes
+for comparison.
+"""
+import sys
+import asyncio
+import random
+import time
+import logging
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from managers import GameData
+from managers.autocomplete import BUILDERS, MAX_SUGGESTIONS
+from utils.db_reader import shutdown_reader_pool
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Get a percentile (0-100) of a list of samples."""
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+def linear_scan(names: List[str], query: str) -> List[str]:
+    """Substring scan over every name, as a baseline."""
+    query = query.lower()
+    return [name for name in names if query in name.lower()][:MAX_SUGGESTIONS]
+
+async def simulate_user(game_data, loc, keystrokes: List[Tuple[str, str]],
+                        service: Dict[str, List[float]], response: Dict[str, List[float]]):
+    """
+    Type a sequence of prefixes, yielding to the other users between keystrokes.
+
+    Args:
+        game_data: Loaded GameData
+        loc: Localizer to complete in
+        keystrokes: (kind, text typed so far) pairs
+        service: kind -> completer time samples (ms), appended to
+        response: kind -> keystroke-to-answer samples (ms), appended to
+    """
+    for kind, typed in keystrokes:
+        sent = time.perf_counter()
+        await asyncio.sleep(0)  # Queue behind everyone else's keystrokes
+        started = time.perf_counter()
+        game_data.completer.complete(kind, typed, loc)
+        ended = time.perf_counter()
+        service[kind].append((ended - started) * 1000)
+        response[kind].append((ended - sent) * 1000)
+
+async def run_benchmark(db_path: str, users: int = 50, names_per_user: int = 5, seed: int = 1):
+    """
+    Run the concurrent keystroke simulation and print latency percentiles.
+
+    Args:
+        db_path: Path to the database file
+        users: Number of concurrent simulated users
+        names_per_user: Names each user types
+        seed: Random seed for the typed names
+    """
+    game_data = GameData(db_path, use_snapshot=False)
+    if not await game_data.aload():
+        print(f"❌ Failed to load game data from {db_path}")
+        return
+    loc = game_data.localizer()
+    started, ended = game_data.timings['autocomplete']
+
+    rng = random.Random(seed)
+    names = {kind: [name for name, _, _ in build(game_data, loc)] for kind, build in BUILDERS.items()}
+    streams = []
+    for _ in range(users):
+        keystrokes = []
+        for _ in range(names_per_user):
+            kind = rng.choice([kind for kind in names if names[kind]])
+            name = rng.choice(names[kind])
+            keystrokes.extend((kind, name[:i]) for i in range(1, len(name) + 1))
+        streams.append(keystrokes)
+    total = sum(len(keystrokes) for keystrokes in streams)
+
+    service = {kind: [] for kind in names}
+    response = {kind: [] for kind in names}
+    wall_start = time.perf_counter()
+    await asyncio.gather(*(simulate_user(game_data, loc, keystrokes, service, response) for keystrokes in streams))
+    wall = time.perf_counter() - wall_start
+
+    baseline = {kind: [] for kind in names}
+    for keystrokes in streams:
+        for kind, typed in keystrokes:
+            scan_start = time.perf_counter()
+            linear_scan(names[kind], typed)
+            baseline[kind].append((time.perf_counter() - scan_start) * 1000)
+
+    print(f"\n⌨️  Autocomplete: {users} users, {total:,} keystrokes (milliseconds)")
+    print(f"Indexes built in {(ended - started) * 1000:.1f} ms")
+    print("=" * 86)
+    print(f"{'Kind':<12} {'Names':>6} {'Keys':>7} {'svc p50':>8} {'svc p99':>8} {'svc max':>8} "
+          f"{'resp p50':>9} {'resp p99':>9} {'scan p99':>9}")
+    print("-" * 86)
+    for kind in names:
+        if not service[kind]:
+            continue
+        print(f"{kind:<12} {len(names[kind]):>6,} {len(service[kind]):>7,} "
+              f"{percentile(service[kind], 50):>8.3f} {percentile(service[kind], 99):>8.3f} {max(service[kind]):>8.3f} "
+              f"{percentile(response[kind], 50):>9.3f} {percentile(response[kind], 99):>9.3f} "
+              f"{percentile(baseline[kind], 99):>9.3f}")
+    print("=" * 86)
+    print(f"Throughput: {total / wall:,.0f} keystrokes/s on one event loop")
+    game_data.close()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark autocomplete latency under concurrent keystrokes")
+    parser.add_argument(
+        "--db",
+        default="./data/master.mdb",
+        help="Path to master database (default: ./data/master.mdb)"
+    )
+    parser.add_argument(
+        "--users",
+        type=int,
+        default=50,
+        help="Concurrent simulated users (default: 50)"
+    )
+    parser.add_argument(
+        "--names",
+        type=int,
+        default=5,
+        help="Names typed per user (default: 5)"
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=1,
+        help="Random seed (default: 1)"
+    )
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    if not Path(args.db).exists():
+        print(f"❌ Database not found: {args.db}")
+        sys.exit(1)
+
+    asyncio.run(run_benchmark(args.db, args.users, args.names, args.seed))
+    shutdown_reader_pool()
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Benchmark manager load times against master.mdb.
+Compares the default sqlite connection with the read-only immutable mode,
+for both cold (file evicted from the OS page cache) and warm loads, and
+compares the MasterDBReader result shapes on the skill and character tables,
+and compares loading all managers one after another against loading them
+concurrently on a thread pool.
+"""
+import sys
+import os
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.db_reader import MasterDBReader
+from managers import CharacterManager, SkillManager, SupportCardManager, RaceManager, TextService
+
+MANAGERS = [CharacterManager, SkillManager, SupportCardManager, RaceManager]
+
+# Raw table scans behind SkillManager.load() and CharacterManager.load()
+SHAPE_QUERIES = {
+    'skills': "SELECT * FROM skill_data WHERE rarity > 0",
+    'characters': """
+        SELECT * FROM card_data c
+        JOIN card_rarity_data cr ON cr.card_id = c.id
+        WHERE c.default_rarity > 0
+    """,
+}
+
+def evict_page_cache(db_path: str) -> bool:
+    """
+    Ask the OS to drop the database file from the page cache.
+
+    Args:
+        db_path: Path to the database file
+
+    Returns:
+        bool: True if the hint was issued (Linux only)
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return False
+    fd = os.open(db_path, os.O_RDONLY)
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        return True
+    finally:
+        os.close(fd)
+
+def time_load(manager_cls, db_path: str, read_only: bool) -> float:
+    """
+    Load a fresh manager and return the elapsed time in milliseconds.
+
+    Args:
+        manager_cls: Manager class to instantiate
+        db_path: Path to the database file
+        read_only: Whether to use the read-only connection mode
+    """
+    manager = manager_cls(db_path)
+    manager.db = MasterDBReader(db_path, read_only=read_only, attach_sidecar=True)
+    start = time.perf_counter()
+    if not manager.load():
+        raise RuntimeError(f"{manager_cls.__name__} failed to load")
+    elapsed = (time.perf_counter() - start) * 1000
+    manager.close()
+    return elapsed
+
+def run_benchmark(db_path: str, rounds: int = 3):
+    """
+    Run cold and warm loads of every manager in both connection modes.
+
+    Args:
+        db_path: Path to the database file
+        rounds: Number of rounds to average over
+    """
+    if not Path(db_path).exists():
+        print(f"❌ Database not found: {db_path}")
+        return
+
+    can_evict = evict_page_cache(db_path)
+    if not can_evict:
+        print("⚠️  posix_fadvise unavailable - cold numbers will include cached pages")
+
+    print(f"\n📊 Manager load times ({rounds} rounds, milliseconds)")
+    print("=" * 72)
+    print(f"{'Manager':<22} {'Mode':<11} {'Cold':>10} {'Warm':>10}")
+    print("-" * 72)
+
+    for manager_cls in MANAGERS:
+        for read_only in (False, True):
+            cold = []
+            warm = []
+            for _ in range(rounds):
+                evict_page_cache(db_path)
+                cold.append(time_load(manager_cls, db_path, read_only))
+                warm.append(time_load(manager_cls, db_path, read_only))
+
+            mode = "read-only" if read_only else "default"
+            print(f"{manager_cls.__name__:<22} {mode:<11} "
+                  f"{sum(cold) / rounds:>10.1f} {sum(warm) / rounds:>10.1f}")
+
+    print("=" * 72)
+
+def benchmark_result_shapes(db_path: str, rounds: int = 3):
+    """
+    Compare dict, tuple, record and columnar result shapes.
+
+    Args:
+        db_path: Path to the database file
+        rounds: Number of rounds to average over
+    """
+    db = MasterDBReader(db_path)
+    if not db.connect():
+        print(f"❌ Failed to connect to {db_path}")
+        return
+
+    shapes = {
+        'dict': db.query,
+        'tuple': db.query_tuples,
+        'record': db.query_records,
+        'columns': db.query_columns,
+    }
+
+    print(f"\n📊 Result shape fetch times ({rounds} rounds, milliseconds)")
+    print("=" * 72)
+    print(f"{'Query':<14}" + "".join(f"{name:>12}" for name in shapes))
+    print("-" * 72)
+
+    for label, sql in SHAPE_QUERIES.items():
+        timings = []
+        for fetch in shapes.values():
+            total = 0.0
+            for _ in range(rounds):
+                start = time.perf_counter()
+                fetch(sql)
+                total += time.perf_counter() - start
+            timings.append(total / rounds * 1000)
+        print(f"{label:<14}" + "".join(f"{t:>12.1f}" for t in timings))
+
+    print("=" * 72)
+    db.close()
+
+def time_load_all(db_path: str, concurrent: bool) -> float:
+    """
+    Load every manager with a fresh TextService and return the elapsed milliseconds.
+
+    Args:
+        db_path: Path to the database file
+        concurrent: Load the managers in parallel on a thread pool
+    """
+    texts = TextService(db_path)
+    managers = [manager_cls(db_path, text_service=texts) for manager_cls in MANAGERS]
+    start = time.perf_counter()
+    if concurrent:
+        with ThreadPoolExecutor(max_workers=len(managers)) as executor:
+            results = list(executor.map(lambda manager: manager.load(), managers))
+    else:
+        results = [manager.load() for manager in managers]
+    elapsed = (time.perf_counter() - start) * 1000
+    if not all(results):
+        raise RuntimeError("A manager failed to load")
+    for manager in managers:
+        manager.close()
+    texts.close()
+    return elapsed
+
+def benchmark_concurrent_loading(db_path: str, rounds: int = 3):
+    """
+    Compare sequential and concurrent loading of all managers.
+
+    Args:
+        db_path: Path to the database file
+        rounds: Number of rounds to average over
+    """
+    print(f"\n📊 All managers, warm ({rounds} rounds, milliseconds)")
+    print("=" * 72)
+    for label, concurrent in (("sequential", False), ("concurrent", True)):
+        total = sum(time_load_all(db_path, concurrent) for _ in range(rounds))
+        print(f"{label:<22} {total / rounds:>10.1f}")
+    print("=" * 72)
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark manager load times")
+    parser.add_argument(
+        "--db",
+        default="./data/master.mdb",
+        help="Path to master database (default: ./data/master.mdb)"
+    )
+    parser.add_argument(
+        "--rounds",
+        type=int,
+        default=3,
+        help="Number of rounds to average (default: 3)"
+    )
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    run_benchmark(args.db, args.rounds)
+    benchmark_result_shapes(args.db, args.rounds)
+    benchmark_concurrent_loading(args.db, args.rounds)
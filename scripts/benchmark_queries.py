@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Benchmark every registered query (utils/queries.py) against master.mdb.
+Reports the first execution on a fresh connection (statement prepared)
+next to the average of later executions (statement reused from the cache),
+the row count and the query plan, and compares the join-based card skill
+query with the IN-list statement it replaced.
+"""
+import sys
+import time
+import logging
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.db_reader import MasterDBReader, SHAPE_TUPLE
+from utils.queries import all_queries, get_query
+
+def time_query(db: MasterDBReader, sql: str, params: tuple = ()) -> float:
+    """
+    Run a statement to completion and return the elapsed time in milliseconds.
+
+    Args:
+        db: Connected reader
+        sql: SQL statement
+        params: Query parameters
+    """
+    start = time.perf_counter()
+    for _ in db.iter_query(sql, params, shape=SHAPE_TUPLE):
+        pass
+    return (time.perf_counter() - start) * 1000
+
+def benchmark_named_queries(db_path: str, rounds: int = 5, show_plans: bool = False):
+    """
+    Time every registered query.
+
+    Args:
+        db_path: Path to the database file
+        rounds: Number of reuse rounds to average over
+        show_plans: Print EXPLAIN QUERY PLAN output for each query
+    """
+    db = MasterDBReader(db_path, attach_sidecar=True)
+    if not db.connect():
+        print(f"❌ Failed to connect to {db_path}")
+        return
+
+    print(f"\n📊 Named queries ({rounds} rounds, milliseconds)")
+    print("=" * 72)
+    print(f"{'Query':<32} {'Rows':>8} {'Prepare':>10} {'Reuse':>10}")
+    print("-" * 72)
+
+    for query in all_queries():
+        params = query.sample_params
+        first = time_query(db, query.sql, params)
+        rows = sum(1 for _ in db.iter_named(query.name, params, shape=SHAPE_TUPLE))
+        reuse = sum(time_query(db, query.sql, params) for _ in range(rounds)) / rounds
+        print(f"{query.name:<32} {rows:>8} {first:>10.1f} {reuse:>10.1f}")
+        if show_plans:
+            for line in db.explain(query.sql, params):
+                print(f"    {line}")
+
+    print("=" * 72)
+    db.close()
+
+def benchmark_in_list(db_path: str, rounds: int = 5):
+    """
+    Compare the join-based card skill query with the old IN-list form.
+
+    Args:
+        db_path: Path to the database file
+        rounds: Number of rounds to average over
+    """
+    db = MasterDBReader(db_path, attach_sidecar=True)
+    if not db.connect():
+        print(f"❌ Failed to connect to {db_path}")
+        return
+
+    card_ids = tuple(
+        row[0] for row in db.iter_query(
+            "SELECT id FROM card_data WHERE default_rarity > 0", shape=SHAPE_TUPLE
+        )
+    )
+    placeholders = ','.join('?' * len(card_ids))
+    in_list_sql = f"""
+    SELECT a.available_skill_set_id, a.skill_id, a.need_rank, s.icon_id
+    FROM idx.available_skill_set a
+    LEFT JOIN skill_data s ON s.id = a.skill_id
+    WHERE a.available_skill_set_id IN ({placeholders})
+    ORDER BY a.available_skill_set_id, a.need_rank
+    """
+    join_sql = get_query('characters.card_skills').sql
+
+    print(f"\n📊 Card skills for {len(card_ids)} cards ({rounds} rounds, milliseconds)")
+    print("=" * 72)
+    in_list = sum(time_query(db, in_list_sql, card_ids) for _ in range(rounds)) / rounds
+    join = sum(time_query(db, join_sql) for _ in range(rounds)) / rounds
+    print(f"{'IN-list':<32} {in_list:>10.1f}")
+    print(f"{'join on card_data':<32} {join:>10.1f}")
+    print("=" * 72)
+    db.close()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark registered queries")
+    parser.add_argument(
+        "--db",
+        default="./data/master.mdb",
+        help="Path to master database (default: ./data/master.mdb)"
+    )
+    parser.add_argument(
+        "--rounds",
+        type=int,
+        default=5,
+        help="Number of rounds to average (default: 5)"
+    )
+    parser.add_argument(
+        "--plans",
+        action="store_true",
+        help="Print the query plan for each query"
+    )
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    if not Path(args.db).exists():
+        print(f"❌ Database not found: {args.db}")
+        sys.exit(1)
+
+    benchmark_named_queries(args.db, args.rounds, args.plans)
+    benchmark_in_list(args.db, args.rounds)
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark game data start-up with and without the binary snapshot.
+"Full load" runs every manager query against master.mdb; "snapshot"
+restores the pickled model graph written by the previous full load.
+"""
+import sys
+import asyncio
+import time
+import logging
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from managers import GameData
+from managers.snapshot import snapshot_path_for, save_snapshot
+from utils.db_reader import shutdown_reader_pool
+
+async def time_start(db_path: str, use_snapshot: bool) -> float:
+    """
+    Load a fresh GameData and return the elapsed time in milliseconds.
+
+    Args:
+        db_path: Path to the database file
+        use_snapshot: Restore from the snapshot instead of a full load
+    """
+    game_data = GameData(db_path, use_snapshot=use_snapshot)
+    start = time.perf_counter()
+    if not await game_data.aload():
+        raise RuntimeError(f"Game data failed to load: {game_data.failures}")
+    elapsed = (time.perf_counter() - start) * 1000
+    if use_snapshot and not game_data.from_snapshot:
+        raise RuntimeError("Snapshot was not used")
+    game_data.close()
+    return elapsed
+
+async def run_benchmark(db_path: str, rounds: int = 3):
+    """
+    Compare full loads with snapshot restores.
+
+    Args:
+        db_path: Path to the database file
+        rounds: Number of rounds to average over
+    """
+    # Make sure a current snapshot exists before timing restores
+    game_data = GameData(db_path, use_snapshot=False)
+    if not await game_data.aload():
+        print(f"❌ Failed to load game data from {db_path}")
+        return
+    save_snapshot(db_path, game_data.version, game_data.components)
+    game_data.close()
+    size = snapshot_path_for(db_path).stat().st_size
+
+    print(f"\n📊 Game data start-up ({rounds} rounds, milliseconds)")
+    print("=" * 60)
+    full = [await time_start(db_path, use_snapshot=False) for _ in range(rounds)]
+    warm = [await time_start(db_path, use_snapshot=True) for _ in range(rounds)]
+    print(f"{'Full load':<20} {sum(full) / rounds:>10.1f}")
+    print(f"{'Snapshot':<20} {sum(warm) / rounds:>10.1f}")
+    print(f"{'Speed-up':<20} {sum(full) / max(sum(warm), 1e-9):>9.1f}x")
+    print(f"{'Snapshot size':<20} {size / 1024:>7,.0f} KiB")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark snapshot warm starts")
+    parser.add_argument(
+        "--db",
+        default="./data/master.mdb",
+        help="Path to master database (default: ./data/master.mdb)"
+    )
+    parser.add_argument(
+        "--rounds",
+        type=int,
+        default=3,
+        help="Number of rounds to average (default: 3)"
+    )
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    if not Path(args.db).exists():
+        print(f"❌ Database not found: {args.db}")
+        sys.exit(1)
+
+    asyncio.run(run_benchmark(args.db, args.rounds))
+    shutdown_reader_pool()
@@ -0,0 +1,36 @@
+"""Autocomplete callbacks for the name parameters of the lookup commands."""
+import sys
+from pathlib import Path
+from typing import List
+
+import discord
+from discord import app_commands
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from managers.autocomplete import MAX_SUGGESTIONS
+from managers.locale_prefs import localizer_for
+
+# Discord limit for choice names and string values
+CHOICE_MAX_LENGTH = 100
+
+def suggest_names(interaction: discord.Interaction, kind: str, current: str) -> List[app_commands.Choice[str]]:
+    """
+    Suggest names of one kind, in the user's language, for the text typed so far.
+
+    Args:
+        interaction: Autocomplete interaction
+        kind: managers.autocomplete kind (KIND_CHARACTER, KIND_SKILL, ...)
+        current: Text typed so far
+
+    Returns:
+        Up to 25 choices (none while the game data is not ready)
+    """
+    game_data = getattr(interaction.client, 'game_data', None)
+    if game_data is None or not game_data.ready:
+        return []
+    names = game_data.completer.complete(kind, current, localizer_for(interaction), MAX_SUGGESTIONS)
+    return [
+        app_commands.Choice(name=name[:CHOICE_MAX_LENGTH], value=name[:CHOICE_MAX_LENGTH])
+        for name in names
+    ]
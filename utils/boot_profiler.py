@@ -0,0 +1,258 @@
+"""
+Start-up instrumentation: phase timings, per-extension load times, per-module
+import times and memory at the end of each phase.
+
+bot.py starts the import timer before importing discord.py and wraps each
+boot phase; once the bot is connected and the game data has loaded it logs
+the report, and `!bootreport` shows it again on demand.
+"""
+import json
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+import logging
+
+try:
+    from utils.process_stats import current_rss, peak_rss, format_bytes
+except ImportError:
+    from process_stats import current_rss, peak_rss, format_bytes
+
+logger = logging.getLogger('UmaMusumeBot.Boot')
+
+@dataclass
+class PhaseTiming:
+    """One timed start-up phase (offsets are seconds since boot)."""
+    name: str
+    start: float
+    end: Optional[float] = None
+    rss: Optional[int] = None  # RSS when the phase ended
+    peak_rss: Optional[int] = None  # Process peak RSS when the phase ended
+    error: Optional[str] = None
+
+    @property
+    def seconds(self) -> Optional[float]:
+        """Duration of the phase, or None while it is still running."""
+        return None if self.end is None else self.end - self.start
+
+@dataclass
+class ImportTiming:
+    """Time spent executing one module during import."""
+    module: str
+    cumulative: float  # Including the modules it imported
+    own: float = 0.0  # Excluding them
+    children: float = field(default=0.0, repr=False)
+
+class _ImportTimer:
+    """
+    Meta path finder that times module execution.
+
+    It does not load anything itself: it asks the finders behind it for the
+    spec and wraps the per-module loader's exec_module, so nested imports are
+    attributed to the module that triggered them.
+    """
+
+    def __init__(self, profiler: 'BootProfiler'):
+        self.profiler = profiler
+        self._local = threading.local()  # Per-thread import stack and re-entry guard
+
+    def find_spec(self, fullname, path, target=None):
+        if getattr(self._local, 'finding', False):
+            return None
+        self._local.finding = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, 'find_spec'):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            self._local.finding = False
+
+        loader = spec.loader
+        # Built-in and frozen modules share one class-level loader; skip them
+        if loader is None or isinstance(loader, type) or not hasattr(loader, 'exec_module'):
+            return spec
+        exec_module = loader.exec_module
+
+        def timed_exec_module(module):
+            stack = self._local.__dict__.setdefault('stack', [])
+            entry = ImportTiming(module=fullname, cumulative=0.0)
+            stack.append(entry)
+            start = time.perf_counter()
+            try:
+                exec_module(module)
+            finally:
+                entry.cumulative = time.perf_counter() - start
+                entry.own = entry.cumulative - entry.children
+                stack.pop()
+                if stack:
+                    stack[-1].children += entry.cumulative
+                self.profiler.imports.append(entry)
+
+        loader.exec_module = timed_exec_module
+        return spec
+
+class BootProfiler:
+    """Collects start-up timings for one process."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases: List[PhaseTiming] = []
+        self.extensions: Dict[str, PhaseTiming] = {}
+        self.imports: List[ImportTiming] = []
+        self.finished_at: Optional[float] = None
+        self._import_timer: Optional[_ImportTimer] = None
+        self._open: Dict[str, PhaseTiming] = {}
+
+    def now(self) -> float:
+        """Seconds since boot."""
+        return time.perf_counter() - self.started
+
+    def start_import_timing(self):
+        """Start timing imports (call before the heavy imports)."""
+        if self._import_timer is None:
+            self._import_timer = _ImportTimer(self)
+            sys.meta_path.insert(0, self._import_timer)
+
+    def stop_import_timing(self):
+        """Stop timing imports."""
+        if self._import_timer is not None:
+            try:
+                sys.meta_path.remove(self._import_timer)
+            except ValueError:
+                pass
+            self._import_timer = None
+
+    def begin(self, name: str) -> PhaseTiming:
+        """Start a phase that ends somewhere else (e.g. in another callback)."""
+        phase = PhaseTiming(name=name, start=self.now())
+        self.phases.append(phase)
+        self._open[name] = phase
+        return phase
+
+    def end(self, name: str, error: Optional[str] = None) -> Optional[PhaseTiming]:
+        """End a phase started with begin(); ending it again does nothing."""
+        phase = self._open.pop(name, None)
+        if phase is not None:
+            phase.end = self.now()
+            phase.rss = current_rss()
+            phase.peak_rss = peak_rss()
+            phase.error = error
+        return phase
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time a block as one phase."""
+        self.begin(name)
+        try:
+            yield
+        except Exception as e:
+            self.end(name, error=str(e))
+            raise
+        else:
+            self.end(name)
+
+    def record_extension(self, name: str, start: float, error: Optional[str] = None):
+        """
+        Record one extension load.
+
+        Args:
+            name: Extension name (e.g. "cogs.skills")
+            start: Offset from now() taken before loading it
+            error: Load error, if it failed
+        """
+        self.extensions[name] = PhaseTiming(
+            name=name, start=start, end=self.now(),
+            rss=current_rss(), peak_rss=peak_rss(), error=error
+        )
+
+    def record(self, name: str, started_at: float, ended_at: float, error: Optional[str] = None):
+        """
+        Record a phase measured elsewhere (e.g. the per-manager load times).
+
+        Args:
+            name: Phase name
+            started_at: time.perf_counter() when it started
+            ended_at: time.perf_counter() when it ended
+            error: Failure description, if it failed
+        """
+        self.phases.append(PhaseTiming(
+            name=name, start=started_at - self.started, end=ended_at - self.started, error=error
+        ))
+
+    def finish(self):
+        """Mark boot as complete and stop timing imports."""
+        if self.finished_at is None:
+            self.finished_at = self.now()
+        self.stop_import_timing()
+
+    def top_imports(self, limit: int = 10, by: str = 'cumulative') -> List[ImportTiming]:
+        """Get the slowest imports, by 'cumulative' or 'own' time."""
+        return sorted(self.imports, key=lambda i: getattr(i, by), reverse=True)[:limit]
+
+    def imports_by_package(self) -> Dict[str, float]:
+        """Get own import time summed per top-level package, slowest first."""
+        totals: Dict[str, float] = {}
+        for entry in self.imports:
+            package = entry.module.split('.', 1)[0]
+            totals[package] = totals.get(package, 0.0) + entry.own
+        return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+    def to_dict(self) -> dict:
+        """Get the report as plain data (logged as JSON)."""
+        def timing(phase: PhaseTiming) -> dict:
+            return {
+                'name': phase.name,
+                'start': round(phase.start, 4),
+                'seconds': None if phase.seconds is None else round(phase.seconds, 4),
+                'rss': phase.rss,
+                'peak_rss': phase.peak_rss,
+                'error': phase.error,
+            }
+
+        return {
+            'total_seconds': None if self.finished_at is None else round(self.finished_at, 4),
+            'peak_rss': peak_rss(),
+            'phases': [timing(p) for p in self.phases],
+            'extensions': [timing(e) for e in self.extensions.values()],
+            'imports': {
+                'modules': len(self.imports),
+                'by_package': {k: round(v, 4) for k, v in list(self.imports_by_package().items())[:10]},
+                'slowest': [
+                    {'module': i.module, 'cumulative': round(i.cumulative, 4), 'own': round(i.own, 4)}
+                    for i in self.top_imports(10)
+                ],
+            },
+        }
+
+    def format_lines(self) -> List[str]:
+        """Get the human-readable report, one line per entry."""
+        lines = []
+        total = f"{self.finished_at:.2f}s" if self.finished_at is not None else "still booting"
+        lines.append(f"Boot report: {total}, peak RSS {format_bytes(peak_rss())}")
+        for phase in self.phases:
+            seconds = f"{phase.seconds:7.3f}s" if phase.seconds is not None else "running"
+            memory = f"  rss {format_bytes(phase.rss)} peak {format_bytes(phase.peak_rss)}" if phase.rss is not None else ""
+            failed = f" FAILED: {phase.error}" if phase.error else ""
+            lines.append(f"  phase {phase.name:<28} {seconds} @ {phase.start:6.2f}s{memory}{failed}")
+        for ext in sorted(self.extensions.values(), key=lambda e: e.seconds, reverse=True):
+            failed = f" FAILED: {ext.error}" if ext.error else ""
+            lines.append(f"  extension {ext.name:<24} {ext.seconds:7.3f}s{failed}")
+        for package, seconds in list(self.imports_by_package().items())[:5]:
+            lines.append(f"  imports {package:<26} {seconds:7.3f}s")
+        return lines
+
+    def log_report(self):
+        """Log the readable report and one JSON line for comparing boots."""
+        for line in self.format_lines():
+            logger.info(line)
+        logger.info("Boot report JSON: " + json.dumps(self.to_dict(), separators=(',', ':')))
+
+# Process-wide profiler; its clock starts when this module is first imported
+boot_profiler = BootProfiler()
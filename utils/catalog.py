@@ -0,0 +1,166 @@
+"""
+Schema catalog for master.mdb.
+
+master.mdb never changes between game updates, so table names, column
+schemas, row counts and sizes are computed once per database version,
+kept in memory and persisted next to the database as JSON.
+"""
+import json
+import os
+import threading
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import logging
+
+try:
+    from utils.sidecar import database_fingerprint
+except ImportError:  # Run as a script from inside utils/
+    from sidecar import database_fingerprint
+
+logger = logging.getLogger('UmaMusumeBot.Catalog')
+
+# Bump when the persisted layout changes
+CATALOG_VERSION = 1
+
+@dataclass
+class TableInfo:
+    """Catalog entry for one table."""
+    name: str
+    columns: List[Dict[str, Any]] = field(default_factory=list)
+    row_count: int = 0
+    size_bytes: Optional[int] = None  # None when the dbstat table is unavailable
+
+@dataclass
+class SchemaCatalog:
+    """Table names, schemas, row counts and sizes for one database version."""
+    fingerprint: str
+    tables: Dict[str, TableInfo] = field(default_factory=dict)
+
+    @property
+    def table_names(self) -> List[str]:
+        """Get all table names, sorted."""
+        return sorted(self.tables)
+
+    @property
+    def total_rows(self) -> int:
+        """Get the row count across all tables."""
+        return sum(t.row_count for t in self.tables.values())
+
+    @property
+    def total_size(self) -> Optional[int]:
+        """Get the total table size in bytes (None if sizes are unknown)."""
+        sizes = [t.size_bytes for t in self.tables.values()]
+        if any(size is None for size in sizes):
+            return None
+        return sum(sizes)
+
+    def get(self, table_name: str) -> Optional[TableInfo]:
+        """Get a table entry by name."""
+        return self.tables.get(table_name)
+
+    def row_count(self, table_name: str) -> int:
+        """Get a table's row count (0 if unknown)."""
+        info = self.tables.get(table_name)
+        return info.row_count if info else 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to a JSON-compatible dictionary."""
+        return {
+            'version': CATALOG_VERSION,
+            'fingerprint': self.fingerprint,
+            'tables': [asdict(t) for t in self.tables.values()],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'SchemaCatalog':
+        """Deserialize from to_dict() output."""
+        tables = {t['name']: TableInfo(**t) for t in data['tables']}
+        return cls(fingerprint=data['fingerprint'], tables=tables)
+
+    @classmethod
+    def build(cls, db) -> 'SchemaCatalog':
+        """
+        Build a catalog by inspecting a connected database.
+
+        Args:
+            db: Connected MasterDBReader
+
+        Returns:
+            Freshly built catalog
+        """
+        sizes = _table_sizes(db)
+        tables = {}
+        for name in db.get_tables():
+            result = db.query(f"SELECT COUNT(*) as count FROM [{name}]")
+            tables[name] = TableInfo(
+                name=name,
+                columns=db.get_table_schema(name),
+                row_count=result[0]['count'] if result else 0,
+                size_bytes=sizes.get(name) if sizes is not None else None,
+            )
+        return cls(fingerprint=database_fingerprint(db.db_path), tables=tables)
+
+def _table_sizes(db) -> Optional[Dict[str, int]]:
+    """Get per-table sizes from the dbstat virtual table, if compiled in."""
+    try:
+        entry = db._connection()
+        with entry.lock:
+            rows = entry.conn.execute(
+                "SELECT name, SUM(pgsize) FROM dbstat WHERE aggregate = 0 GROUP BY name"
+            ).fetchall()
+        return {name: size for name, size in rows}
+    except Exception:
+        return None
+
+def catalog_path_for(db_path) -> Path:
+    """Get the persisted catalog path for a database (master.mdb -> master.catalog.json)."""
+    db_path = Path(db_path)
+    return db_path.with_name(f"{db_path.stem}.catalog.json")
+
+_catalogs: Dict[str, SchemaCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+def get_catalog(db) -> SchemaCatalog:
+    """
+    Get the catalog for a connected database: from memory, then from the
+    persisted file, building (and persisting) it only when the database changed.
+
+    Args:
+        db: Connected MasterDBReader
+
+    Returns:
+        Catalog for the current database version
+    """
+    fingerprint = database_fingerprint(db.db_path)
+    key = str(Path(db.db_path).resolve())
+
+    with _catalogs_lock:
+        cached = _catalogs.get(key)
+        if cached is not None and cached.fingerprint == fingerprint:
+            return cached
+
+        path = catalog_path_for(db.db_path)
+        catalog = None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == CATALOG_VERSION and data.get('fingerprint') == fingerprint:
+                catalog = SchemaCatalog.from_dict(data)
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+        if catalog is None:
+            logger.info("Building schema catalog...")
+            catalog = SchemaCatalog.build(db)
+            try:
+                tmp_path = path.with_name(path.name + '.tmp')
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(catalog.to_dict(), f, ensure_ascii=False)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                logger.warning(f"Failed to persist schema catalog: {e}")
+            logger.info(f"Catalogued {len(catalog.tables)} tables ({catalog.total_rows:,} rows)")
+
+        _catalogs[key] = catalog
+        return catalog
@@ -0,0 +1,158 @@
+"""
+Slash command sync that only talks to Discord when the command tree changed.
+
+tree.sync() is a global HTTP round-trip with its own rate limit, so doing it
+on every restart only slows readiness down. Instead we hash the payload that
+would be uploaded (names, descriptions, parameters, choices, ...) per scope,
+remember the hash of the last successful sync and skip the call while it
+still matches.
+"""
+import hashlib
+import json
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+import logging
+
+import discord
+
+logger = logging.getLogger('UmaMusumeBot.CommandSync')
+
+# Sync modes (config.COMMAND_SYNC)
+SYNC_AUTO = 'auto'  # Sync a scope only when its hash changed
+SYNC_ALWAYS = 'always'  # Sync every scope on every start
+SYNC_OFF = 'off'  # Never sync (commands are managed elsewhere)
+
+DEFAULT_STATE_PATH = './data/command_sync.json'
+
+@dataclass
+class SyncResult:
+    """Outcome of syncing one scope (global or one guild)."""
+    scope: str
+    commands: int
+    synced: bool
+    seconds: float
+    saved_seconds: Optional[float] = None  # Duration of the last real sync, when skipped
+    error: Optional[str] = None
+
+def _command_payload(command, tree) -> dict:
+    """Get the JSON payload discord.py uploads for a command."""
+    try:
+        return command.to_dict(tree)  # discord.py >= 2.4
+    except TypeError:
+        return command.to_dict()
+
+def command_tree_hash(tree, guild=None) -> str:
+    """
+    Hash the commands registered for a scope.
+
+    Args:
+        tree: app_commands.CommandTree
+        guild: Guild to hash (None for the global commands)
+
+    Returns:
+        Hex SHA-256 of the canonical JSON payload
+    """
+    payloads = [_command_payload(command, tree) for command in tree.get_commands(guild=guild)]
+    payloads.sort(key=lambda p: (p.get('type', 1), p['name']))
+    canonical = json.dumps(payloads, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+class CommandSyncState:
+    """Hashes of the last successful sync per scope, persisted as JSON."""
+
+    def __init__(self, path=DEFAULT_STATE_PATH):
+        self.path = Path(path)
+        self.scopes: Dict[str, dict] = {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.scopes = json.load(f).get('scopes', {})
+        except (OSError, ValueError, AttributeError):
+            self.scopes = {}
+
+    def get(self, scope: str) -> Optional[dict]:
+        """Get the recorded entry for a scope."""
+        return self.scopes.get(scope)
+
+    def record(self, scope: str, digest: str, commands: int, seconds: float):
+        """Record a successful sync for a scope."""
+        self.scopes[scope] = {
+            'hash': digest,
+            'commands': commands,
+            'seconds': round(seconds, 3),
+            'synced_at': int(time.time()),
+        }
+
+    def save(self):
+        """Write the state file atomically."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(self.path.name + '.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'scopes': self.scopes}, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Failed to persist command sync state: {e}")
+
+async def sync_command_tree(tree, state_path=DEFAULT_STATE_PATH, mode: str = SYNC_AUTO,
+                            guild_ids=(), sync_global: bool = True) -> List[SyncResult]:
+    """
+    Sync the global commands and/or a set of guilds, skipping unchanged scopes.
+
+    Guild syncs copy the global commands into each guild first, which makes
+    them visible there immediately - useful for trying changes on a staging
+    server before (or instead of) the global rollout.
+
+    Args:
+        tree: app_commands.CommandTree with every cog already loaded
+        state_path: JSON file holding the last synced hashes
+        mode: SYNC_AUTO, SYNC_ALWAYS or SYNC_OFF
+        guild_ids: Guild IDs to sync individually
+        sync_global: Whether to sync the global commands
+
+    Returns:
+        One SyncResult per scope
+    """
+    if mode == SYNC_OFF:
+        logger.info("Slash command sync disabled")
+        return []
+
+    app_id = tree.client.application_id
+    state = CommandSyncState(state_path)
+    scopes = [(None, f"{app_id}:global")] if sync_global else []
+    for guild_id in guild_ids:
+        guild = discord.Object(id=guild_id)
+        tree.copy_global_to(guild=guild)
+        scopes.append((guild, f"{app_id}:guild:{guild_id}"))
+
+    results = []
+    for guild, scope in scopes:
+        digest = command_tree_hash(tree, guild=guild)
+        commands = len(tree.get_commands(guild=guild))
+        previous = state.get(scope)
+
+        if mode == SYNC_AUTO and previous and previous.get('hash') == digest:
+            results.append(SyncResult(
+                scope=scope, commands=commands, synced=False, seconds=0.0,
+                saved_seconds=previous.get('seconds')
+            ))
+            continue
+
+        start = time.perf_counter()
+        try:
+            synced = await tree.sync(guild=guild)
+        except Exception as e:
+            results.append(SyncResult(
+                scope=scope, commands=commands, synced=False,
+                seconds=time.perf_counter() - start, error=str(e)
+            ))
+            continue
+        elapsed = time.perf_counter() - start
+        state.record(scope, digest, len(synced), elapsed)
+        results.append(SyncResult(scope=scope, commands=len(synced), synced=True, seconds=elapsed))
+
+    if any(result.synced for result in results):
+        state.save()
+    return results
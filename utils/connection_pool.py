@@ -0,0 +1,168 @@
+"""
+Thread-local sqlite connection pool for MasterDBReader.
+
+sqlite3 connections must not be used from several threads at once, so
+every thread that reads through a MasterDBReader gets a connection of its
+own. The pool caps how many connections a reader may open, reclaims the
+ones owned by threads that have exited and health-checks idle connections
+before handing them out again.
+"""
+import sqlite3
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+import logging
+
+logger = logging.getLogger('UmaMusumeBot.ConnectionPool')
+
+# Seconds a connection may sit unchecked before it is probed again
+HEALTH_CHECK_INTERVAL = 30.0
+
+class PooledConnection:
+    """A connection plus the lock that serializes cursors on it."""
+
+    __slots__ = ('conn', 'lock', 'thread', 'checked_at')
+
+    def __init__(self, conn: sqlite3.Connection, thread: threading.Thread):
+        self.conn = conn
+        # Cursors can outlive the call that created them (aiter_query fetches
+        # from whichever pool thread is free), so every cursor operation on
+        # this connection holds its lock.
+        self.lock = threading.RLock()
+        self.thread = thread
+        self.checked_at = time.monotonic()
+
+class ConnectionPool:
+    """Hands out one connection per thread, up to max_connections."""
+
+    def __init__(self, factory: Callable[[], sqlite3.Connection], max_connections: int,
+                 health_check_interval: float = HEALTH_CHECK_INTERVAL):
+        """
+        Initialize the pool.
+
+        Args:
+            factory: Opens and configures a new connection
+            max_connections: Upper bound on open connections; threads beyond
+                it share the least busy existing connection
+            health_check_interval: Seconds between liveness probes per connection
+        """
+        self.factory = factory
+        self.max_connections = max(1, max_connections)
+        self.health_check_interval = health_check_interval
+        self._local = threading.local()
+        self._entries: List[PooledConnection] = []
+        self._by_conn: Dict[int, PooledConnection] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def acquire(self) -> PooledConnection:
+        """
+        Get the calling thread's connection, opening one if needed.
+
+        Returns:
+            The thread's pooled connection
+
+        Raises:
+            sqlite3.Error: If a new connection cannot be opened
+        """
+        entry: Optional[PooledConnection] = getattr(self._local, 'entry', None)
+        if entry is not None and entry.conn is not None:
+            if time.monotonic() - entry.checked_at < self.health_check_interval:
+                return entry
+            if self._is_healthy(entry):
+                return entry
+            self._discard(entry)
+
+        entry = self._open_or_share()
+        self._local.entry = entry
+        return entry
+
+    def lock_for(self, conn: sqlite3.Connection) -> threading.RLock:
+        """
+        Get the lock guarding a pooled connection.
+
+        Raises:
+            sqlite3.ProgrammingError: If the connection has left the pool
+        """
+        entry = self._by_conn.get(id(conn))
+        if entry is None:
+            raise sqlite3.ProgrammingError("Connection is no longer pooled")
+        return entry.lock
+
+    def size(self) -> int:
+        """Get the number of open connections."""
+        with self._lock:
+            return len(self._entries)
+
+    def close(self):
+        """Close every connection in the pool."""
+        with self._lock:
+            entries = self._entries
+            self._entries = []
+            self._by_conn = {}
+            self._closed = True
+        for entry in entries:
+            with entry.lock:
+                entry.conn.close()
+                entry.conn = None
+
+    def _open_or_share(self) -> PooledConnection:
+        """Open a connection for this thread, or share one when the pool is full."""
+        with self._lock:
+            if self._closed:
+                raise sqlite3.ProgrammingError("Connection pool is closed")
+
+            self._reclaim_dead_threads()
+            if len(self._entries) >= self.max_connections:
+                # Every slot belongs to a live thread; piggyback on the connection
+                # whose lock is free (or the first one), the lock keeps it safe.
+                for entry in self._entries:
+                    if entry.lock.acquire(blocking=False):
+                        entry.lock.release()
+                        return entry
+                return self._entries[0]
+
+            entry = PooledConnection(self.factory(), threading.current_thread())
+            self._entries.append(entry)
+            self._by_conn[id(entry.conn)] = entry
+            logger.debug(f"Opened pooled connection {len(self._entries)}/{self.max_connections}")
+            return entry
+
+    def _reclaim_dead_threads(self):
+        """Close connections owned by threads that have exited (caller holds _lock)."""
+        for entry in [e for e in self._entries if not e.thread.is_alive()]:
+            if not entry.lock.acquire(blocking=False):
+                continue  # A live cursor is still using it
+            try:
+                self._entries.remove(entry)
+                del self._by_conn[id(entry.conn)]
+                entry.conn.close()
+                entry.conn = None
+            finally:
+                entry.lock.release()
+
+    def _is_healthy(self, entry: PooledConnection) -> bool:
+        """Probe a connection with a trivial query."""
+        try:
+            with entry.lock:
+                entry.conn.execute("SELECT 1").fetchone()
+            entry.checked_at = time.monotonic()
+            return True
+        except (sqlite3.Error, AttributeError) as e:
+            logger.warning(f"Discarding unhealthy pooled connection: {e}")
+            return False
+
+    def _discard(self, entry: PooledConnection):
+        """Drop a connection from the pool and close it once no cursor is using it."""
+        with self._lock:
+            if entry in self._entries:
+                self._entries.remove(entry)
+                self._by_conn.pop(id(entry.conn), None)
+        # Shared entries may be mid-query on another thread; the lock waits for it
+        with entry.lock:
+            try:
+                entry.conn.close()
+            except (sqlite3.Error, AttributeError):
+                pass
+            entry.conn = None
+        self._local.entry = None
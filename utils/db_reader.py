@@ -3,52 +3,327 @@ Read and explore the master.mdb SQLite database.
 """
 import sqlite3
 import json
+import textwrap
+import asyncio
+import functools
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable, AsyncIterator, Iterator, Tuple
 import logging
 
+try:
+    from utils.query_stats import query_stats, find_call_site
+    from utils.sidecar import ensure_sidecar, populate_overlay, database_fingerprint, SIDECAR_SCHEMA
+    from utils.catalog import SchemaCatalog, get_catalog
+    from utils.connection_pool import ConnectionPool, PooledConnection
+    from utils.queries import get_query, QueryContractError
+except ImportError:  # Run as a script from inside utils/
+    from query_stats import query_stats, find_call_site
+    from sidecar import ensure_sidecar, populate_overlay, database_fingerprint, SIDECAR_SCHEMA
+    from catalog import SchemaCatalog, get_catalog
+    from connection_pool import ConnectionPool, PooledConnection
+    from queries import get_query, QueryContractError
+
 logger = logging.getLogger('UmaMusumeBot.DBReader')
 
+# Dedicated worker threads for database reads, so coroutine handlers never
+# block the discord.py event loop on sqlite I/O.
+READER_POOL_SIZE = 4
+DEFAULT_BATCH_SIZE = 500
+# Prepared statements kept per connection (sqlite3 default is 128). The
+# registered queries plus ad hoc lookups fit comfortably, so nothing is
+# ever re-prepared during a load.
+STATEMENT_CACHE_SIZE = 256
+
+# master.mdb is never written by the bot, so read-only connections skip
+# locking and journaling entirely and serve pages straight from the mmap.
+READ_ONLY_PRAGMAS = {
+    'mmap_size': 256 * 1024 * 1024,  # Map the whole file (~100 MB) into memory
+    'cache_size': -64 * 1024,        # 64 MB page cache (negative = KiB)
+    'temp_store': 'MEMORY',          # Sorts and temp B-trees stay in RAM
+    'query_only': 'ON',              # Reject any write at the SQL level
+}
+
+# Row shapes supported by iter_query()
+SHAPE_DICT = 'dict'      # {column: value} per row (default)
+SHAPE_TUPLE = 'tuple'    # Raw sqlite tuples
+SHAPE_RECORD = 'record'  # Namedtuple per row, attribute access by column name
+
+_reader_pool: Optional[ThreadPoolExecutor] = None
+_reader_pool_size = READER_POOL_SIZE
+_reader_pool_lock = threading.Lock()
+
+def configure_reader_pool(size: int):
+    """
+    Set the number of reader threads (call before the pool is first used).
+
+    Args:
+        size: Number of worker threads; each reader may also open one
+            connection per worker thread
+    """
+    global _reader_pool_size
+    with _reader_pool_lock:
+        if _reader_pool is not None:
+            logger.warning("Reader pool already started, size change applies after restart")
+        _reader_pool_size = max(1, size)
+
+def default_connection_limit() -> int:
+    """Get the default per-reader connection limit (one per worker plus the caller)."""
+    return _reader_pool_size + 1
+
+def get_reader_pool() -> ThreadPoolExecutor:
+    """
+    Get the shared reader thread pool, creating it on first use.
+
+    Returns:
+        ThreadPoolExecutor used for all async database reads
+    """
+    global _reader_pool
+    with _reader_pool_lock:
+        if _reader_pool is None:
+            _reader_pool = ThreadPoolExecutor(
+                max_workers=_reader_pool_size,
+                thread_name_prefix='db-reader'
+            )
+        return _reader_pool
+
+@functools.lru_cache(maxsize=128)
+def _record_type(columns: Tuple[str, ...]):
+    """Get (and cache) the namedtuple class for a set of result columns."""
+    return namedtuple('Record', columns, rename=True)
+
+class _QueryTimer:
+    """Accumulates sqlite wall time and row count for one statement."""
+
+    __slots__ = ('sql', 'params', 'call_site', 'elapsed', 'rows', 'failed')
+
+    def __init__(self, sql: str, params: tuple):
+        self.sql = sql
+        self.params = params
+        self.call_site = find_call_site()
+        self.elapsed = 0.0
+        self.rows = 0
+        self.failed = False  # Execute or fetch raised, or the result broke its column contract
+
+def shutdown_reader_pool():
+    """Shut down the shared reader thread pool (called on bot shutdown)."""
+    global _reader_pool
+    with _reader_pool_lock:
+        if _reader_pool is not None:
+            _reader_pool.shutdown(wait=False)
+            _reader_pool = None
+
 class MasterDBReader:
     """Reader for Uma Musume master.mdb database."""
 
-    def __init__(self, db_path: str = "./data/master.mdb"):
+    def __init__(self, db_path: str = "./data/master.mdb", read_only: bool = True,
+                 attach_sidecar: bool = False, max_connections: Optional[int] = None):
         """
         Initialize the database reader.
 
         Args:
             db_path: Path to the master.mdb file
+            read_only: Open the file as an immutable, memory-mapped read-only
+                database (default). Set to False for a plain read-write connection.
+            attach_sidecar: ATTACH the sidecar index overlay as the `idx` schema
+                (see utils/sidecar.py), rebuilding it if master.mdb changed
+            max_connections: Upper bound on per-thread connections
+                (defaults to one per reader pool thread plus the caller)
         """
         self.db_path = Path(db_path)
-        self.conn: Optional[sqlite3.Connection] = None
+        self.read_only = read_only
+        self.attach_sidecar = attach_sidecar
+        self.max_connections = max_connections or default_connection_limit()
+        # Every thread reads through its own connection (see utils/connection_pool.py)
+        self._pool: Optional[ConnectionPool] = None
+        self._closed = False  # close() was called; the reader never reconnects
+        self.version: Optional[str] = None  # database_fingerprint() pinned or taken at connect time
+
+    @property
+    def conn(self) -> Optional[sqlite3.Connection]:
+        """The calling thread's connection (None if not connected)."""
+        if self._pool is None:
+            return None
+        try:
+            return self._pool.acquire().conn
+        except sqlite3.Error as e:
+            logger.error(f"Failed to open pooled connection: {e}")
+            return None
+
+    @property
+    def connected(self) -> bool:
+        """Whether connect() has succeeded and close() has not been called."""
+        return self._pool is not None
 
     def connect(self) -> bool:
         """
         Connect to the database.
 
+        Connections are opened lazily per thread; this validates the file by
+        opening the calling thread's connection. Calling it again while
+        connected is a no-op. A closed reader refuses to reconnect: the file
+        at db_path may have been replaced since its owner was retired. A
+        read-only reader also refuses a file other than its pinned version
+        (see pin()).
+
         Returns:
             bool: True if successful, False otherwise
         """
+        if self._pool is not None:
+            return True
+        if self._closed:
+            logger.warning(f"Refusing to reconnect closed reader: {self.db_path}")
+            return False
+
         try:
             if not self.db_path.exists():
                 logger.error(f"Database file not found: {self.db_path}")
                 return False
 
-            self.conn = sqlite3.connect(self.db_path)
-            self.conn.row_factory = sqlite3.Row  # Enable column access by name
-            logger.info(f"Connected to database: {self.db_path}")
+            version = database_fingerprint(self.db_path)
+            if self.read_only and self.version is not None and version != self.version:
+                logger.warning(f"Refusing to connect: {self.db_path} was replaced after version {self.version}")
+                return False
+
+            # Set first: every per-thread connection is checked against it
+            previous, self.version = self.version, version
+            try:
+                pool = ConnectionPool(self._open_connection, self.max_connections)
+                pool.acquire()
+            except sqlite3.Error:
+                self.version = previous
+                raise
+            self._pool = pool
+            mode = "read-only" if self.read_only else "read-write"
+            logger.info(f"Connected to database ({mode}): {self.db_path}")
             return True
 
-        except sqlite3.Error as e:
+        except (sqlite3.Error, OSError) as e:
             logger.error(f"Failed to connect to database: {e}")
             return False
 
+    def pin(self, version: str):
+        """
+        Bind a read-only reader to one version of the file before it connects.
+
+        Connections are opened lazily, one per thread, by path; once pinned,
+        connect() and every new per-thread connection refuse a replaced file
+        instead of mixing its rows with data loaded from the pinned one.
+
+        Args:
+            version: database_fingerprint() of the file the owner loaded
+        """
+        self.version = version
+
+    def _open_connection(self) -> sqlite3.Connection:
+        """
+        Open and configure one connection for the pool.
+
+        Returns:
+            sqlite3 connection with the sidecar attached and pragmas applied
+
+        Raises:
+            sqlite3.OperationalError: If a read-only reader's file was replaced
+                since its version was pinned
+        """
+        if self.read_only and self.version is not None:
+            try:
+                current = database_fingerprint(self.db_path)
+            except OSError as e:
+                raise sqlite3.OperationalError(f"Database file unavailable: {e}") from e
+            if current != self.version:
+                raise sqlite3.OperationalError(
+                    f"{self.db_path} was replaced after version {self.version}; not opening the new file"
+                )
+        if self.read_only:
+            conn = self._open_read_only()
+        else:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                                   cached_statements=STATEMENT_CACHE_SIZE)
+        if self.attach_sidecar:
+            self._attach_sidecar(conn)
+        if self.read_only:
+            for pragma, value in READ_ONLY_PRAGMAS.items():
+                conn.execute(f"PRAGMA {pragma} = {value}")
+        # Rows come back as plain tuples; iter_query() shapes them on demand
+        conn.row_factory = None
+        return conn
+
+    def _open_read_only(self) -> sqlite3.Connection:
+        """
+        Open the database by URI in immutable read-only mode.
+
+        Returns:
+            sqlite3 connection (read-only pragmas are applied by _open_connection())
+        """
+        uri = f"{self.db_path.resolve().as_uri()}?mode=ro&immutable=1"
+        return sqlite3.connect(uri, uri=True, check_same_thread=False,
+                               cached_statements=STATEMENT_CACHE_SIZE)
+
+    def _attach_sidecar(self, conn: sqlite3.Connection):
+        """
+        Attach the sidecar index overlay as the `idx` schema.
+
+        Falls back to building the overlay in memory when the sidecar file
+        cannot be written (e.g. read-only data directory).
+        """
+        sidecar_path = ensure_sidecar(self.db_path)
+        if sidecar_path is not None:
+            if self.read_only:
+                target = f"{sidecar_path.resolve().as_uri()}?mode=ro"
+            else:
+                target = str(sidecar_path)
+            conn.execute(f"ATTACH DATABASE ? AS {SIDECAR_SCHEMA}", (target,))
+            return
+
+        logger.warning("Building sidecar index in memory for this connection")
+        conn.execute(f"ATTACH DATABASE ':memory:' AS {SIDECAR_SCHEMA}")
+        populate_overlay(conn, SIDECAR_SCHEMA, 'main')
+
     def close(self):
-        """Close the database connection."""
-        if self.conn:
-            self.conn.close()
+        """Close every pooled connection for good (connect() fails afterwards)."""
+        self._closed = True
+        self._disconnect()
+
+    def _disconnect(self):
+        """Close every pooled connection, leaving the reader able to reconnect."""
+        if self._pool is not None:
+            pool = self._pool
+            self._pool = None
+            pool.close()
             logger.info("Database connection closed")
 
+    def refresh(self) -> bool:
+        """
+        Reconnect if master.mdb was replaced since connect().
+
+        Immutable connections keep reading the file they opened, so
+        long-lived readers call this to pick up a new download.
+
+        Returns:
+            bool: True if the reader reconnected to a new file
+        """
+        if self._pool is None:
+            return False
+        try:
+            if database_fingerprint(self.db_path) == self.version:
+                return False
+        except OSError:
+            return False
+        logger.info(f"{self.db_path} changed, reconnecting")
+        self._disconnect()
+        self.version = None  # Follow the new file
+        return self.connect()
+
+    def _connection(self) -> PooledConnection:
+        """Get the calling thread's pooled connection and its lock."""
+        if self._pool is None:
+            raise sqlite3.ProgrammingError("Not connected to database")
+        return self._pool.acquire()
+
     def get_tables(self) -> List[str]:
         """
         Get list of all tables in the database.
@@ -56,16 +331,18 @@ class MasterDBReader:
         Returns:
             List of table names
         """
-        if not self.conn:
+        if not self.connected:
             logger.error("Not connected to database")
             return []
 
         try:
-            cursor = self.conn.cursor()
-            cursor.execute(
-                "SELECT name FROM sqlite_master WHERE type='table' ORDER BY name"
-            )
-            tables = [row[0] for row in cursor.fetchall()]
+            entry = self._connection()
+            with entry.lock:
+                cursor = entry.conn.cursor()
+                cursor.execute(
+                    "SELECT name FROM sqlite_master WHERE type='table' ORDER BY name"
+                )
+                tables = [row[0] for row in cursor.fetchall()]
             return tables
 
         except sqlite3.Error as e:
@@ -82,15 +359,18 @@ class MasterDBReader:
         Returns:
             List of column information dictionaries
         """
-        if not self.conn:
+        if not self.connected:
             logger.error("Not connected to database")
             return []
 
         try:
-            cursor = self.conn.cursor()
-            cursor.execute(f"PRAGMA table_info({table_name})")
+            entry = self._connection()
+            with entry.lock:
+                cursor = entry.conn.cursor()
+                cursor.execute(f"PRAGMA table_info({table_name})")
+                rows = cursor.fetchall()
             columns = []
-            for row in cursor.fetchall():
+            for row in rows:
                 columns.append({
                     'cid': row[0],
                     'name': row[1],
@@ -105,6 +385,21 @@ class MasterDBReader:
             logger.error(f"Failed to get schema for {table_name}: {e}")
             return []
 
+    def get_catalog(self) -> Optional[SchemaCatalog]:
+        """
+        Get table names, schemas, row counts and sizes for this database.
+
+        The catalog is built once per database version and cached in memory
+        and next to the database file, so repeated calls do not scan tables.
+
+        Returns:
+            SchemaCatalog, or None if not connected
+        """
+        if not self.connected:
+            logger.error("Not connected to database")
+            return None
+        return get_catalog(self)
+
     def query(self, sql: str, params: tuple = ()) -> List[Dict[str, Any]]:
         """
         Execute a SQL query and return results as dictionaries.
@@ -116,25 +411,305 @@ class MasterDBReader:
         Returns:
             List of row dictionaries
         """
-        if not self.conn:
+        return list(self.iter_query(sql, params))
+
+    def iter_query(self, sql: str, params: tuple = (),
+                   batch_size: int = DEFAULT_BATCH_SIZE,
+                   shape: str = SHAPE_DICT,
+                   expect_columns: Optional[Tuple[str, ...]] = None,
+                   strict: bool = False) -> Iterator[Any]:
+        """
+        Execute a SQL query and yield results in the requested shape.
+
+        Rows are pulled from sqlite with fetchmany(), so at most one batch
+        is held in memory regardless of how large the result set is.
+
+        Args:
+            sql: SQL query string
+            params: Query parameters (optional)
+            batch_size: Number of rows fetched per batch
+            shape: SHAPE_DICT, SHAPE_TUPLE or SHAPE_RECORD
+            expect_columns: Result columns the caller relies on (optional)
+            strict: Raise database errors instead of logging them and
+                ending the rows early (for callers that must not mistake a
+                failed query for an empty result)
+
+        Yields:
+            Row dictionaries, raw tuples or namedtuple records
+
+        Raises:
+            QueryContractError: If expect_columns does not match the result
+            sqlite3.Error: If strict and the query fails
+        """
+        if not self.connected:
+            if strict:
+                raise sqlite3.ProgrammingError("Not connected to database")
             logger.error("Not connected to database")
-            return []
+            return
+
+        timer = _QueryTimer(sql, params)
+        try:
+            cursor = self._execute(sql, params, timer, strict)
+            if cursor is None or cursor.description is None:
+                return
+
+            columns = tuple(description[0] for description in cursor.description)
+            if expect_columns is not None and columns != expect_columns:
+                cursor.close()
+                timer.failed = True
+                raise QueryContractError(
+                    f"Query returned columns {columns}, expected {expect_columns}"
+                )
+            record_type = _record_type(columns) if shape == SHAPE_RECORD else None
+            while True:
+                rows = self._fetchmany(cursor, batch_size, timer, strict)
+                if not rows:
+                    break
+                if shape == SHAPE_TUPLE:
+                    yield from rows
+                elif record_type is not None:
+                    yield from map(record_type._make, rows)
+                else:
+                    for row in rows:
+                        yield dict(zip(columns, row))
+        finally:
+            self._finish(timer)
+
+    def iter_named(self, name: str, params: tuple = (),
+                   batch_size: int = DEFAULT_BATCH_SIZE,
+                   shape: str = SHAPE_RECORD, strict: bool = False) -> Iterator[Any]:
+        """
+        Execute a registered query (see utils/queries.py) and yield its rows.
+
+        Args:
+            name: Registered query name
+            params: Query parameters (optional)
+            batch_size: Number of rows fetched per batch
+            shape: Row shape (records by default)
+            strict: Raise database errors (see iter_query)
+
+        Yields:
+            Rows in the requested shape
+
+        Raises:
+            QueryContractError: If the result columns differ from the declaration
+            sqlite3.Error: If strict and the query fails
+        """
+        query = get_query(name)
+        try:
+            yield from self.iter_query(query.sql, params, batch_size, shape,
+                                       expect_columns=query.columns, strict=strict)
+        except QueryContractError as e:
+            raise QueryContractError(f"{name}: {e}") from None
+
+    def query_tuples(self, sql: str, params: tuple = ()) -> Tuple[Dict[str, int], List[tuple]]:
+        """
+        Execute a SQL query and return raw tuples with a column-index map.
+
+        Args:
+            sql: SQL query string
+            params: Query parameters (optional)
+
+        Returns:
+            Tuple of ({column: position}, list of row tuples)
+        """
+        if not self.connected:
+            logger.error("Not connected to database")
+            return {}, []
+
+        timer = _QueryTimer(sql, params)
+        try:
+            cursor = self._execute(sql, params, timer)
+            if cursor is None or cursor.description is None:
+                return {}, []
+
+            columns = {description[0]: i for i, description in enumerate(cursor.description)}
+            rows = []
+            while True:
+                batch = self._fetchmany(cursor, DEFAULT_BATCH_SIZE, timer)
+                if not batch:
+                    break
+                rows.extend(batch)
+            return columns, rows
+        finally:
+            self._finish(timer)
+
+    def query_records(self, sql: str, params: tuple = ()) -> List[tuple]:
+        """
+        Execute a SQL query and return namedtuple records.
+
+        Args:
+            sql: SQL query string
+            params: Query parameters (optional)
+
+        Returns:
+            List of records with attribute access by column name
+        """
+        return list(self.iter_query(sql, params, shape=SHAPE_RECORD))
+
+    def query_columns(self, sql: str, params: tuple = ()) -> Dict[str, List[Any]]:
+        """
+        Execute a SQL query and return the result column by column.
+
+        Args:
+            sql: SQL query string
+            params: Query parameters (optional)
+
+        Returns:
+            Dictionary of column name -> list of values (one entry per row)
+        """
+        columns, rows = self.query_tuples(sql, params)
+        if not rows:
+            return {name: [] for name in columns}
+        return {name: list(values) for name, values in zip(columns, zip(*rows))}
+
+    async def run_async(self, func: Callable[..., Any], *args) -> Any:
+        """
+        Run a blocking reader call on the reader thread pool.
+
+        Args:
+            func: Callable to run (usually a bound method of this reader)
+            *args: Positional arguments for func
+
+        Returns:
+            Whatever func returns
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(get_reader_pool(), functools.partial(func, *args))
+
+    async def aconnect(self) -> bool:
+        """Awaitable version of connect()."""
+        return await self.run_async(self.connect)
+
+    async def aquery(self, sql: str, params: tuple = ()) -> List[Dict[str, Any]]:
+        """
+        Awaitable version of query() that runs on the reader thread pool.
+
+        Args:
+            sql: SQL query string
+            params: Query parameters (optional)
 
+        Returns:
+            List of row dictionaries
+        """
+        return await self.run_async(self.query, sql, params)
+
+    async def aiter_query(self, sql: str, params: tuple = (),
+                          batch_size: int = DEFAULT_BATCH_SIZE) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Asynchronously iterate over query results, fetching in batches.
+
+        Each batch is fetched on the reader thread pool, so the event loop
+        only ever holds one batch of rows at a time.
+
+        Args:
+            sql: SQL query string
+            params: Query parameters (optional)
+            batch_size: Number of rows fetched per round-trip to the pool
+
+        Yields:
+            Row dictionaries
+        """
+        if not self.connected:
+            logger.error("Not connected to database")
+            return
+
+        timer = _QueryTimer(sql, params)
+        cursor = await self.run_async(self._execute, sql, params, timer)
+        if cursor is None or cursor.description is None:
+            await self.run_async(self._finish, timer)
+            return
+
+        columns = [description[0] for description in cursor.description]
         try:
-            cursor = self.conn.cursor()
-            cursor.execute(sql, params)
+            while True:
+                rows = await self.run_async(self._fetchmany, cursor, batch_size, timer)
+                if not rows:
+                    break
+                for row in rows:
+                    yield dict(zip(columns, row))
+        finally:
+            await self.run_async(self._finish, timer)
+
+    def explain(self, sql: str, params: tuple = ()) -> List[str]:
+        """
+        Get the EXPLAIN QUERY PLAN output for a statement.
+
+        Args:
+            sql: SQL query string
+            params: Query parameters (optional)
 
-            # Convert rows to dictionaries
-            columns = [description[0] for description in cursor.description]
-            results = []
-            for row in cursor.fetchall():
-                results.append(dict(zip(columns, row)))
+        Returns:
+            List of plan lines (empty if the plan could not be produced)
+        """
+        if not self.connected:
+            return []
 
-            return results
+        try:
+            entry = self._connection()
+            with entry.lock:
+                cursor = entry.conn.cursor()
+                cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+                plan = cursor.fetchall()
+            # Each row is (id, parent, notused, detail)
+            return [row[3] for row in plan]
+        except sqlite3.Error as e:
+            logger.debug(f"EXPLAIN QUERY PLAN failed: {e}")
+            return []
 
+    def _execute(self, sql: str, params: tuple = (),
+                 timer: Optional[_QueryTimer] = None,
+                 strict: bool = False) -> Optional[sqlite3.Cursor]:
+        """Execute a statement and return its cursor (None on failure, or raise if strict)."""
+        start = time.perf_counter()
+        try:
+            entry = self._connection()
+            with entry.lock:
+                cursor = entry.conn.cursor()
+                cursor.execute(sql, params)
+            return cursor
         except sqlite3.Error as e:
             logger.error(f"Query failed: {e}")
+            if timer is not None:
+                timer.failed = True
+            if strict:
+                raise
+            return None
+        finally:
+            if timer is not None:
+                timer.elapsed += time.perf_counter() - start
+
+    def _fetchmany(self, cursor: sqlite3.Cursor, batch_size: int,
+                   timer: Optional[_QueryTimer] = None, strict: bool = False) -> List[tuple]:
+        """Fetch the next batch of rows from a cursor (empty on failure, or raise if strict)."""
+        start = time.perf_counter()
+        try:
+            if self._pool is None:
+                raise sqlite3.ProgrammingError("Not connected to database")
+            # The cursor may have been opened on another thread's connection
+            with self._pool.lock_for(cursor.connection):
+                rows = cursor.fetchmany(batch_size)
+            if timer is not None:
+                timer.rows += len(rows)
+            return rows
+        except sqlite3.Error as e:
+            logger.error(f"Fetch failed: {e}")
+            if timer is not None:
+                timer.failed = True
+            if strict:
+                raise
             return []
+        finally:
+            if timer is not None:
+                timer.elapsed += time.perf_counter() - start
+
+    def _finish(self, timer: _QueryTimer):
+        """Record a finished or failed statement, capturing its plan if it was slow."""
+        elapsed_ms = timer.elapsed * 1000
+        plan = None
+        if query_stats.is_slow(elapsed_ms) and not timer.failed:
+            plan = self.explain(timer.sql, timer.params)
+        query_stats.record(timer.sql, timer.call_site, elapsed_ms, timer.rows, plan, timer.failed)
 
     def get_table_data(self, table_name: str, limit: int = None) -> List[Dict[str, Any]]:
         """
@@ -147,10 +722,25 @@ class MasterDBReader:
         Returns:
             List of row dictionaries
         """
+        return list(self.iter_table_data(table_name, limit))
+
+    def iter_table_data(self, table_name: str, limit: int = None,
+                        batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[Dict[str, Any]]:
+        """
+        Stream all data from a table.
+
+        Args:
+            table_name: Name of the table
+            limit: Maximum number of rows (optional)
+            batch_size: Number of rows fetched per batch
+
+        Yields:
+            Row dictionaries
+        """
         sql = f"SELECT * FROM {table_name}"
         if limit:
             sql += f" LIMIT {limit}"
-        return self.query(sql)
+        return self.iter_query(sql, batch_size=batch_size)
 
     def export_table_to_json(self, table_name: str, output_path: str):
         """
@@ -160,12 +750,18 @@ class MasterDBReader:
             table_name: Name of the table
             output_path: Path to save JSON file
         """
-        data = self.get_table_data(table_name)
-
         try:
+            # Write the JSON array one row at a time so large tables
+            # (e.g. text_data) never sit in memory all at once
+            count = 0
             with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            logger.info(f"Exported {len(data)} rows from {table_name} to {output_path}")
+                f.write('[')
+                for row in self.iter_table_data(table_name):
+                    f.write(',\n' if count else '\n')
+                    f.write(textwrap.indent(json.dumps(row, indent=2, ensure_ascii=False), '  '))
+                    count += 1
+                f.write('\n]' if count else ']')
+            logger.info(f"Exported {count} rows from {table_name} to {output_path}")
 
         except IOError as e:
             logger.error(f"Failed to write JSON file: {e}")
@@ -188,13 +784,11 @@ def main():
     print("🗄️  Uma Musume Master Database Explorer")
     print("="*60)
 
-    tables = db.get_tables()
-    print(f"\n📋 Found {len(tables)} tables:\n")
+    catalog = db.get_catalog()
+    print(f"\n📋 Found {len(catalog.tables)} tables ({catalog.total_rows:,} rows):\n")
 
-    for i, table in enumerate(tables, 1):
-        # Get row count
-        result = db.query(f"SELECT COUNT(*) as count FROM {table}")
-        count = result[0]['count'] if result else 0
+    for i, table in enumerate(catalog.table_names, 1):
+        count = catalog.row_count(table)
         print(f"{i:3}. {table:40} ({count:6} rows)")
 
     print("\n" + "="*60)
@@ -31,10 +31,14 @@ def download_file(url: str, destination: Path) -> bool:
         # Create parent directories if they don't exist
         destination.parent.mkdir(parents=True, exist_ok=True)
 
-        # Write file in chunks
-        with open(destination, 'wb') as f:
+        # Write file in chunks to a temporary file, then move it into place in
+        # one step. A running bot keeps reading the old file (its connections
+        # hold the old inode) until it hot-reloads the new one.
+        partial = destination.with_name(destination.name + '.part')
+        with open(partial, 'wb') as f:
             for chunk in response.iter_content(chunk_size=8192):
                 f.write(chunk)
+        os.replace(partial, destination)
 
         logger.info(f"Successfully downloaded to {destination}")
         return True
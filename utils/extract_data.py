@@ -21,7 +21,8 @@ def explore_character_tables(db: MasterDBReader):
     print("🔍 Searching for Character Tables...")
     print("="*60)
 
-    tables = db.get_tables()
+    catalog = db.get_catalog()
+    tables = catalog.table_names
 
     # Common keywords for character tables
     character_keywords = [
@@ -38,16 +39,12 @@ def explore_character_tables(db: MasterDBReader):
     print(f"\n📋 Found {len(potential_tables)} potential character-related tables:\n")
 
     for table in potential_tables:
-        result = db.query(f"SELECT COUNT(*) as count FROM {table}")
-        count = result[0]['count'] if result else 0
+        info = catalog.get(table)
 
-        # Get sample data
-        sample = db.get_table_data(table, limit=1)
+        print(f"  • {table} ({info.row_count} rows)")
 
-        print(f"  • {table} ({count} rows)")
-
-        if sample:
-            print(f"    Columns: {', '.join(sample[0].keys())}")
+        if info.columns:
+            print(f"    Columns: {', '.join(col['name'] for col in info.columns)}")
 
     return potential_tables
 
@@ -62,7 +59,8 @@ def explore_skill_tables(db: MasterDBReader):
     print("🔍 Searching for Skill Tables...")
     print("="*60)
 
-    tables = db.get_tables()
+    catalog = db.get_catalog()
+    tables = catalog.table_names
 
     # Common keywords for skill tables
     skill_keywords = [
@@ -78,16 +76,12 @@ def explore_skill_tables(db: MasterDBReader):
     print(f"\n📋 Found {len(potential_tables)} potential skill-related tables:\n")
 
     for table in potential_tables:
-        result = db.query(f"SELECT COUNT(*) as count FROM {table}")
-        count = result[0]['count'] if result else 0
-
-        # Get sample data
-        sample = db.get_table_data(table, limit=1)
+        info = catalog.get(table)
 
-        print(f"  • {table} ({count} rows)")
+        print(f"  • {table} ({info.row_count} rows)")
 
-        if sample:
-            print(f"    Columns: {', '.join(sample[0].keys())}")
+        if info.columns:
+            print(f"    Columns: {', '.join(col['name'] for col in info.columns)}")
 
     return potential_tables
 
@@ -102,7 +96,8 @@ def explore_support_tables(db: MasterDBReader):
     print("🔍 Searching for Support Card Tables...")
     print("="*60)
 
-    tables = db.get_tables()
+    catalog = db.get_catalog()
+    tables = catalog.table_names
 
     # Common keywords for support tables
     support_keywords = [
@@ -118,16 +113,12 @@ def explore_support_tables(db: MasterDBReader):
     print(f"\n📋 Found {len(potential_tables)} potential support-related tables:\n")
 
     for table in potential_tables:
-        result = db.query(f"SELECT COUNT(*) as count FROM {table}")
-        count = result[0]['count'] if result else 0
-
-        # Get sample data
-        sample = db.get_table_data(table, limit=1)
+        info = catalog.get(table)
 
-        print(f"  • {table} ({count} rows)")
+        print(f"  • {table} ({info.row_count} rows)")
 
-        if sample:
-            print(f"    Columns: {', '.join(sample[0].keys())}")
+        if info.columns:
+            print(f"    Columns: {', '.join(col['name'] for col in info.columns)}")
 
     return potential_tables
 
@@ -185,15 +176,15 @@ def interactive_explore(db: MasterDBReader):
                 break
 
             elif cmd == 'tables':
-                tables = db.get_tables()
-                for i, table in enumerate(tables, 1):
-                    result = db.query(f"SELECT COUNT(*) as count FROM {table}")
-                    count = result[0]['count'] if result else 0
+                catalog = db.get_catalog()
+                for i, table in enumerate(catalog.table_names, 1):
+                    count = catalog.row_count(table)
                     print(f"{i:3}. {table:40} ({count:6} rows)")
 
             elif cmd == 'explore' and len(command) > 1:
                 table = command[1]
-                schema = db.get_table_schema(table)
+                info = db.get_catalog().get(table)
+                schema = info.columns if info else []
                 print(f"\n📋 Schema for {table}:")
                 for col in schema:
                     pk = " [PK]" if col['pk'] else ""
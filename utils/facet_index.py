@@ -0,0 +1,96 @@
+"""
+Bitset facet index for combined filters.
+
+Every item gets a fixed position, and every (facet, value) pair keeps one
+Python int whose bit N is set when item N has that value. A filter such as
+"rarity 3 and a Velocity ability and guaranteed activation" is then a few
+big-int ANDs instead of a pass over every item per condition, and the
+surviving bits come out in position order, so items keep the order they
+were added in.
+
+Numeric facets are bucketed: a range ORs the buckets inside it and only
+checks the values of the two edge buckets one by one.
+"""
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+class FacetIndex:
+    """Immutable-after-build bitsets over a fixed number of positions."""
+
+    def __init__(self, size: int, bucket_widths: Optional[Dict[str, int]] = None):
+        """
+        Create an empty index.
+
+        Args:
+            size: Number of items (positions 0..size-1)
+            bucket_widths: Bucket width of each numeric facet (e.g. {'sp': 50})
+        """
+        self.size = size
+        self.everything = (1 << size) - 1
+        self._bits: Dict[str, Dict[Any, int]] = {}
+        self._widths = dict(bucket_widths or {})
+        self._values: Dict[str, List[Optional[int]]] = {facet: [None] * size for facet in self._widths}
+
+    def add(self, facet: str, value: Any, position: int):
+        """Mark an item as having a value of a facet (an item may have several)."""
+        values = self._bits.setdefault(facet, {})
+        values[value] = values.get(value, 0) | (1 << position)
+
+    def add_number(self, facet: str, value: Optional[int], position: int):
+        """Record an item's value of a numeric facet (None leaves it out of every range)."""
+        if value is None:
+            return
+        self._values[facet][position] = value
+        self.add(facet, value // self._widths[facet], position)
+
+    def bits(self, facet: str, value: Any) -> int:
+        """Get the items having a value of a facet."""
+        return self._bits.get(facet, {}).get(value, 0)
+
+    def any_of(self, facet: str, values: Iterable[Any]) -> int:
+        """Get the items having any of the values of a facet."""
+        mask = 0
+        for value in values:
+            mask |= self.bits(facet, value)
+        return mask
+
+    def range(self, facet: str, low: Optional[int] = None, high: Optional[int] = None) -> int:
+        """
+        Get the items whose numeric facet lies within [low, high].
+
+        Args:
+            facet: Numeric facet name
+            low: Smallest value (None for no lower bound)
+            high: Largest value (None for no upper bound)
+        """
+        width = self._widths[facet]
+        values = self._values[facet]
+        mask = 0
+        for bucket, bucket_bits in self._bits.get(facet, {}).items():
+            start, end = bucket * width, bucket * width + width - 1
+            if (low is not None and end < low) or (high is not None and start > high):
+                continue
+            if (low is None or start >= low) and (high is None or end <= high):
+                mask |= bucket_bits  # Bucket entirely inside the range
+                continue
+            for position in self.positions(bucket_bits):
+                value = values[position]
+                if (low is None or value >= low) and (high is None or value <= high):
+                    mask |= 1 << position
+        return mask
+
+    def values(self, facet: str) -> List[Any]:
+        """Get the values a facet has, sorted."""
+        return sorted(self._bits.get(facet, {}))
+
+    @staticmethod
+    def positions(mask: int) -> Iterator[int]:
+        """Iterate the set positions of a mask, lowest first."""
+        while mask:
+            low_bit = mask & -mask
+            yield low_bit.bit_length() - 1
+            mask ^= low_bit
+
+    @staticmethod
+    def count(mask: int) -> int:
+        """Count the items in a mask."""
+        return bin(mask).count('1')
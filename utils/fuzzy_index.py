@@ -0,0 +1,237 @@
+"""
+Trigram fuzzy matcher for name lookups.
+
+Candidates come from a trigram inverted index: names containing the query
+hold every trigram inside it, and typo candidates are the names sharing
+the most trigrams with it, so a lookup does not compare against every
+name. Names that contain the query keep the old partial-match behaviour
+and rank above everything else (exact, then prefix, then word start, then
+anywhere); the rest are re-ranked by Jaro-Winkler similarity so typos
+still find something. A value indexed under several names is returned
+once, at its best score.
+"""
+import heapq
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from utils.name_keys import fold as normalize
+
+# Scores: substring tiers sit above SUBSTRING_SCORE, typo matches below it
+SUBSTRING_SCORE = 0.9
+FUZZY_WEIGHT = 0.89
+# Minimum Jaro-Winkler similarity for a typo match
+MIN_SIMILARITY = 0.82
+# Share of the query's trigrams a typo candidate must have
+MIN_SHARED_TRIGRAMS = 0.4
+# Non-substring candidates re-ranked with Jaro-Winkler (best trigram overlap first)
+FUZZY_CANDIDATES = 16
+
+def trigrams(text: str) -> Set[str]:
+    """Get the trigrams of normalized text, padded so word edges count."""
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+def jaro_winkler(a: str, b: str, prefix_scale: float = 0.1) -> float:
+    """
+    Jaro-Winkler similarity of two strings.
+
+    Returns:
+        1.0 for identical strings, 0.0 for nothing in common
+    """
+    if a == b:
+        return 1.0
+    len_a, len_b = len(a), len(b)
+    if not len_a or not len_b:
+        return 0.0
+
+    window = max(max(len_a, len_b) // 2 - 1, 0)
+    matched_b = [False] * len_b
+    a_matches = []
+    for i, ch in enumerate(a):
+        hi = i + window + 1
+        j = b.find(ch, i - window if i > window else 0, hi)
+        while j >= 0 and matched_b[j]:
+            j = b.find(ch, j + 1, hi)
+        if j >= 0:
+            matched_b[j] = True
+            a_matches.append(ch)
+    matches = len(a_matches)
+    if not matches:
+        return 0.0
+
+    b_matches = [b[j] for j in range(len_b) if matched_b[j]]
+    transpositions = sum(x != y for x, y in zip(a_matches, b_matches)) // 2
+    jaro = (matches / len_a + matches / len_b + (matches - transpositions) / matches) / 3
+
+    prefix = 0
+    for x, y in zip(a[:4], b[:4]):
+        if x != y:
+            break
+        prefix += 1
+    return jaro + prefix * prefix_scale * (1 - jaro)
+
+def _substring_score(query: str, name: str) -> Optional[float]:
+    """Score a name containing the query, or None if it does not."""
+    pos = name.find(query)
+    if pos < 0:
+        return None
+    if query == name:
+        return 1.0
+    coverage = len(query) / len(name)
+    if pos == 0:
+        return 0.96 + 0.03 * coverage
+    if name[pos - 1] == ' ':
+        return 0.93 + 0.03 * coverage
+    return SUBSTRING_SCORE + 0.03 * coverage
+
+def _could_match(len_a: int, len_b: int) -> bool:
+    """Whether strings of these lengths can reach MIN_SIMILARITY at all."""
+    shorter = min(len_a, len_b)
+    jaro = (shorter / len_a + shorter / len_b + 1) / 3  # Every character of the shorter matching
+    return jaro + 0.4 * (1 - jaro) >= MIN_SIMILARITY
+
+def _similarity(query: str, name: str) -> float:
+    """Best Jaro-Winkler similarity of the query to the name or to a run of its words."""
+    best = jaro_winkler(query, name) if _could_match(len(query), len(name)) else 0.0
+    words = name.split(' ')
+    width = query.count(' ') + 1
+    if len(words) > width:
+        for start in range(len(words) - width + 1):
+            part = ' '.join(words[start:start + width])
+            if _could_match(len(query), len(part)):
+                best = max(best, jaro_winkler(query, part))
+    return best
+
+class FuzzyIndex:
+    """
+    Immutable fuzzy index over (name, value) pairs.
+
+    A value may appear under several names (e.g. every key from
+    utils/name_keys.py); it is returned once, at its best score.
+    """
+
+    def __init__(self, entries: Iterable[Tuple[str, Any]]):
+        """
+        Build the index.
+
+        Args:
+            entries: (name, value returned on a match) pairs
+        """
+        self._names: List[str] = []
+        self._values: List[Any] = []
+        self._groups: List[int] = []  # Entry -> index of its value's first entry
+        self._grams: List[int] = []
+        self._postings: Dict[str, List[int]] = {}
+        first_entry: Dict[Any, int] = {}
+        for name, value in entries:
+            entry_id = len(self._names)
+            name = normalize(name)
+            grams = trigrams(name)
+            self._names.append(name)
+            self._values.append(value)
+            try:
+                hash(value)
+                token = value
+            except TypeError:
+                token = id(value)  # Unhashable (e.g. a list of ids): same object, same value
+            self._groups.append(first_entry.setdefault(token, entry_id))
+            self._grams.append(len(grams))
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(entry_id)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def search(self, query: str, limit: Optional[int] = 10) -> List[Tuple[Any, float]]:
+        """
+        Find the names best matching a query.
+
+        Args:
+            query: Search text
+            limit: Maximum number of results (None for every match)
+
+        Returns:
+            (value, score) pairs, best first; scores at or above
+            SUBSTRING_SCORE mean the name contains the query
+        """
+        query = normalize(query)
+        if not query:
+            return []
+        scored = self._contained(query)
+        if limit is None or len({self._groups[-neg_id] for _, neg_id in scored}) < limit:
+            # Typo matches score below every contained name, so only look when there is room
+            scored.extend(self._typos(query, {-neg_id for _, neg_id in scored}))
+        return self._ranked(scored, limit)
+
+    def best(self, query: str) -> Optional[Any]:
+        """Get the value of the best matching name, or None."""
+        results = self.search(query, limit=1)
+        return results[0][0] if results else None
+
+    def matches(self, query: str, limit: Optional[int] = None) -> List[Any]:
+        """
+        Get the values of names containing the query, best first, or the
+        closest typo matches if none contain it.
+        """
+        query = normalize(query)
+        if not query:
+            return []
+        scored = self._contained(query) or self._typos(query, set())
+        return [value for value, _ in self._ranked(scored, limit)]
+
+    def _ranked(self, scored: List[Tuple[float, int]], limit: Optional[int]) -> List[Tuple[Any, float]]:
+        """Order (score, -entry_id) pairs best first, one per value; ties keep index order."""
+        # Keep each value's best entry, then take the top of those with a bounded heap
+        best: Dict[int, Tuple[float, int]] = {}
+        for item in scored:
+            group = self._groups[-item[1]]
+            current = best.get(group)
+            if current is None or item > current:
+                best[group] = item
+        if limit is None:
+            top = sorted(best.values(), reverse=True)
+        else:
+            top = heapq.nlargest(limit, best.values())
+        return [(self._values[-neg_id], score) for score, neg_id in top]
+
+    def _contained(self, query: str) -> List[Tuple[float, int]]:
+        """Score the names containing a normalized query."""
+        # Names containing the query contain every trigram inside it
+        if len(query) >= 3:
+            inner = {query[i:i + 3] for i in range(len(query) - 2)}
+            postings = sorted((self._postings.get(gram, ()) for gram in inner), key=len)
+            containing = set(postings[0])
+            for posting in postings[1:]:
+                if not containing:
+                    break
+                containing.intersection_update(posting)
+        else:
+            containing = range(len(self._names))  # Too short for inner trigrams
+
+        scored = []
+        for entry_id in containing:
+            score = _substring_score(query, self._names[entry_id])
+            if score is not None:
+                scored.append((score, -entry_id))
+        return scored
+
+    def _typos(self, query: str, exclude: Set[int]) -> List[Tuple[float, int]]:
+        """Score the closest names not containing a normalized query."""
+        # Candidates: the names sharing the most trigrams, by Dice overlap
+        query_grams = trigrams(query)
+        shared = Counter()
+        for gram in query_grams:
+            shared.update(self._postings.get(gram, ()))
+        min_shared = MIN_SHARED_TRIGRAMS * len(query_grams)
+        candidates = [
+            (2 * count / (len(query_grams) + self._grams[entry_id]), entry_id)
+            for entry_id, count in shared.most_common(FUZZY_CANDIDATES * 2)
+            if count >= min_shared and entry_id not in exclude
+        ]
+
+        scored = []
+        for _, entry_id in heapq.nlargest(FUZZY_CANDIDATES, candidates):
+            similarity = _similarity(query, self._names[entry_id])
+            if similarity >= MIN_SIMILARITY:
+                scored.append((FUZZY_WEIGHT * similarity, -entry_id))
+        return scored
@@ -0,0 +1,175 @@
+"""
+Search keys for entity names.
+
+Users type names however they like: full-width or half-width, katakana or
+hiragana, Hepburn romaji for a Japanese name, or the official English name
+of a character whose database only has the Japanese one (and the reverse).
+name_keys() expands one name into every form worth matching, and
+NameKeyIndex maps all of them back to the entity once at build time, so a
+lookup is a dict hit on the folded query.
+"""
+import unicodedata
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from constants import CHARACTER_NAMES_EN
+
+# Katakana that fold onto hiragana (ァ..ヶ -> ぁ..ゖ)
+_KATAKANA_START, _KATAKANA_END = 0x30A1, 0x30F6
+_KANA_OFFSET = 0x60
+
+# Hepburn romaji for single hiragana
+_ROMAJI = {
+    'あ': 'a', 'い': 'i', 'う': 'u', 'え': 'e', 'お': 'o',
+    'か': 'ka', 'き': 'ki', 'く': 'ku', 'け': 'ke', 'こ': 'ko',
+    'さ': 'sa', 'し': 'shi', 'す': 'su', 'せ': 'se', 'そ': 'so',
+    'た': 'ta', 'ち': 'chi', 'つ': 'tsu', 'て': 'te', 'と': 'to',
+    'な': 'na', 'に': 'ni', 'ぬ': 'nu', 'ね': 'ne', 'の': 'no',
+    'は': 'ha', 'ひ': 'hi', 'ふ': 'fu', 'へ': 'he', 'ほ': 'ho',
+    'ま': 'ma', 'み': 'mi', 'む': 'mu', 'め': 'me', 'も': 'mo',
+    'や': 'ya', 'ゆ': 'yu', 'よ': 'yo',
+    'ら': 'ra', 'り': 'ri', 'る': 'ru', 'れ': 're', 'ろ': 'ro',
+    'わ': 'wa', 'ゐ': 'i', 'ゑ': 'e', 'を': 'o', 'ん': 'n',
+    'が': 'ga', 'ぎ': 'gi', 'ぐ': 'gu', 'げ': 'ge', 'ご': 'go',
+    'ざ': 'za', 'じ': 'ji', 'ず': 'zu', 'ぜ': 'ze', 'ぞ': 'zo',
+    'だ': 'da', 'ぢ': 'ji', 'づ': 'zu', 'で': 'de', 'ど': 'do',
+    'ば': 'ba', 'び': 'bi', 'ぶ': 'bu', 'べ': 'be', 'ぼ': 'bo',
+    'ぱ': 'pa', 'ぴ': 'pi', 'ぷ': 'pu', 'ぺ': 'pe', 'ぽ': 'po',
+    'ゔ': 'vu',
+}
+# Small kana that combine with the previous one (きゃ -> kya, ふぁ -> fa)
+_SMALL_Y = {'ゃ': 'a', 'ゅ': 'u', 'ょ': 'o'}
+_SMALL_VOWELS = {'ぁ': 'a', 'ぃ': 'i', 'ぅ': 'u', 'ぇ': 'e', 'ぉ': 'o', 'ゎ': 'a'}
+_SOKUON = 'っ'
+_LONG_VOWEL = 'ー'
+
+# Curated English names by folded Japanese name, and the reverse
+_EN_BY_JP: Dict[str, str] = {}
+_JP_BY_EN: Dict[str, str] = {}
+
+def fold(text: str) -> str:
+    """
+    Fold text to its matching form: NFKC (full/half width), case-folded,
+    katakana as hiragana, whitespace collapsed.
+    """
+    text = unicodedata.normalize('NFKC', text).casefold()
+    text = "".join(
+        chr(ord(ch) - _KANA_OFFSET) if _KATAKANA_START <= ord(ch) <= _KATAKANA_END else ch
+        for ch in text
+    )
+    return " ".join(text.split())
+
+def compact(key: str) -> str:
+    """Drop spaces and punctuation from a folded key ("t.m. opera o" -> "tmoperao")."""
+    return "".join(ch for ch in key if ch.isalnum())
+
+def _strip_vowel(syllable: str) -> str:
+    """Drop the trailing vowel of a romaji syllable ("shi" -> "sh", "u" -> "w")."""
+    stem = syllable.rstrip('aiueo')
+    return stem or 'w'
+
+def romaji(key: str) -> str:
+    """
+    Transliterate the hiragana in a folded key to Hepburn romaji (other
+    characters pass through). Long vowel marks are dropped, the way names
+    are usually typed ("ごーるどしっぷ" -> "gorudoshippu").
+    """
+    out: List[str] = []
+    double_next = False
+    for ch in key:
+        if ch in _ROMAJI:
+            syllable = _ROMAJI[ch]
+            if double_next:
+                syllable = ('t' if syllable.startswith('ch') else syllable[0]) + syllable
+                double_next = False
+            out.append(syllable)
+        elif ch in _SMALL_Y and out and out[-1].endswith('i') and len(out[-1]) > 1:
+            stem = out[-1][:-1]
+            out[-1] = stem + _SMALL_Y[ch] if stem in ('sh', 'ch', 'j') else f"{stem}y{_SMALL_Y[ch]}"
+        elif ch in _SMALL_VOWELS and out:
+            out[-1] = _strip_vowel(out[-1]) + _SMALL_VOWELS[ch]
+        elif ch in _SMALL_Y:
+            out.append('y' + _SMALL_Y[ch])
+        elif ch in _SMALL_VOWELS:
+            out.append(_SMALL_VOWELS[ch])
+        elif ch == _SOKUON:
+            double_next = True
+        elif ch == _LONG_VOWEL:
+            continue
+        else:
+            double_next = False
+            out.append(ch)
+    return "".join(out)
+
+def _curated():
+    """Build the folded curated-name maps on first use."""
+    if not _EN_BY_JP:
+        for jp, en in CHARACTER_NAMES_EN.items():
+            _EN_BY_JP[compact(fold(jp))] = en
+            _JP_BY_EN[compact(fold(en))] = jp
+
+def character_aliases(name: str) -> List[str]:
+    """Get the curated other-language name of a character (English for Japanese, and back)."""
+    _curated()
+    key = compact(fold(name))
+    return [alias for alias in (_EN_BY_JP.get(key), _JP_BY_EN.get(key)) if alias]
+
+def name_keys(name: str, aliases: Iterable[str] = ()) -> List[str]:
+    """
+    Get every search key for a name: folded, compact and romaji forms of
+    the name and of each alias, without duplicates.
+
+    Args:
+        name: Display name
+        aliases: Other names for the same entity (e.g. character_aliases())
+
+    Returns:
+        Keys, the folded name first
+    """
+    keys: Dict[str, None] = {}
+    for text in (name, *aliases):
+        folded = fold(text)
+        transliterated = romaji(folded)
+        for key in (folded, compact(folded), transliterated, compact(transliterated)):
+            if key:
+                keys[key] = None
+    return list(keys)
+
+def query_keys(query: str) -> List[str]:
+    """Get the keys to look a typed query up under (name_keys() without aliases)."""
+    return name_keys(query)
+
+class NameKeyIndex:
+    """Every search key of every name, mapped to the entity's value."""
+
+    def __init__(self, entries: Iterable[Tuple[str, Any]],
+                 aliases: Optional[Callable[[str], Iterable[str]]] = None):
+        """
+        Build the index.
+
+        Args:
+            entries: (name, value) pairs, e.g. a manager's name_index items
+            aliases: Function giving extra names for a name (optional)
+        """
+        self.keys: Dict[str, Any] = {}
+        for name, value in entries:
+            for key in name_keys(name, aliases(name) if aliases else ()):
+                self.keys.setdefault(key, value)  # The first name to claim a key keeps it
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def get(self, query: str) -> Optional[Any]:
+        """Get the value whose name matches a query under any of its forms, or None."""
+        for key in query_keys(query):
+            value = self.keys.get(key)
+            if value is not None:
+                return value
+        return None
+
+    def items(self) -> Iterable[Tuple[str, Any]]:
+        """Get (key, value) pairs, e.g. to build a FuzzyIndex over every form."""
+        return self.keys.items()
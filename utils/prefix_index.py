@@ -0,0 +1,111 @@
+"""
+Sorted-array prefix index for name autocomplete.
+
+Every word start of every search key of every name is stored in one sorted
+list, so all names containing a word that starts with the typed text sit
+in one contiguous slice found with two binary searches. "week" finds
+"Special Week" as well as "Weekend Stakes", and with the keys from
+utils/name_keys.py "supe" and "スペ" find スペシャルウィーク too;
+candidates are ranked with a bounded heap.
+"""
+import heapq
+import re
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from utils.name_keys import fold, romaji
+
+# Queries this short match the largest slices, so their results are memoized
+MEMO_MAX_LENGTH = 2
+# Memoized (query, limit) results kept per index, least recently used dropped first
+MEMO_SIZE = 1024
+
+# Match tiers, best first
+TIER_EXACT = 0
+TIER_START = 1
+TIER_WORD = 2
+
+# Where a new word starts: after whitespace or punctuation that separates words
+_WORD_START = re.compile(r'(?:^|(?<=[\s\-/・(\[「『]))\S')
+
+def normalize(text: str) -> str:
+    """Normalize text for matching (see utils.name_keys.fold)."""
+    return fold(text)
+
+class PrefixIndex:
+    """Immutable prefix index over (display, value, weight) entries."""
+
+    def __init__(self, entries: Iterable[Tuple[str, Any, float]],
+                 keys: Optional[Callable[[str], Iterable[str]]] = None):
+        """
+        Build the index.
+
+        Args:
+            entries: (display text, value returned on a match, weight) tuples;
+                higher weights rank first among equally good matches
+            keys: Function giving the normalized search keys of a display
+                text (e.g. utils.name_keys.name_keys); defaults to the
+                normalized display text alone
+        """
+        # Entry ids follow (weight desc, name) order, so a smaller id ranks higher
+        ordered = sorted(
+            ((normalize(display), display, value, weight) for display, value, weight in entries),
+            key=lambda e: (-e[3], e[0])
+        )
+        self._entries: List[Tuple[str, Any]] = [(display, value) for _, display, value, _ in ordered]
+        keyed: List[Tuple[str, int, int]] = []
+        for entry_id, (name, display, _, _) in enumerate(ordered):
+            for key in (keys(display) if keys else (name,)):
+                for match in _WORD_START.finditer(key):
+                    start = match.start()
+                    keyed.append((key[start:], entry_id, TIER_START if start == 0 else TIER_WORD))
+        keyed.sort()
+        self._keys = [key for key, _, _ in keyed]
+        self._ids = [entry_id for _, entry_id, _ in keyed]
+        self._tiers = [tier for _, _, tier in keyed]
+        self._memo = lru_cache(maxsize=MEMO_SIZE)(self._complete)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def complete(self, query: str, limit: int = 25) -> List[Tuple[str, Any]]:
+        """
+        Get the best entries for what has been typed so far.
+
+        Ranking: exact name, then names starting with the query, then names
+        with a later word starting with it; ties by weight, then name. Kana
+        queries also match as romaji.
+
+        Args:
+            query: Text typed so far
+            limit: Maximum number of results
+
+        Returns:
+            (display, value) pairs, best first
+        """
+        query = normalize(query)
+        if len(query) <= MEMO_MAX_LENGTH:
+            return list(self._memo(query, limit))
+        return self._complete(query, limit)
+
+    def _complete(self, query: str, limit: int) -> List[Tuple[str, Any]]:
+        """Rank the entries for a normalized query."""
+        if not query:
+            # Nothing typed yet: the highest-weighted entries
+            return self._entries[:limit]
+
+        best: Dict[int, int] = {}
+        for prefix in {query, romaji(query)}:
+            lo = bisect_left(self._keys, prefix)
+            hi = bisect_left(self._keys, prefix + '\U0010ffff', lo)
+            for pos in range(lo, hi):
+                tier = self._tiers[pos]
+                if tier == TIER_START and self._keys[pos] == prefix:
+                    tier = TIER_EXACT
+                entry_id = self._ids[pos]
+                if tier < best.get(entry_id, TIER_WORD + 1):
+                    best[entry_id] = tier
+
+        ranked = heapq.nsmallest(limit, ((tier, entry_id) for entry_id, tier in best.items()))
+        return [self._entries[entry_id] for _, entry_id in ranked]
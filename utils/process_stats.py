@@ -0,0 +1,39 @@
+"""Process memory readings used by the reload and boot reports."""
+import os
+import sys
+from typing import Optional
+
+def current_rss() -> Optional[int]:
+    """
+    Get the current resident set size in bytes.
+
+    Returns:
+        RSS in bytes, or None where /proc is unavailable (non-Linux)
+    """
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+def peak_rss() -> Optional[int]:
+    """
+    Get the peak resident set size of the process in bytes.
+
+    Returns:
+        Peak RSS in bytes, or None where it cannot be read
+    """
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+def format_bytes(size: Optional[int]) -> str:
+    """Format a byte count as MiB (or "n/a" when unknown)."""
+    if size is None:
+        return "n/a"
+    return f"{size / (1024 * 1024):,.1f} MiB"
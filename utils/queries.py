@@ -0,0 +1,290 @@
+"""
+Named query registry for the managers.
+
+Every statement the managers run at load time lives here under a stable
+name, together with the result columns it promises. Because the SQL text
+never changes, sqlite's per-connection statement cache prepares each one
+once and reuses it on every later load (including hot reloads), and
+MasterDBReader.iter_named() checks the declared columns against the cursor
+so a schema change fails loudly instead of producing half-filled models.
+"""
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+@dataclass(frozen=True)
+class NamedQuery:
+    """A registered statement and its result column contract."""
+    name: str
+    sql: str
+    columns: Tuple[str, ...]
+    sample_params: tuple = ()  # Representative parameters for scripts/benchmark_queries.py
+
+class QueryContractError(ValueError):
+    """Raised when a query's result columns differ from its declaration."""
+
+QUERIES: Dict[str, NamedQuery] = {}
+
+def register(name: str, sql: str, columns: Tuple[str, ...], sample_params: tuple = ()) -> NamedQuery:
+    """
+    Register a named query.
+
+    Args:
+        name: Unique query name ("<manager>.<purpose>")
+        sql: Statement text
+        columns: Result column names, in order
+        sample_params: Parameters to benchmark a parameterized query with
+
+    Returns:
+        The registered query
+    """
+    if name in QUERIES:
+        raise ValueError(f"Query already registered: {name}")
+    query = NamedQuery(name=name, sql=" ".join(sql.split()), columns=tuple(columns),
+                       sample_params=tuple(sample_params))
+    QUERIES[name] = query
+    return query
+
+def get_query(name: str) -> NamedQuery:
+    """
+    Get a registered query by name.
+
+    Raises:
+        KeyError: If no query has that name
+    """
+    try:
+        return QUERIES[name]
+    except KeyError:
+        raise KeyError(f"Unknown query: {name}") from None
+
+def all_queries() -> List[NamedQuery]:
+    """Get every registered query, in registration order."""
+    return list(QUERIES.values())
+
+# Character cards with base stats (default rarity) and max stats (5★)
+register('characters.cards', """
+    SELECT
+        c.id as card_id,
+        c.chara_id,
+        c.default_rarity,
+        c.running_style,
+        c.talent_speed,
+        c.talent_stamina,
+        c.talent_pow,
+        c.talent_guts,
+        c.talent_wiz,
+        cd.birth_year,
+        cd.birth_month,
+        cd.birth_day,
+        cd.image_color_main,
+        cd.image_color_sub,
+        cd.height,
+        cr_default.speed as base_speed,
+        cr_default.stamina as base_stamina,
+        cr_default.pow as base_pow,
+        cr_default.guts as base_guts,
+        cr_default.wiz as base_wiz,
+        cr_max.speed as max_base_speed,
+        cr_max.stamina as max_base_stamina,
+        cr_max.pow as max_base_pow,
+        cr_max.guts as max_base_guts,
+        cr_max.wiz as max_base_wiz,
+        cr_default.proper_distance_short as apt_distance_short,
+        cr_default.proper_distance_mile as apt_distance_mile,
+        cr_default.proper_distance_middle as apt_distance_middle,
+        cr_default.proper_distance_long as apt_distance_long,
+        cr_default.proper_running_style_nige as apt_style_front_runner,
+        cr_default.proper_running_style_senko as apt_style_pace_chaser,
+        cr_default.proper_running_style_sashi as apt_style_late,
+        cr_default.proper_running_style_oikomi as apt_style_end_closer,
+        cr_default.proper_ground_turf as apt_ground_turf,
+        cr_default.proper_ground_dirt as apt_ground_dirt
+    FROM card_data c
+    JOIN chara_data cd ON c.chara_id = cd.id
+    LEFT JOIN idx.card_rarity_data cr_default ON c.id = cr_default.card_id AND cr_default.rarity = c.default_rarity
+    LEFT JOIN idx.card_rarity_data cr_max ON c.id = cr_max.card_id AND cr_max.rarity = 5
+    WHERE c.default_rarity > 0
+    ORDER BY c.chara_id, c.default_rarity DESC
+""", (
+    'card_id', 'chara_id', 'default_rarity', 'running_style',
+    'talent_speed', 'talent_stamina', 'talent_pow', 'talent_guts', 'talent_wiz',
+    'birth_year', 'birth_month', 'birth_day', 'image_color_main', 'image_color_sub', 'height',
+    'base_speed', 'base_stamina', 'base_pow', 'base_guts', 'base_wiz',
+    'max_base_speed', 'max_base_stamina', 'max_base_pow', 'max_base_guts', 'max_base_wiz',
+    'apt_distance_short', 'apt_distance_mile', 'apt_distance_middle', 'apt_distance_long',
+    'apt_style_front_runner', 'apt_style_pace_chaser', 'apt_style_late', 'apt_style_end_closer',
+    'apt_ground_turf', 'apt_ground_dirt',
+))
+
+# Skills learnable by each playable card (available_skill_set_id = card_id).
+# Joined against card_data instead of an IN-list of card ids.
+register('characters.card_skills', """
+    SELECT
+        a.available_skill_set_id as card_id,
+        a.skill_id,
+        a.need_rank,
+        s.icon_id
+    FROM card_data c
+    JOIN idx.available_skill_set a ON a.available_skill_set_id = c.id
+    LEFT JOIN skill_data s ON s.id = a.skill_id
+    WHERE c.default_rarity > 0
+    ORDER BY a.available_skill_set_id, a.need_rank
+""", ('card_id', 'skill_id', 'need_rank', 'icon_id'))
+
+# Unique skill of each playable card (unlocked at rarity 3)
+register('characters.card_unique_skills', """
+    SELECT
+        cr.card_id,
+        ss.skill_id1 as unique_skill_id,
+        s.icon_id
+    FROM card_data c
+    JOIN idx.card_rarity_data cr ON cr.card_id = c.id AND cr.rarity = 3
+    JOIN idx.skill_set ss ON cr.skill_set = ss.id
+    LEFT JOIN skill_data s ON s.id = ss.skill_id1
+    WHERE c.default_rarity > 0
+      AND ss.skill_id1 > 0
+""", ('card_id', 'unique_skill_id', 'icon_id'))
+
+# Character unique skills with the card that owns them
+register('skills.unique_owners', """
+    SELECT DISTINCT ss.skill_id1, cd.chara_id, cr.card_id
+    FROM idx.card_rarity_data cr
+    JOIN idx.skill_set ss ON cr.skill_set = ss.id
+    JOIN card_data cd ON cr.card_id = cd.id
+    WHERE cr.rarity = 3 AND ss.skill_id1 > 0
+""", ('skill_id1', 'chara_id', 'card_id'))
+
+# Index fields of every obtainable skill (details are hydrated on demand)
+register('skills.index', """
+    SELECT
+        s.id,
+        s.rarity,
+        s.grade_value,
+        s.skill_category,
+        s.icon_id
+    FROM skill_data s
+    WHERE s.rarity > 0
+    ORDER BY s.rarity DESC, s.grade_value DESC
+""", ('id', 'rarity', 'grade_value', 'skill_category', 'icon_id'))
+
+# One skill with both ability blocks and its SP cost
+register('skills.detail', """
+    SELECT
+        s.id,
+        s.condition_1,
+        s.condition_2,
+        s.activate_lot,
+        np.need_skill_point,
+        s.float_ability_time_1,
+        s.float_cooldown_time_1,
+        s.ability_type_1_1,
+        s.ability_type_1_2,
+        s.ability_type_1_3,
+        s.float_ability_value_1_1,
+        s.float_ability_value_1_2,
+        s.float_ability_value_1_3,
+        s.float_ability_time_2,
+        s.float_cooldown_time_2,
+        s.ability_type_2_1,
+        s.ability_type_2_2,
+        s.ability_type_2_3,
+        s.float_ability_value_2_1,
+        s.float_ability_value_2_2,
+        s.float_ability_value_2_3
+    FROM skill_data s
+    LEFT JOIN single_mode_skill_need_point np ON np.id = s.id
+    WHERE s.id = ?
+""", (
+    'id', 'condition_1', 'condition_2', 'activate_lot', 'need_skill_point',
+    'float_ability_time_1', 'float_cooldown_time_1',
+    'ability_type_1_1', 'ability_type_1_2', 'ability_type_1_3',
+    'float_ability_value_1_1', 'float_ability_value_1_2', 'float_ability_value_1_3',
+    'float_ability_time_2', 'float_cooldown_time_2',
+    'ability_type_2_1', 'ability_type_2_2', 'ability_type_2_3',
+    'float_ability_value_2_1', 'float_ability_value_2_2', 'float_ability_value_2_3',
+), sample_params=(200012,))
+
+# Filterable fields of every obtainable skill that the index does not keep
+register('skills.facets', """
+    SELECT
+        s.id,
+        s.condition_1,
+        s.condition_2,
+        s.activate_lot,
+        np.need_skill_point,
+        s.ability_type_1_1,
+        s.ability_type_1_2,
+        s.ability_type_1_3,
+        s.ability_type_2_1,
+        s.ability_type_2_2,
+        s.ability_type_2_3
+    FROM skill_data s
+    LEFT JOIN single_mode_skill_need_point np ON np.id = s.id
+    WHERE s.rarity > 0
+""", (
+    'id', 'condition_1', 'condition_2', 'activate_lot', 'need_skill_point',
+    'ability_type_1_1', 'ability_type_1_2', 'ability_type_1_3',
+    'ability_type_2_1', 'ability_type_2_2', 'ability_type_2_3',
+))
+
+# Full-text skill search over the sidecar FTS5 index, best (lowest bm25) first;
+# names weigh most, then descriptions, then activation conditions
+register('skills.fts', """
+    SELECT
+        rowid AS id,
+        highlight(skill_fts, 0, '**', '**') AS name,
+        snippet(skill_fts, 1, '**', '**', '…', 16) AS description,
+        snippet(skill_fts, 2, '**', '**', '…', 16) AS conditions,
+        bm25(skill_fts, 10.0, 1.0, 0.5) AS score
+    FROM idx.skill_fts
+    WHERE skill_fts MATCH ?
+    ORDER BY score
+    LIMIT ?
+""", ('id', 'name', 'description', 'conditions', 'score'), sample_params=('"stamina"* OR "corner"*', 10))
+
+# One search term against skill names, descriptions and conditions without FTS5
+register('skills.text_like', """
+    SELECT
+        s.id,
+        n.text AS name,
+        d.text AS description,
+        n.text LIKE ?1 AS in_name,
+        coalesce(d.text LIKE ?1, 0) AS in_description,
+        coalesce(s.condition_1 LIKE ?1 OR s.condition_2 LIKE ?1, 0) AS in_conditions
+    FROM skill_data s
+    JOIN idx.text_data n ON n.category = 47 AND n."index" = s.id
+    LEFT JOIN idx.text_data d ON d.category = 48 AND d."index" = s.id
+    WHERE s.rarity > 0
+      AND (n.text LIKE ?1 OR d.text LIKE ?1 OR s.condition_1 LIKE ?1 OR s.condition_2 LIKE ?1)
+""", ('id', 'name', 'description', 'in_name', 'in_description', 'in_conditions'), sample_params=('%stamina%',))
+
+# Support cards
+register('support_cards.all', """
+    SELECT
+        sc.id,
+        sc.chara_id,
+        sc.rarity,
+        sc.command_id,
+        sc.support_card_type,
+        sc.skill_set_id,
+        sc.effect_table_id,
+        sc.unique_effect_id
+    FROM support_card_data sc
+    ORDER BY sc.rarity DESC, sc.command_id, sc.id
+""", (
+    'id', 'chara_id', 'rarity', 'command_id', 'support_card_type',
+    'skill_set_id', 'effect_table_id', 'unique_effect_id',
+))
+
+# Every graded race with its course (the full catalog)
+register('races.all', """
+    SELECT
+        r.id,
+        r.grade,
+        rcs.distance,
+        rcs.ground,
+        rcs.race_track_id as track_id
+    FROM race r
+    LEFT JOIN race_course_set rcs ON r.course_set = rcs.id
+    WHERE r.grade > 0 AND rcs.distance IS NOT NULL
+    ORDER BY r.grade DESC, rcs.distance
+""", ('id', 'grade', 'distance', 'ground', 'track_id'))
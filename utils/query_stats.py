@@ -0,0 +1,159 @@
+"""
+Per-query timing statistics and slow-query log for MasterDBReader.
+"""
+import sys
+import threading
+from functools import lru_cache
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Tuple, Optional
+import logging
+
+logger = logging.getLogger('UmaMusumeBot.QueryStats')
+
+# Default slow-query threshold (overridden from config at startup)
+DEFAULT_SLOW_QUERY_MS = 100.0
+SLOW_LOG_SIZE = 50
+
+# Frames from these files are skipped when resolving a query's call site
+_INTERNAL_FILES = {
+    str(Path(__file__).resolve()),
+    str(Path(__file__).with_name('db_reader.py').resolve()),
+}
+
+def normalize_sql(sql: str) -> str:
+    """Collapse whitespace so the same statement always aggregates together."""
+    return " ".join(sql.split())
+
+@lru_cache(maxsize=None)
+def _is_internal(filename: str) -> bool:
+    """Whether a code filename belongs to the database layer (resolved once per file)."""
+    return filename.startswith('<') or str(Path(filename).resolve()) in _INTERNAL_FILES
+
+def find_call_site() -> str:
+    """
+    Find the first caller outside the database layer.
+
+    Returns:
+        "file.py:line in function" for the code that issued the query
+    """
+    frame = sys._getframe(1)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if not _is_internal(filename):
+            return f"{Path(filename).name}:{frame.f_lineno} in {frame.f_code.co_name}"
+        frame = frame.f_back
+    return "unknown"
+
+@dataclass
+class QueryStat:
+    """Aggregated timing for one statement issued from one call site."""
+    sql: str
+    call_site: str
+    calls: int = 0
+    rows: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    failures: int = 0
+
+    @property
+    def avg_ms(self) -> float:
+        """Average wall time per call in milliseconds."""
+        return self.total_ms / self.calls if self.calls else 0.0
+
+@dataclass
+class SlowQuery:
+    """A single query that exceeded the slow-query threshold."""
+    sql: str
+    call_site: str
+    elapsed_ms: float
+    rows: int
+    plan: List[str] = field(default_factory=list)
+
+class QueryStats:
+    """Thread-safe aggregator for query timings."""
+
+    def __init__(self, slow_threshold_ms: float = DEFAULT_SLOW_QUERY_MS):
+        """
+        Initialize the aggregator.
+
+        Args:
+            slow_threshold_ms: Queries at or above this wall time are logged as slow
+        """
+        self.slow_threshold_ms = slow_threshold_ms
+        self._stats: Dict[Tuple[str, str], QueryStat] = {}
+        self._slow: deque = deque(maxlen=SLOW_LOG_SIZE)
+        self._lock = threading.Lock()
+
+    def is_slow(self, elapsed_ms: float) -> bool:
+        """Check whether a wall time crosses the slow-query threshold."""
+        return elapsed_ms >= self.slow_threshold_ms
+
+    def record(self, sql: str, call_site: str, elapsed_ms: float, rows: int,
+               plan: Optional[List[str]] = None, failed: bool = False):
+        """
+        Record one executed (or failed) query.
+
+        Args:
+            sql: SQL statement
+            call_site: Caller location from find_call_site()
+            elapsed_ms: Wall time spent in sqlite (execute + fetch)
+            rows: Number of rows returned
+            plan: EXPLAIN QUERY PLAN lines (only for slow queries)
+            failed: Whether the query raised or broke its column contract
+        """
+        sql = normalize_sql(sql)
+        with self._lock:
+            stat = self._stats.get((sql, call_site))
+            if stat is None:
+                stat = QueryStat(sql=sql, call_site=call_site)
+                self._stats[(sql, call_site)] = stat
+            stat.calls += 1
+            stat.rows += rows
+            stat.total_ms += elapsed_ms
+            stat.max_ms = max(stat.max_ms, elapsed_ms)
+            if failed:
+                stat.failures += 1
+
+            if plan is not None:
+                self._slow.append(SlowQuery(sql, call_site, elapsed_ms, rows, plan))
+
+        if plan is not None:
+            plan_text = "\n    ".join(plan) or "(no plan)"
+            logger.warning(
+                f"Slow query ({elapsed_ms:.1f} ms, {rows} rows) at {call_site}: {sql}\n    {plan_text}"
+            )
+
+    def top(self, limit: int = 10) -> List[QueryStat]:
+        """Get the statements with the highest total wall time."""
+        with self._lock:
+            stats = list(self._stats.values())
+        stats.sort(key=lambda s: s.total_ms, reverse=True)
+        return stats[:limit]
+
+    def slow_queries(self) -> List[SlowQuery]:
+        """Get the most recent slow queries (newest last)."""
+        with self._lock:
+            return list(self._slow)
+
+    def summary(self) -> Dict[str, float]:
+        """Get totals across all recorded queries."""
+        with self._lock:
+            stats = list(self._stats.values())
+        return {
+            'statements': len(stats),
+            'calls': sum(s.calls for s in stats),
+            'rows': sum(s.rows for s in stats),
+            'failures': sum(s.failures for s in stats),
+            'total_ms': sum(s.total_ms for s in stats),
+        }
+
+    def reset(self):
+        """Clear all recorded statistics."""
+        with self._lock:
+            self._stats.clear()
+            self._slow.clear()
+
+# Process-wide statistics shared by every MasterDBReader
+query_stats = QueryStats()
@@ -0,0 +1,91 @@
+"""
+Column store with a sorted range key and equality posting lists.
+
+Rows are stored column by column in compact arrays, ordered by one numeric
+key (e.g. race distance), so a key range is a slice found with two binary
+searches. Every other column keeps a posting list per value: the sorted
+positions having it. A combined filter bisects the range into each posting
+list, walks only the smallest resulting slice and checks the remaining
+columns by direct array lookup, so its cost is logarithmic plus the size of
+the most selective slice rather than the size of the table.
+"""
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+class RangeIndex:
+    """Immutable column store over integer rows."""
+
+    def __init__(self, rows: Iterable[Tuple[int, int, Sequence[int]]], columns: Sequence[str]):
+        """
+        Build the store.
+
+        Args:
+            rows: (id, key, column values) tuples; ties on the key keep their given order
+            columns: Names of the equality columns, in the order of each row's values
+        """
+        ordered = sorted(rows, key=lambda row: row[1])
+        self.columns = tuple(columns)
+        self.ids = array('q', (row[0] for row in ordered))
+        self.keys = array('q', (row[1] for row in ordered))
+        self._values: Dict[str, array] = {
+            column: array('q', (row[2][i] for row in ordered)) for i, column in enumerate(self.columns)
+        }
+        self._postings: Dict[str, Dict[int, array]] = {}
+        for column, values in self._values.items():
+            postings: Dict[int, List[int]] = {}
+            for position, value in enumerate(values):
+                postings.setdefault(value, []).append(position)
+            self._postings[column] = {value: array('l', positions) for value, positions in postings.items()}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def values(self, column: str) -> List[int]:
+        """Get the distinct values of a column, sorted."""
+        return sorted(self._postings[column])
+
+    def query(self, low: Optional[int] = None, high: Optional[int] = None, **equals: Optional[int]) -> List[int]:
+        """
+        Get the ids of the rows whose key lies within [low, high] and whose
+        columns equal the given values (None means any).
+
+        Args:
+            low: Smallest key (None for no lower bound)
+            high: Largest key (None for no upper bound)
+            **equals: Column name -> required value
+
+        Returns:
+            Ids in key order
+        """
+        lo = 0 if low is None else bisect_left(self.keys, low)
+        hi = len(self.keys) if high is None else bisect_right(self.keys, high)
+        if lo >= hi:
+            return []
+
+        # The part of each posting list inside the key range
+        slices = []
+        for column, value in equals.items():
+            if value is None:
+                continue
+            posting = self._postings[column].get(value)
+            if posting is None:
+                return []
+            start = bisect_left(posting, lo)
+            end = bisect_left(posting, hi, start)
+            if start == end:
+                return []
+            slices.append((end - start, column, value, posting, start, end))
+
+        if not slices:
+            return list(self.ids[lo:hi])
+
+        # Walk the most selective slice, checking the other columns in place
+        slices.sort(key=lambda s: s[0])
+        _, _, _, posting, start, end = slices[0]
+        checks = [(self._values[column], value) for _, column, value, _, _, _ in slices[1:]]
+        ids = self.ids
+        return [
+            ids[position] for position in posting[start:end]
+            if all(values[position] == value for values, value in checks)
+        ]
@@ -0,0 +1,31 @@
+"""Readiness gating for commands that need the shared game data."""
+import discord
+
+WARMING_UP_MESSAGE = "⏳ Game data is still warming up after a restart. Please try again in a few seconds."
+LOAD_FAILED_MESSAGE = "❌ Game data failed to load. Please ask the bot owner to check the database."
+
+async def require_game_data(interaction: discord.Interaction) -> bool:
+    """
+    Check that bot.game_data is ready, answering the interaction if it is not.
+
+    Intended for Cog.interaction_check: returning False stops the command,
+    and the user has already been told why.
+
+    Args:
+        interaction: Incoming slash command interaction
+
+    Returns:
+        bool: True if the command may run
+    """
+    game_data = getattr(interaction.client, 'game_data', None)
+    if game_data is not None and game_data.ready:
+        return True
+
+    if interaction.type == discord.InteractionType.autocomplete:
+        return False  # Autocomplete can only answer with choices
+
+    failed = game_data is not None and game_data.failed
+    message = LOAD_FAILED_MESSAGE if failed else WARMING_UP_MESSAGE
+    if not interaction.response.is_done():
+        await interaction.response.send_message(message, ephemeral=True)
+    return False
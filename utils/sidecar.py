@@ -0,0 +1,239 @@
+"""
+Sidecar index overlay for master.mdb.
+
+master.mdb is an upstream file we must not modify, and it ships without
+indexes for the lookups the managers do all the time. The sidecar is a
+separate SQLite file next to it holding keyed copies of those lookup tables.
+MasterDBReader ATTACHes it as the `idx` schema, so queries can join
+`idx.text_data` etc. instead of scanning the originals.
+"""
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Optional
+import logging
+
+logger = logging.getLogger('UmaMusumeBot.Sidecar')
+
+# Bump when the overlay layout changes so existing sidecars get rebuilt
+SIDECAR_SCHEMA_VERSION = 2
+SIDECAR_SCHEMA = 'idx'
+
+# text_data categories used by the managers
+# 5=card title, 6=character name, 30=race name, 47=skill name, 48=skill description
+TEXT_CATEGORIES = (5, 6, 30, 47, 48)
+
+# One statement list per overlay table. {target} is the schema being built,
+# {source} is the schema holding the original master.mdb tables.
+OVERLAY_STATEMENTS = [
+    # (category, index) -> text, clustered on the lookup key
+    """
+    CREATE TABLE {target}.text_data (
+        category INTEGER NOT NULL,
+        "index" INTEGER NOT NULL,
+        text TEXT,
+        PRIMARY KEY (category, "index")
+    ) WITHOUT ROWID
+    """,
+    """
+    INSERT OR IGNORE INTO {target}.text_data (category, "index", text)
+    SELECT category, "index", text FROM {source}.text_data
+    WHERE category IN ({categories})
+    """,
+    # Card skill lists, clustered by set id in need_rank order
+    """
+    CREATE TABLE {target}.available_skill_set (
+        available_skill_set_id INTEGER NOT NULL,
+        need_rank INTEGER NOT NULL,
+        id INTEGER NOT NULL,
+        skill_id INTEGER NOT NULL,
+        PRIMARY KEY (available_skill_set_id, need_rank, id)
+    ) WITHOUT ROWID
+    """,
+    """
+    INSERT INTO {target}.available_skill_set (available_skill_set_id, need_rank, id, skill_id)
+    SELECT available_skill_set_id, need_rank, id, skill_id FROM {source}.available_skill_set
+    """,
+    # Per-rarity card stats, looked up by (card_id, rarity)
+    """
+    CREATE TABLE {target}.card_rarity_data AS
+    SELECT * FROM {source}.card_rarity_data
+    """,
+    """
+    CREATE INDEX {target}.card_rarity_data_card ON card_rarity_data (card_id, rarity)
+    """,
+    # Skill sets (only the unique skill slot is ever read)
+    """
+    CREATE TABLE {target}.skill_set (
+        id INTEGER PRIMARY KEY,
+        skill_id1 INTEGER
+    )
+    """,
+    """
+    INSERT INTO {target}.skill_set (id, skill_id1)
+    SELECT id, skill_id1 FROM {source}.skill_set
+    """,
+]
+
+# Full-text index over skill names, descriptions and activation conditions
+# (built from the text_data overlay above). Optional: sqlite builds without
+# FTS5 skip it and SkillManager.search_text falls back to LIKE.
+FTS_TABLE = 'skill_fts'
+FTS_STATEMENTS = [
+    """
+    CREATE VIRTUAL TABLE {target}.skill_fts USING fts5(
+        name, description, conditions,
+        tokenize = 'porter unicode61'
+    )
+    """,
+    """
+    INSERT INTO {target}.skill_fts (rowid, name, description, conditions)
+    SELECT
+        s.id,
+        n.text,
+        d.text,
+        trim(coalesce(s.condition_1, '') || ' ' || coalesce(s.condition_2, ''))
+    FROM {source}.skill_data s
+    JOIN {target}.text_data n ON n.category = 47 AND n."index" = s.id
+    LEFT JOIN {target}.text_data d ON d.category = 48 AND d."index" = s.id
+    WHERE s.rarity > 0
+    """,
+]
+
+_build_lock = threading.Lock()
+
+def database_fingerprint(db_path) -> str:
+    """
+    Get a cheap fingerprint of a database file that changes whenever
+    the file is replaced or rewritten.
+
+    Args:
+        db_path: Path to the database file
+
+    Returns:
+        "size:mtime_ns" string
+    """
+    stat = Path(db_path).stat()
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+def sidecar_path_for(db_path) -> Path:
+    """Get the sidecar file path for a database (master.mdb -> master.idx.db)."""
+    db_path = Path(db_path)
+    return db_path.with_name(f"{db_path.stem}.idx.db")
+
+def populate_overlay(conn: sqlite3.Connection, target: str, source: str):
+    """
+    Create and fill the overlay tables.
+
+    Args:
+        conn: Connection that can see both schemas
+        target: Schema to create the overlay tables in
+        source: Schema holding the original master.mdb tables
+    """
+    categories = ",".join(str(c) for c in TEXT_CATEGORIES)
+    for statement in OVERLAY_STATEMENTS:
+        conn.execute(statement.format(target=target, source=source, categories=categories))
+    conn.commit()
+    try:
+        for statement in FTS_STATEMENTS:
+            conn.execute(statement.format(target=target, source=source))
+    except sqlite3.OperationalError as e:
+        # e.g. "no such module: fts5"
+        logger.warning(f"Skipping full-text skill index: {e}")
+        conn.rollback()
+        try:
+            conn.execute(f"DROP TABLE IF EXISTS {target}.{FTS_TABLE}")
+        except sqlite3.OperationalError:
+            pass
+    conn.commit()
+
+def _read_meta(sidecar_path: Path) -> dict:
+    """Read the sidecar's meta table (empty dict if missing or unreadable)."""
+    try:
+        uri = f"{sidecar_path.resolve().as_uri()}?mode=ro"
+        conn = sqlite3.connect(uri, uri=True)
+        try:
+            return dict(conn.execute("SELECT key, value FROM sidecar_meta").fetchall())
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return {}
+
+def is_current(db_path, sidecar_path: Path) -> bool:
+    """Check whether a sidecar was built from the current database file."""
+    if not sidecar_path.exists():
+        return False
+    meta = _read_meta(sidecar_path)
+    return (
+        meta.get('schema_version') == str(SIDECAR_SCHEMA_VERSION)
+        and meta.get('source_fingerprint') == database_fingerprint(db_path)
+    )
+
+def build_sidecar(db_path, sidecar_path: Path):
+    """
+    Build a sidecar file from a database.
+
+    The file is written to a temporary path and moved into place atomically,
+    so readers that still have the old sidecar attached are unaffected.
+
+    Args:
+        db_path: Path to master.mdb
+        sidecar_path: Destination sidecar path
+    """
+    db_path = Path(db_path)
+    tmp_path = sidecar_path.with_name(sidecar_path.name + '.tmp')
+    if tmp_path.exists():
+        tmp_path.unlink()
+
+    fingerprint = database_fingerprint(db_path)
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        conn.execute(
+            "ATTACH DATABASE ? AS src",
+            (f"{db_path.resolve().as_uri()}?mode=ro&immutable=1",)
+        )
+        populate_overlay(conn, 'main', 'src')
+        conn.execute("CREATE TABLE sidecar_meta (key TEXT PRIMARY KEY, value TEXT)")
+        conn.executemany(
+            "INSERT INTO sidecar_meta (key, value) VALUES (?, ?)",
+            [
+                ('schema_version', str(SIDECAR_SCHEMA_VERSION)),
+                ('source_fingerprint', fingerprint),
+            ]
+        )
+        conn.commit()
+        conn.execute("DETACH DATABASE src")
+        conn.execute("ANALYZE")
+        conn.commit()
+    finally:
+        conn.close()
+
+    os.replace(tmp_path, sidecar_path)
+
+def ensure_sidecar(db_path) -> Optional[Path]:
+    """
+    Get an up-to-date sidecar for a database, rebuilding it if master.mdb changed.
+
+    Args:
+        db_path: Path to master.mdb
+
+    Returns:
+        Path to the sidecar, or None if it could not be built
+    """
+    sidecar_path = sidecar_path_for(db_path)
+    with _build_lock:
+        if is_current(db_path, sidecar_path):
+            return sidecar_path
+
+        logger.info(f"Building sidecar index {sidecar_path} ...")
+        try:
+            build_sidecar(db_path, sidecar_path)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Failed to build sidecar index: {e}")
+            return None
+
+        logger.info(f"Sidecar index ready: {sidecar_path}")
+        return sidecar_path
@@ -0,0 +1,130 @@
+"""
+Skill activation condition compiler.
+
+skill_data.condition_1/2 hold expressions such as
+"phase>=2&corner!=0@phase==1&is_finalcorner==1": comparisons joined by
+'&' (and), with '@' separating alternative groups (or). parse_condition()
+compiles one into a tuple of groups of Comparison nodes, once per distinct
+string, so the skill manager can index conditions by variable and answer
+queries like "phase>=2&corner" without scanning the raw text.
+"""
+import re
+from functools import lru_cache
+from typing import NamedTuple, Optional, Set, Tuple, Union
+
+Number = Union[int, float]
+
+# Comparison operators, longest first so '>=' is not read as '>'
+OPERATORS = ('==', '!=', '>=', '<=', '>', '<')
+
+_TERM = re.compile(r'^([A-Za-z_][A-Za-z0-9_]*)(?:(==|!=|>=|<=|>|<)(-?\d+(?:\.\d+)?))?$')
+_INFINITY = float('inf')
+
+class ConditionSyntaxError(ValueError):
+    """Raised when a condition or condition query cannot be parsed."""
+
+class Comparison(NamedTuple):
+    """One 'variable op value' term; op and value are None for a bare variable in a query."""
+    variable: str
+    op: Optional[str] = None
+    value: Optional[Number] = None
+
+    def __str__(self) -> str:
+        return self.variable if self.op is None else f"{self.variable}{self.op}{self.value}"
+
+    def bounds(self) -> Optional[Tuple[Number, Number]]:
+        """Get the [low, high] values the comparison allows (None for '!=' or a bare variable)."""
+        value = self.value
+        if self.op == '==':
+            return value, value
+        if self.op == '>=':
+            return value, _INFINITY
+        if self.op == '<=':
+            return -_INFINITY, value
+        # Condition values are integers, so strict bounds move by one
+        step = 1 if isinstance(value, int) else 0
+        if self.op == '>':
+            return value + step, _INFINITY
+        if self.op == '<':
+            return -_INFINITY, value - step
+        return None
+
+    def implies(self, query: 'Comparison') -> bool:
+        """Whether every value this comparison allows also satisfies a query term on the same variable."""
+        if self.variable != query.variable:
+            return False
+        if query.op is None:
+            return True
+        if query.op == '!=':
+            if self.op == '!=':
+                return self.value == query.value
+            low, high = self.bounds()
+            return not low <= query.value <= high
+        wanted = query.bounds()
+        allowed = self.bounds()
+        return allowed is not None and wanted[0] <= allowed[0] and allowed[1] <= wanted[1]
+
+# A compiled condition: alternative groups ('@'), each a conjunction ('&') of comparisons
+Group = Tuple[Comparison, ...]
+Condition = Tuple[Group, ...]
+
+def _parse_term(text: str, bare: bool) -> Comparison:
+    """Parse one term, allowing a bare variable only in queries."""
+    match = _TERM.match(text.strip())
+    if match is None or (match.group(2) is None and not bare):
+        raise ConditionSyntaxError(f"Invalid condition term: {text!r}")
+    variable, op, value = match.groups()
+    if op is None:
+        return Comparison(variable)
+    return Comparison(variable, op, float(value) if '.' in value else int(value))
+
+def _parse(text: str, bare: bool) -> Condition:
+    """Split an expression into '@' groups of '&' terms."""
+    text = (text or "").strip()
+    if not text:
+        return ()
+    return tuple(
+        tuple(_parse_term(term, bare) for term in group.split('&'))
+        for group in text.split('@')
+    )
+
+@lru_cache(maxsize=None)
+def parse_condition(text: str) -> Condition:
+    """
+    Compile a skill condition (cached: many skills share the same strings).
+
+    Args:
+        text: Raw condition string (empty for none)
+
+    Returns:
+        Groups of comparisons; () for an empty condition
+
+    Raises:
+        ConditionSyntaxError: If a term is not 'variable op number'
+    """
+    return _parse(text, bare=False)
+
+def parse_query(text: str) -> Condition:
+    """
+    Compile a condition query: the condition syntax, where a bare variable
+    ("corner") matches any comparison on it.
+
+    Raises:
+        ConditionSyntaxError: If a term cannot be parsed
+    """
+    return _parse(text, bare=True)
+
+def variables(condition: Condition) -> Set[str]:
+    """Get the variables a compiled condition mentions."""
+    return {term.variable for group in condition for term in group}
+
+def satisfies(condition: Condition, query: Group) -> bool:
+    """Whether one group of the condition implies every term of a query group."""
+    return any(
+        all(any(term.implies(wanted) for term in group) for wanted in query)
+        for group in condition
+    )
+
+def format_condition(condition: Condition) -> str:
+    """Render a compiled condition with one alternative group per line."""
+    return "\nor\n".join(" & ".join(map(str, group)) for group in condition)